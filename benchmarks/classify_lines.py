@@ -0,0 +1,119 @@
+"""Micro-benchmark for the terminal output line classifier.
+
+Replays a Nuitka log through the previous per-line code path (four
+percentage regexes, a chain of phase substring checks and the separate
+color checks) and through compyler.classify_line, then reports the cost
+per line. The bundled log is shaped after a standalone build of a small
+CLI application; pass --log to replay a log captured from a real build.
+
+    python benchmarks/classify_lines.py
+    python benchmarks/classify_lines.py --log build.log --max-ns 2000
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import compyler
+
+DEFAULT_LOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "nuitka_standalone.log")
+
+LEGACY_PATTERNS = [
+    re.compile(r"(\d+)% completed"),
+    re.compile(r"Progress: (\d+)%"),
+    re.compile(r"Overall completion: (\d+)%"),
+    re.compile(r"Nuitka:INFO: (\d+)% done")
+]
+
+
+def legacy_classify_line(line):
+    """The checks parse_progress_info and append_to_terminal ran before the classifier"""
+    text = line
+    line = line.strip()
+    percentage = None
+    phase = None
+
+    for pattern in LEGACY_PATTERNS:
+        match = pattern.search(line)
+        if match:
+            value = int(match.group(1))
+            if 0 <= value <= 100:
+                percentage = value
+                break
+
+    if percentage is None:
+        if "Recursing" in line or "Finding modules" in line:
+            phase = "dependency_scan"
+        elif "Creating module" in line or "Creating code" in line:
+            phase = "c_generation"
+        elif "C Compile" in line or "Compiling" in line:
+            phase = "c_compilation"
+        elif "Linking" in line or "Creating executable" in line:
+            phase = "linking"
+        elif "Packaging" in line or "copying" in line:
+            phase = "packaging"
+
+    if text.startswith("$"):
+        tag = "command"
+    elif "Error" in text or "ERROR" in text or "error:" in text:
+        tag = "error"
+    elif "Success" in text or "Completed" in text or "✓" in text:
+        tag = "success"
+    else:
+        tag = None
+
+    return percentage, phase, tag
+
+
+def time_per_line(classify, lines, repeat):
+    """Return the best cost per line in nanoseconds over several runs"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            classify(line)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(lines) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the terminal output line classifier")
+    parser.add_argument("--log", default=DEFAULT_LOG, help="Nuitka log to replay")
+    parser.add_argument("--lines", type=int, default=200000, help="Number of lines to classify per run")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per implementation, the best one counts")
+    parser.add_argument("--max-ns", type=float, help="Fail if classify_line costs more than this per line")
+    args = parser.parse_args()
+
+    with open(args.log, "r", encoding="utf-8", errors="replace") as f:
+        recorded = f.readlines()
+    lines = (recorded * (args.lines // len(recorded) + 1))[:args.lines]
+
+    # Both code paths must agree before their speed means anything
+    mismatches = [line for line in recorded if legacy_classify_line(line) != compyler.classify_line(line)]
+    for line in mismatches[:10]:
+        print(f"mismatch: {line.rstrip()!r}")
+        print(f"  legacy:   {legacy_classify_line(line)}")
+        print(f"  combined: {compyler.classify_line(line)}")
+
+    legacy_ns = time_per_line(legacy_classify_line, lines, args.repeat)
+    current_ns = time_per_line(compyler.classify_line, lines, args.repeat)
+
+    print(f"log: {args.log} ({len(recorded)} lines, replayed as {len(lines)})")
+    print(f"legacy checks:  {legacy_ns:8.0f} ns/line")
+    print(f"classify_line:  {current_ns:8.0f} ns/line  ({legacy_ns / current_ns:.1f}x faster)")
+
+    if mismatches:
+        print(f"FAIL: {len(mismatches)} lines classified differently")
+        return 1
+    if args.max_ns is not None and current_ns > args.max_ns:
+        print(f"FAIL: classify_line is above the {args.max_ns:.0f} ns/line budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
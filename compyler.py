@@ -1,5 +1,3 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
 import os
 import subprocess
 import threading
@@ -7,9 +5,4977 @@ import sys
 import time
 import re
 import random
-from tkinter.filedialog import askopenfilename, askdirectory
 import queue
-import webbrowser
+import argparse
+import ast
+import hashlib
+import json
+import shutil
+import importlib.util
+import importlib.machinery
+import sysconfig
+import itertools
+import collections
+import tempfile
+import signal
+import socket
+import socketserver
+import base64
+import zlib
+import hmac
+import secrets
+import shlex
+import asyncio
+import codecs
+import select
+import struct
+from array import array
+
+# Optional, used to measure the Nuitka process tree where /proc is not available
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Tkinter is only imported when the GUI is started, see load_tkinter()
+tk = ttk = tkfont = messagebox = scrolledtext = webbrowser = None
+askopenfilename = askopenfilenames = askdirectory = None
+
+# Per-user directory for caches and other persistent state
+APP_DATA_DIR = os.path.join(os.path.expanduser("~"), ".compyler")
+
+# Options that don't change the produced artifacts and are left out of cache keys
+NON_OUTPUT_OPTIONS = ("--output-dir=", "--jobs=", "--disable-ccache")
+
+# Default size limit of the C compiler cache, in ccache's size notation
+DEFAULT_CCACHE_SIZE = "5G"
+
+# Lines kept in the terminal widget, older output is only in the log file
+TERMINAL_MAX_LINES = 5000
+
+# Output queue draining: poll interval when idle and when behind (ms), time budget per tick (s),
+# and the most lines classified and rendered per tick, the rest waits for the next one
+OUTPUT_POLL_INTERVAL = 100
+OUTPUT_BACKLOG_INTERVAL = 15
+OUTPUT_FRAME_BUDGET = 0.02
+OUTPUT_FRAME_LINES = 2000
+
+# Regex patterns for progress tracking
+PERCENTAGE_PATTERNS = [
+    re.compile(r"(\d+)% completed"),
+    re.compile(r"Progress: (\d+)%"),
+    re.compile(r"Overall completion: (\d+)%"),
+    re.compile(r"Nuitka:INFO: (\d+)% done")
+]
+
+# Output markers for each compilation phase, checked in order
+PHASE_MARKERS = [
+    ("dependency_scan", ("Recursing", "Finding modules")),
+    ("c_generation", ("Creating module", "Creating code")),
+    ("c_compilation", ("C Compile", "Compiling")),
+    ("linking", ("Linking", "Creating executable")),
+    ("packaging", ("Packaging", "copying"))
+]
+
+# Terminal color tags, checked in order after the '$' command prefix
+TAG_MARKERS = [
+    ("error", ("Error", "ERROR", "error:")),
+    ("success", ("Success", "Completed", "✓"))
+]
+
+# Single-pass line classifier tables built from the definitions above
+PROGRESS_PATTERN = re.compile("|".join(f"(?:{pattern.pattern})" for pattern in PERCENTAGE_PATTERNS))
+PHASE_MARKER_TABLE = tuple((marker, phase) for phase, markers in PHASE_MARKERS for marker in markers)
+TAG_MARKER_TABLE = tuple((marker, tag) for tag, markers in TAG_MARKERS for marker in markers)
+
+PHASE_LABELS = {
+    "dependency_cache": "Precompiling Dependencies",
+    "dependency_scan": "Analyzing Dependencies",
+    "c_generation": "Generating C Code",
+    "c_compilation": "Compiling C Code",
+    "linking": "Linking",
+    "packaging": "Packaging"
+}
+
+# Minimum overall progress once a phase has been reached
+PHASE_MIN_PROGRESS = {
+    "dependency_cache": 2,
+    "dependency_scan": 5,
+    "c_generation": 15,
+    "c_compilation": 30,
+    "linking": 70,
+    "packaging": 85
+}
+
+# Phase names for reports, worded so they don't read as phase markers themselves
+PHASE_SHORT_NAMES = {
+    "initialize": "startup",
+    "dependency_cache": "dependency precompile",
+    "dependency_scan": "dependency scan",
+    "c_generation": "C generation",
+    "c_compilation": "C compilation",
+    "linking": "linking",
+    "packaging": "packaging"
+}
+
+# Order of the build phases, "initialize" is the time before the first phase marker
+PHASE_ORDER = ("initialize",) + tuple(PHASE_LABELS)
+
+# Options that change how long a build takes in kind, not only in degree
+BUILD_PROFILE_OPTIONS = ("--standalone", "--onefile", "--module", "--lto", "--lto=yes")
+
+HISTORY_MAX_RECORDS = 20
+
+# Post-build benchmark: program starts per build, how long one may run, and what counts as a regression
+BENCHMARK_RUNS = 5
+BENCHMARK_TIMEOUT = 10
+BENCHMARK_TOP_ENTRIES = 8
+BENCHMARK_SIZE_TOLERANCE = 0.05
+BENCHMARK_STARTUP_TOLERANCE = 0.15
+BENCHMARK_STARTUP_MIN_DELTA = 0.01
+
+# Cached onefile extraction: each build unpacks once into a directory of the user cache named after it,
+# the token is replaced by Compyler, the other fields by the onefile bootstrap when the program starts
+ONEFILE_CACHE_NAME = "compyler-onefile"
+ONEFILE_BUILD_TOKEN = "{COMPYLER_BUILD}"
+ONEFILE_CACHE_SPEC = "{CACHE_DIR}/" + ONEFILE_CACHE_NAME + "/{PROGRAM_BASE}/" + ONEFILE_BUILD_TOKEN
+ONEFILE_CACHE_KEEP = 2
+
+# Explore mode: builds of every combination of option axes, the named axes are shortcuts
+EXPLORE_DIR = os.path.join(APP_DATA_DIR, "explore")
+EXPLORE_AXES = {
+    "lto": ["--lto=no", "--lto=yes"],
+    "mode": ["--standalone", "--onefile"],
+    "jobs": None,
+    "onefile": None
+}
+EXPLORE_MODE_OPTIONS = ("--standalone", "--onefile", "--module")
+EXPLORE_MAX_COMBINATIONS = 32
+
+# Exit status of a command line build stopped by --timeout, the one timeout(1) uses
+CLI_EXIT_TIMEOUT = 124
+
+# Longest run of a user workload, for the explore mode and the training of profile guided builds
+WORKLOAD_TIMEOUT = 300
+
+# Profile guided builds keep their stages and the profile data per script, GCC flags of each stage
+PGO_DIR = os.path.join(APP_DATA_DIR, "pgo")
+PGO_MARKER = "profile.json"
+PGO_GENERATE_FLAGS = "-fprofile-generate={profile} -fprofile-update=prefer-atomic"
+PGO_USE_FLAGS = "-fprofile-use={profile} -fprofile-correction -Wno-missing-profile"
+
+# Options that change the code of compiled dependency modules, part of their cache keys
+DEPENDENCY_FLAG_PREFIXES = ("--lto", "--python-flag=", "--clang", "--mingw64", "--msvc=", "--debug",
+                            "--static-libpython=")
+
+# Seconds between samples of the memory and CPU use of a running build
+PROFILE_SAMPLE_INTERVAL = 0.25
+
+# Assumed memory of one C compile job until a build of the project has been measured
+DEFAULT_JOB_MEMORY = 768 * 1024 ** 2
+LTO_JOB_MEMORY = 1536 * 1024 ** 2
+
+# Runs of a build again with half the jobs after a compile was stopped because memory ran out
+MEMORY_RETRIES = 2
+
+# Memory kept free for Nuitka itself and the rest of the system when picking jobs
+JOBS_MEMORY_RESERVE = 1024 ** 3
+
+# Compiler and linker processes that can be held back or stopped while memory is short
+COMPILER_PROCESS_NAMES = ("cc1", "cc1plus", "cc1obj", "lto1", "clang", "clang++", "ld", "ld.gold", "ld.lld",
+                          "ld.bfd", "cl.exe", "link.exe")
+
+# Process tree inspection works with /proc, or anywhere with psutil
+PROCESS_TREE_SUPPORTED = os.path.isdir("/proc/self") or psutil is not None
+
+# Builds run in their own process group so cancelling reaches the compilers and linkers too
+PROCESS_GROUP_OPTIONS = ({"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP} if os.name == "nt"
+                         else {"start_new_session": True})
+
+# Marker left in the Nuitka build directory by a cancelled build
+PARTIAL_BUILD_MARKER = ".compyler-partial.json"
+
+# Watch mode waits this long for a burst of saves to settle, and polls where inotify is missing
+WATCH_DEBOUNCE = 0.5
+WATCH_POLL_INTERVAL = 1.0
+WATCH_SUFFIXES = (".py", ".pyw")
+
+# Speculative builds run in a staging directory per script, at the lowest priority
+SPECULATIVE_DIR = os.path.join(APP_DATA_DIR, "speculative")
+SPECULATIVE_NICENESS = 19
+
+# Child process output is read in chunks of this size and delivered as a batch of lines
+SUPERVISOR_CHUNK_SIZE = 64 * 1024
+
+# Seconds between terminate and kill when a supervised process is stopped
+SUPERVISOR_KILL_GRACE = 3
+
+# Warm worker pool for terminal commands and toolchain probes
+WORKER_POOL_SIZE = 2
+WORKER_IDLE_TIMEOUT = 300
+WORKERS_SUPPORTED = os.name != "nt"
+
+# Python worker: forks a child for every request so each one starts from the warm interpreter
+PYTHON_WORKER_SOURCE = r"""
+import importlib, json, os, runpy, sys, traceback
+preloaded = []
+for name in sys.argv[1:]:
+    try:
+        preloaded.append(importlib.import_module(name).__file__)
+    except Exception:
+        pass
+sys.stdout.write(json.dumps({"preloaded": [path for path in preloaded if path]}) + "\n")
+sys.stdout.flush()
+def run(args):
+    if args == ["--version"]:
+        print("Python " + sys.version.split()[0])
+    elif args[:1] == ["-m"]:
+        sys.argv = [args[1]] + args[2:]
+        runpy.run_module(args[1], run_name="__main__", alter_sys=True)
+    elif args[:1] == ["-c"]:
+        sys.argv = ["-c"] + args[2:]
+        exec(args[1], {"__name__": "__main__"})
+    else:
+        sys.argv = list(args)
+        runpy.run_path(args[0], run_name="__main__")
+for line in sys.stdin:
+    request = json.loads(line)
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.dup2(write_fd, 1)
+        os.dup2(write_fd, 2)
+        os.dup2(os.open(os.devnull, os.O_RDONLY), 0)
+        code = 0
+        try:
+            run(request["args"])
+        except SystemExit as e:
+            if isinstance(e.code, int) or e.code is None:
+                code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as f:
+        output = f.read()
+    _, status = os.waitpid(pid, 0)
+    returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+    reply = {"id": request["id"], "returncode": returncode, "output": output.decode("utf-8", "replace")}
+    sys.stdout.write(json.dumps(reply) + "\n")
+    sys.stdout.flush()
+"""
+
+# Build farm: the compiler wrapper lives in a fixed place so ccache sees the same compiler every build
+FARM_WRAPPER_DIR = os.path.join(APP_DATA_DIR, "farm", "bin")
+FARM_DEFAULT_PORT = 7700
+FARM_MAX_MESSAGE = 512 * 1024 ** 2
+FARM_COMPILE_TIMEOUT = 600
+FARM_SOURCE_LANGUAGES = {".c": "c", ".cc": "c++", ".cpp": "c++", ".cxx": "c++"}
+
+# Options that only matter to the preprocessor, which always runs on this machine
+FARM_PREPROCESSOR_OPTIONS = ("-I", "-D", "-U", "-include", "-imacros", "-isystem", "-iquote", "-idirafter")
+
+# Options a worker accepts for compiling a preprocessed unit, anything else is compiled locally
+FARM_REMOTE_OPTION = re.compile(
+    r"-(O\w*|g\w*|w|W(?![alp],)[\w=+.,-]*|std=[\w+]+|m[\w=+.,-]+|"
+    r"f(?!plugin|profile|dump|stack-usage|record)[\w=+.,-]+|pipe|pthread|ansi|pedantic(-errors)?)$"
+)
+
+
+def load_tkinter():
+    """Import Tkinter and the other GUI-only modules on demand"""
+    global tk, ttk, tkfont, messagebox, scrolledtext, webbrowser
+    global askopenfilename, askopenfilenames, askdirectory
+
+    import tkinter as tk
+    from tkinter import ttk, messagebox, scrolledtext
+    import tkinter.font as tkfont
+    from tkinter.filedialog import askopenfilename, askopenfilenames, askdirectory
+    import webbrowser
+
+
+def build_nuitka_options(settings):
+    """Turn a settings dictionary, as produced by the option tabs, into Nuitka arguments"""
+    options = []
+
+    # Mode options
+    if settings.get("standalone"):
+        options.append("--standalone")
+
+    if settings.get("onefile"):
+        options.append("--onefile")
+        # Unpacked on the first launch of a build instead of on every launch
+        if settings.get("onefile_cache"):
+            options.append(f"--onefile-tempdir-spec={ONEFILE_CACHE_SPEC}")
+        if settings.get("onefile_no_compression"):
+            options.append("--onefile-no-compression")
+
+    if settings.get("module"):
+        options.append("--module")
+
+    if settings.get("follow_imports"):
+        options.append("--follow-imports")
+
+    if settings.get("no_follow_imports"):
+        options.append("--no-follow-imports")
+
+    # Optimization options
+    if settings.get("lto"):
+        options.append("--lto")
+
+    # With "auto" the job picks the count itself when it starts
+    if settings.get("jobs") and settings["jobs"] != "auto":
+        options.append(f"--jobs={int(settings['jobs'])}")
+
+    if settings.get("compiler_cache") is False:
+        options.append("--disable-ccache")
+
+    # GUI options
+    if settings.get("disable_console"):
+        options.append("--windows-disable-console")
+
+    if settings.get("enable_tk"):
+        options.append("--enable-plugin=tk-inter")
+
+    if settings.get("icon_path"):
+        options.append(f"--windows-icon={settings['icon_path']}")
+
+    # Custom options
+    options.extend(settings.get("custom_options", []))
+
+    # Always add output directory
+    options.append(f"--output-dir={settings.get('output_dir') or os.path.expanduser('~')}")
+
+    return options
+
+
+def build_nuitka_env(settings, ccache_binary=None):
+    """Environment overrides for the Nuitka process, as produced by the option tabs"""
+    env = {}
+    if not settings.get("compiler_cache") or not ccache_binary:
+        return env
+
+    cache_dir = settings.get("ccache_dir")
+    max_size = settings.get("ccache_max_size") or DEFAULT_CCACHE_SIZE
+
+    if os.path.basename(ccache_binary).lower().startswith("clcache"):
+        env["NUITKA_CLCACHE_BINARY"] = ccache_binary
+        if cache_dir:
+            env["CLCACHE_DIR"] = cache_dir
+        size = parse_size(max_size)
+        if size:
+            env["CLCACHE_SIZE"] = str(size)
+    else:
+        env["NUITKA_CCACHE_BINARY"] = ccache_binary
+        if cache_dir:
+            env["CCACHE_DIR"] = cache_dir
+        env["CCACHE_MAXSIZE"] = max_size
+
+    return env
+
+
+def find_compiler_cache():
+    """Return the path of ccache, or clcache on Windows, None if neither is installed"""
+    if sys.platform == "win32":
+        return shutil.which("clcache") or shutil.which("ccache")
+    return shutil.which("ccache")
+
+
+def parse_size(text):
+    """Parse sizes like '5G', '500M' or '1.5 GB' into bytes, None if invalid"""
+    match = re.match(r"^\s*([\d.]+)\s*([KMGT]?)i?B?\s*$", str(text), re.IGNORECASE)
+    if not match:
+        return None
+    try:
+        value = float(match.group(1))
+    except ValueError:
+        return None
+    return int(value * 1024 ** "BKMGT".index(match.group(2).upper() or "B"))
+
+
+def format_size(num_bytes):
+    """Format a size in bytes to a readable string"""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            break
+        size /= 1024
+    return f"{int(size)} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+
+
+def format_duration(seconds):
+    """Format a duration in seconds to a readable string"""
+    if seconds < 10:
+        return f"{seconds:.1f}s"
+    elif seconds < 60:
+        return f"{int(seconds)}s"
+    elif seconds < 3600:
+        return f"{int(seconds // 60)}m {int(seconds % 60)}s"
+    return f"{int(seconds // 3600)}h {int((seconds % 3600) // 60)}m"
+
+
+def get_path_size(path):
+    """Return the total size of a file or directory tree in bytes"""
+    if os.path.isfile(path) or os.path.islink(path):
+        return os.lstat(path).st_size
+
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def evict_page_cache(path):
+    """Ask the OS to drop a file or directory tree from the page cache, returns False where it can't"""
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    if os.path.isdir(path):
+        paths = [os.path.join(dirpath, name) for dirpath, _, names in os.walk(path) for name in names]
+    else:
+        paths = [path]
+    for name in paths:
+        try:
+            fd = os.open(name, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+    return True
+
+
+def find_build_artifact(output_dir, script_path, options):
+    """Return the program or module a build produced and the file or folder holding all of it, or (None, None)"""
+    output_dir = os.path.abspath(output_dir)
+    stem = os.path.splitext(os.path.basename(script_path))[0]
+    if "--module" in options:
+        for suffix in importlib.machinery.EXTENSION_SUFFIXES:
+            path = os.path.join(output_dir, stem + suffix)
+            if os.path.isfile(path):
+                return path, path
+        return None, None
+
+    names = [stem + ".exe", stem + ".bin", stem]
+    for option in options:
+        if option.startswith("--output-filename="):
+            names.insert(0, option.split("=", 1)[1])
+    folder = output_dir
+    if "--standalone" in options and "--onefile" not in options:
+        folder = os.path.join(output_dir, stem + ".dist")
+    for name in names:
+        path = os.path.join(folder, name)
+        if os.path.isfile(path):
+            return path, folder if folder != output_dir else path
+    return None, None
+
+
+def remove_path(path):
+    """Remove a file, symlink or directory tree if it exists"""
+    if os.path.islink(path) or os.path.isfile(path):
+        os.remove(path)
+    elif os.path.isdir(path):
+        shutil.rmtree(path)
+
+
+def hash_file(path):
+    """Return the sha256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def sync_tree(source, destination):
+    """Mirror a file or directory, copying only files whose size or mtime differ, returns the files copied"""
+    if not os.path.isdir(source) or os.path.islink(source):
+        if os.path.isdir(destination) and not os.path.islink(destination):
+            remove_path(destination)
+        try:
+            source_stat, destination_stat = os.lstat(source), os.lstat(destination)
+            same = (source_stat.st_size == destination_stat.st_size and
+                    source_stat.st_mtime_ns == destination_stat.st_mtime_ns)
+        except OSError:
+            same = False
+        if same:
+            return 0
+        shutil.copy2(source, destination, follow_symlinks=False)
+        return 1
+
+    if os.path.exists(destination) and not os.path.isdir(destination):
+        remove_path(destination)
+    os.makedirs(destination, exist_ok=True)
+
+    copied = 0
+    names = set(os.listdir(source))
+    for name in os.listdir(destination):
+        if name not in names:
+            remove_path(os.path.join(destination, name))
+    for name in names:
+        copied += sync_tree(os.path.join(source, name), os.path.join(destination, name))
+    return copied
+
+
+ProcessInfo = collections.namedtuple("ProcessInfo", "pid name rss cpu started")
+
+
+def list_process_tree(root_pid):
+    """Return a ProcessInfo for a process and each of its descendants, empty once the root is gone"""
+    if os.path.isdir("/proc/self"):
+        return _list_process_tree_proc(root_pid)
+    if psutil is not None:
+        return _list_process_tree_psutil(root_pid)
+    return []
+
+
+def _list_process_tree_proc(root_pid):
+    clock_ticks = os.sysconf("SC_CLK_TCK")
+    page_size = os.sysconf("SC_PAGE_SIZE")
+
+    stats = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as f:
+                data = f.read().decode("ascii", "replace")
+        except OSError:
+            continue
+        # The command name may contain spaces, the fields start after the last ")"
+        name = data[data.find("(") + 1:data.rfind(")")]
+        stats[int(entry)] = (name, data[data.rfind(")") + 2:].split())
+
+    if root_pid not in stats:
+        return []
+
+    children = {}
+    for pid, (_, fields) in stats.items():
+        children.setdefault(int(fields[1]), []).append(pid)
+
+    processes = []
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        name, fields = stats[pid]
+        # Own utime + stime plus the cutime + cstime of children already waited for
+        cpu = sum(int(value) for value in fields[11:15]) / clock_ticks
+        processes.append(ProcessInfo(pid, name, int(fields[21]) * page_size, cpu, int(fields[19]) / clock_ticks))
+        pending.extend(children.get(pid, ()))
+    return processes
+
+
+def _list_process_tree_psutil(root_pid):
+    try:
+        root = psutil.Process(root_pid)
+        tree = [root] + root.children(recursive=True)
+    except psutil.Error:
+        return []
+
+    processes = []
+    for process in tree:
+        try:
+            times = process.cpu_times()
+            cpu = times.user + times.system + getattr(times, "children_user", 0) + getattr(times, "children_system", 0)
+            processes.append(ProcessInfo(process.pid, process.name(), process.memory_info().rss, cpu,
+                                         process.create_time()))
+        except psutil.Error:
+            continue
+    return processes
+
+
+def process_command_line(pid):
+    """Return the arguments of a process and its working directory, empty when it can't be read"""
+    if os.path.isdir("/proc/self"):
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                args = f.read().decode("utf-8", "replace").split("\0")[:-1]
+            return args, os.readlink(f"/proc/{pid}/cwd")
+        except OSError:
+            return [], ""
+    if psutil is not None:
+        try:
+            process = psutil.Process(pid)
+            return process.cmdline(), process.cwd()
+        except psutil.Error:
+            return [], ""
+    return [], ""
+
+
+def in_flight_outputs(root_pid):
+    """Return the files the compilers and linkers of a process tree are writing right now"""
+    outputs = set()
+    for info in list_process_tree(root_pid):
+        args, cwd = process_command_line(info.pid)
+        for index, arg in enumerate(args[1:], 1):
+            if arg == "-o" and index + 1 < len(args):
+                path = args[index + 1]
+            elif arg.startswith(("/Fo", "-Fo")) and len(arg) > 3:
+                # MSVC names the object file in the same argument
+                path = arg[3:]
+            else:
+                continue
+            outputs.add(os.path.normpath(os.path.join(cwd, path)))
+    return outputs
+
+
+def get_memory_info():
+    """Return (total, available) physical memory in bytes, (None, None) when it can't be read"""
+    try:
+        with open("/proc/meminfo", "r", encoding="ascii") as f:
+            values = {}
+            for line in f:
+                name, _, rest = line.partition(":")
+                values[name] = int(rest.split()[0]) * 1024
+        return values["MemTotal"], values.get("MemAvailable", values.get("MemFree"))
+    except (OSError, ValueError, KeyError, IndexError):
+        pass
+
+    if psutil is not None:
+        memory = psutil.virtual_memory()
+        return memory.total, memory.available
+
+    if sys.platform == "win32":
+        import ctypes
+        
+        class MemoryStatus(ctypes.Structure):
+            _fields_ = [("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                        ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                        ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                        ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                        ("ullAvailExtendedVirtual", ctypes.c_ulonglong)]
+        
+        status = MemoryStatus()
+        status.dwLength = ctypes.sizeof(MemoryStatus)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullTotalPhys, status.ullAvailPhys
+    return None, None
+
+
+def choose_jobs(job_memory=None, lto=False, cpus=None, memory=None):
+    """Pick the number of parallel C compile jobs from cores and free memory, returns (jobs, reason)"""
+    cpus = cpus or os.cpu_count() or 1
+    _, available = memory or get_memory_info()
+    if available is None:
+        return cpus, f"{cpus} cores, free memory unknown"
+
+    per_job = job_memory or (LTO_JOB_MEMORY if lto else DEFAULT_JOB_MEMORY)
+    by_memory = max(1, int((available - JOBS_MEMORY_RESERVE) // per_job))
+    jobs = max(1, min(cpus, by_memory))
+    source = "measured" if job_memory else "assumed"
+    return jobs, (f"{cpus} cores, {format_size(available)} available, "
+                  f"{format_size(per_job)} per job {source}")
+
+
+def classify_line(line):
+    """Return the (percentage, phase, tag) of an output line in a single pass, each may be None"""
+    percentage = None
+    phase = None
+
+    # Every percentage pattern contains '%', skip the regex for all other lines
+    if "%" in line:
+        match = PROGRESS_PATTERN.search(line)
+        if match:
+            value = int(match.group(match.lastindex))
+            if value <= 100:
+                percentage = value
+
+    if percentage is None:
+        for marker, marker_phase in PHASE_MARKER_TABLE:
+            if marker in line:
+                phase = marker_phase
+                break
+
+    tag = None
+    if line.startswith("$"):
+        tag = "command"
+    else:
+        for marker, marker_tag in TAG_MARKER_TABLE:
+            if marker in line:
+                tag = marker_tag
+                break
+
+    return percentage, phase, tag
+
+
+def detect_progress(line):
+    """Return the (percentage, phase) reported by an output line, either may be None"""
+    return classify_line(line)[:2]
+
+
+def terminal_tag(text):
+    """Return the terminal color tag for a piece of output, or None"""
+    return classify_line(text)[2]
+
+
+def get_nuitka_version(pool=None):
+    """Return the full 'nuitka --version' output, or an empty string"""
+    try:
+        # A warm Python worker answers without starting an interpreter
+        if pool is not None:
+            returncode, output = pool.run_python(["-m", "nuitka", "--version"], timeout=5)
+            return output.strip() if returncode == 0 else ""
+        result = subprocess.run(
+            ["python", "-m", "nuitka", "--version"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        return result.stdout.strip() if result.returncode == 0 else ""
+    except Exception:
+        return ""
+
+
+def parse_imports(path, package=""):
+    """Return the modules a source file imports and the names 'from x import y' may bring in as submodules"""
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    modules = []
+    candidates = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                parts = package.split(".") if package else []
+                parts = parts[:len(parts) - node.level + 1] if node.level > 1 else parts
+                module = ".".join(p for p in parts + [node.module or ""] if p)
+            else:
+                module = node.module or ""
+            if module:
+                modules.append(module)
+            candidates.extend(".".join(p for p in (module, alias.name) if p)
+                              for alias in node.names if alias.name != "*")
+    return modules, candidates
+
+
+def find_local_imports(script_path):
+    """Return the script plus every local module it imports, transitively"""
+    base_dir = os.path.dirname(os.path.abspath(script_path))
+    found = []
+    external = set()
+    pending = [os.path.abspath(script_path)]
+
+    while pending:
+        path = pending.pop()
+        if path in found:
+            continue
+        found.append(path)
+        
+        # Relative imports resolve against the folder of the importing file
+        rel_dir = os.path.relpath(os.path.dirname(path), base_dir)
+        package = "" if rel_dir == os.curdir else rel_dir.replace(os.sep, ".")
+        try:
+            modules, candidates = parse_imports(path, package)
+        except (OSError, SyntaxError, ValueError):
+            continue
+        
+        for name in modules + candidates:
+            candidate = os.path.join(base_dir, *name.split("."))
+            for resolved in (candidate + ".py", os.path.join(candidate, "__init__.py")):
+                if os.path.isfile(resolved):
+                    pending.append(resolved)
+                    break
+            else:
+                top = name.split(".")[0]
+                if top and not os.path.exists(os.path.join(base_dir, top)):
+                    external.add(top)
+
+    return sorted(found), sorted(external)
+
+
+class ImportGraph:
+    """Static import graph of a script, resolved the way Python would but without importing anything"""
+
+    # Parsed imports by source path, reused while the file is unchanged
+    _parse_cache = {}
+
+    def __init__(self, script_path, max_modules=20000):
+        self.script_path = os.path.abspath(script_path)
+        self.script_dir = os.path.dirname(self.script_path)
+        self.search_path = [self.script_dir] + [p for p in sys.path[1:] if p and os.path.isdir(p)]
+        self.max_modules = max_modules
+        self.stdlib_names = getattr(sys, "stdlib_module_names", ())
+        self.stdlib_dirs = tuple({os.path.join(sysconfig.get_paths()[key], "") for key in ("stdlib", "platstdlib")})
+        self.modules = {}
+        self.missing = set()
+        self.truncated = False
+        self.elapsed = 0.0
+
+    def _find_spec(self, name):
+        """Locate a module with the path based finder, after its parent package"""
+        if name in sys.builtin_module_names:
+            return "builtin"
+        parent, _, _ = name.rpartition(".")
+        if parent:
+            parent_spec = self._specs.get(parent)
+            if parent_spec is None or parent_spec == "builtin" or not parent_spec.submodule_search_locations:
+                return None
+            path = list(parent_spec.submodule_search_locations)
+        else:
+            path = self.search_path
+        try:
+            return importlib.machinery.PathFinder.find_spec(name, path)
+        except (ImportError, ValueError, OSError):
+            return None
+
+    def _kind(self, name, origin):
+        if origin and ("site-packages" in origin or "dist-packages" in origin):
+            return "third-party"
+        if origin and origin.startswith(self.script_dir + os.sep):
+            return "local"
+        if name.split(".")[0] in self.stdlib_names or (origin and origin.startswith(self.stdlib_dirs)):
+            return "stdlib"
+        return "third-party"
+
+    def _imports_of(self, path, package):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return [], []
+        cached = self._parse_cache.get(path)
+        if cached and cached[0] == (stat.st_mtime_ns, stat.st_size, package):
+            return cached[1]
+        try:
+            result = parse_imports(path, package)
+        except (SyntaxError, ValueError, OSError):
+            result = ([], [])
+        self._parse_cache[path] = ((stat.st_mtime_ns, stat.st_size, package), result)
+        return result
+
+    def scan(self):
+        """Walk the graph breadth first from the script, returns self"""
+        started = time.time()
+        self._specs = {}
+        self.modules = {}
+        self.missing = set()
+        
+        # Each entry: module name, whether a miss is worth reporting, the direct import of the script leading here
+        pending = collections.deque()
+        modules, candidates = self._imports_of(self.script_path, "")
+        self.modules["__main__"] = (self.script_path, os.path.getsize(self.script_path), "local", None)
+        pending.extend((name, True, name.split(".")[0]) for name in modules)
+        pending.extend((name, False, name.split(".")[0]) for name in candidates)
+        
+        while pending:
+            name, required, via = pending.popleft()
+            if name in self.modules or name in self._specs:
+                continue
+            if len(self.modules) >= self.max_modules:
+                self.truncated = True
+                break
+            
+            # Importing a.b.c imports a and a.b first
+            parent = name.rpartition(".")[0]
+            if parent and parent not in self._specs:
+                pending.appendleft((name, required, via))
+                pending.appendleft((parent, required, via))
+                continue
+            
+            spec = self._find_spec(name)
+            self._specs[name] = spec
+            if spec is None:
+                if required:
+                    self.missing.add(name)
+                continue
+            if spec == "builtin":
+                self.modules[name] = (None, 0, "builtin", via)
+                continue
+            
+            # Only Python sources are translated by Nuitka, extension modules are copied as they are
+            origin = spec.origin if spec.has_location else None
+            is_source = bool(origin and origin.endswith(".py"))
+            size = os.path.getsize(origin) if is_source and os.path.isfile(origin) else 0
+            kind = self._kind(name, origin)
+            self.modules[name] = (origin, size, kind, via)
+            
+            if is_source:
+                package = name if spec.submodule_search_locations else parent
+                modules, candidates = self._imports_of(origin, package)
+                # Libraries probe for optional and platform specific modules, only misses in our code matter
+                pending.extend((module, kind == "local", via) for module in modules)
+                pending.extend((module, False, via) for module in candidates)
+        
+        self.elapsed = time.time() - started
+        return self
+
+    @property
+    def module_count(self):
+        return len(self.modules)
+
+    @property
+    def total_size(self):
+        return sum(size for _, size, _, _ in self.modules.values())
+
+    def kind_counts(self):
+        counts = collections.Counter(kind for _, _, kind, _ in self.modules.values())
+        return dict(counts)
+
+    def subtrees(self):
+        """Group the modules by top-level package, largest first"""
+        groups = {}
+        for name, (_, size, kind, via) in self.modules.items():
+            top = "(script)" if name == "__main__" else name.split(".")[0]
+            group = groups.setdefault(top, {"name": top, "kind": kind, "modules": 0, "size": 0, "via": set()})
+            group["modules"] += 1
+            group["size"] += size
+            if via and via != top:
+                group["via"].add(via)
+        
+        result = []
+        for group in groups.values():
+            group["via"] = sorted(group["via"])
+            result.append(group)
+        return sorted(result, key=lambda g: (-g["size"], g["name"]))
+
+    def describe(self, top=8):
+        """Return a human readable report of the graph"""
+        counts = self.kind_counts()
+        breakdown = ", ".join(f"{counts[kind]} {label}" for kind, label in (
+            ("local", "local"), ("stdlib", "standard library"), ("third-party", "third-party"), ("builtin", "built-in")
+        ) if counts.get(kind))
+        lines = [
+            f"=== Import Scan: {os.path.basename(self.script_path)} ===",
+            f"Modules: {self.module_count} ({breakdown})" + (" - scan limit reached" if self.truncated else ""),
+            f"Source size: {format_size(self.total_size)}, scanned in {format_duration(self.elapsed)}"
+        ]
+        
+        groups = self.subtrees()
+        subtrees = [g for g in groups if g["kind"] in ("local", "third-party")][:top]
+        if subtrees:
+            lines.append("Heaviest packages:")
+            for group in subtrees:
+                via = f"  via {', '.join(group['via'][:3])}" if group["via"] else ""
+                lines.append(f"  {group['name']:<24} {group['kind']:<12} {group['modules']:>5} modules "
+                             f"{format_size(group['size']):>10}{via}")
+        
+        # The standard library is summarized, only its largest packages are named
+        stdlib = [g for g in groups if g["kind"] == "stdlib"]
+        if stdlib:
+            largest = ", ".join(f"{g['name']} {format_size(g['size'])}" for g in stdlib[:4])
+            lines.append(f"Standard library: {sum(g['modules'] for g in stdlib)} modules, "
+                         f"{format_size(sum(g['size'] for g in stdlib))} (largest: {largest})")
+        if self.missing:
+            missing = sorted(self.missing)
+            lines.append(f"Not found: {', '.join(missing[:10])}" + (" ..." if len(missing) > 10 else ""))
+        lines.append("Exclude a package with --nofollow-import-to=NAME in the Advanced tab")
+        return lines
+
+    def to_dict(self):
+        return {
+            "script": self.script_path,
+            "modules": self.module_count,
+            "size": self.total_size,
+            "kinds": self.kind_counts(),
+            "subtrees": self.subtrees(),
+            "missing": sorted(self.missing),
+            "truncated": self.truncated,
+            "elapsed": round(self.elapsed, 3)
+        }
+
+
+class BuildCache:
+    """Content-addressed store of previous Nuitka outputs with LRU eviction"""
+
+    def __init__(self, cache_dir=None, max_size=2 * 1024 ** 3):
+        self.cache_dir = cache_dir or os.path.join(APP_DATA_DIR, "build_cache")
+        self.max_size = max_size
+        self.lock = threading.Lock()
+
+    def compute_key(self, script_path, options, toolchain_version):
+        """Hash the source tree, resolved options and toolchain version"""
+        hasher = hashlib.sha256()
+        hasher.update(f"toolchain:{toolchain_version.strip()}\n".encode("utf-8"))
+        
+        # Options that only affect where or how fast we build are ignored
+        relevant = sorted(o for o in options if not o.startswith(NON_OUTPUT_OPTIONS))
+        for option in relevant:
+            hasher.update(f"option:{option}\n".encode("utf-8"))
+            
+            # Files referenced by options (icons, data files) are part of the input
+            value = option.split("=", 1)[1] if "=" in option else ""
+            if value and os.path.isfile(value):
+                hasher.update(hash_file(value).encode("ascii"))
+        
+        sources, external = find_local_imports(script_path)
+        base_dir = os.path.dirname(os.path.abspath(script_path))
+        for path in sources:
+            rel = os.path.relpath(path, base_dir)
+            hasher.update(f"source:{rel}:{hash_file(path)}\n".encode("utf-8"))
+        
+        # Installed third-party packages are fingerprinted by their location and mtime
+        for name in external:
+            hasher.update(f"external:{self._module_fingerprint(name)}\n".encode("utf-8"))
+        
+        return hasher.hexdigest()
+
+    def _module_fingerprint(self, name):
+        """Return a cheap fingerprint of an installed top-level module"""
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, ValueError):
+            spec = None
+        if spec is None or not spec.origin or not os.path.exists(spec.origin):
+            return f"{name}:missing"
+        stat = os.stat(spec.origin)
+        return f"{name}:{spec.origin}:{stat.st_size}:{int(stat.st_mtime)}"
+
+    def _entry_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def _read_entry(self, key):
+        try:
+            with open(os.path.join(self._entry_dir(key), "entry.json"), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_entry(self, key, entry):
+        path = os.path.join(self._entry_dir(key), "entry.json")
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, indent=2)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def collect_artifacts(output_dir, script_path, since=None):
+        """Find the files Nuitka produced for a script in the output directory"""
+        stem = os.path.splitext(os.path.basename(script_path))[0]
+        artifacts = []
+        
+        try:
+            names = os.listdir(output_dir)
+        except OSError:
+            return artifacts
+        
+        for name in names:
+            if name != stem and not name.startswith(stem + "."):
+                continue
+            # Intermediate build folders and sources are not outputs
+            if name.endswith((".build", ".onefile-build", ".py", BuildProfile.SUFFIX)):
+                continue
+            path = os.path.join(output_dir, name)
+            if since is not None and os.lstat(path).st_mtime < since - 2:
+                continue
+            artifacts.append(name)
+        
+        return sorted(artifacts)
+
+    def lookup(self, key):
+        """Return the cache entry for a key, or None"""
+        entry = self._read_entry(key)
+        if entry and os.path.isdir(os.path.join(self._entry_dir(key), "files")):
+            return entry
+        return None
+
+    def restore(self, key, output_dir):
+        """Copy a cached build into the output directory, returns restored names"""
+        with self.lock:
+            entry = self.lookup(key)
+            if not entry:
+                return []
+            
+            files_dir = os.path.join(self._entry_dir(key), "files")
+            os.makedirs(output_dir, exist_ok=True)
+            
+            for name in entry["artifacts"]:
+                source = os.path.join(files_dir, name)
+                target = os.path.join(output_dir, name)
+                remove_path(target)
+                if os.path.isdir(source) and not os.path.islink(source):
+                    shutil.copytree(source, target, symlinks=True)
+                else:
+                    shutil.copy2(source, target, follow_symlinks=False)
+            
+            entry["last_used"] = time.time()
+            entry["hits"] = entry.get("hits", 0) + 1
+            self._write_entry(key, entry)
+            return entry["artifacts"]
+
+    def store(self, key, script_path, output_dir, options, since=None):
+        """Store the artifacts of a successful build under the given key"""
+        artifacts = self.collect_artifacts(output_dir, script_path, since)
+        if not artifacts:
+            return None
+        
+        with self.lock:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            staging = os.path.join(self.cache_dir, f".{key}.{os.getpid()}.tmp")
+            remove_path(staging)
+            files_dir = os.path.join(staging, "files")
+            os.makedirs(files_dir)
+            
+            for name in artifacts:
+                source = os.path.join(output_dir, name)
+                target = os.path.join(files_dir, name)
+                if os.path.isdir(source) and not os.path.islink(source):
+                    shutil.copytree(source, target, symlinks=True)
+                else:
+                    shutil.copy2(source, target, follow_symlinks=False)
+            
+            now = time.time()
+            entry = {
+                "key": key,
+                "script": os.path.abspath(script_path),
+                "options": [o for o in options if not o.startswith(NON_OUTPUT_OPTIONS)],
+                "artifacts": artifacts,
+                "size": get_path_size(files_dir),
+                "created": now,
+                "last_used": now,
+                "hits": 0
+            }
+            with open(os.path.join(staging, "entry.json"), "w", encoding="utf-8") as f:
+                json.dump(entry, f, indent=2)
+            
+            # Swap the finished entry into place
+            remove_path(self._entry_dir(key))
+            os.rename(staging, self._entry_dir(key))
+        
+        self.prune(keep=key)
+        return entry
+
+    def entries(self):
+        """Return all cache entries, most recently used first"""
+        result = []
+        if not os.path.isdir(self.cache_dir):
+            return result
+        
+        for name in os.listdir(self.cache_dir):
+            if name.startswith("."):
+                continue
+            entry = self._read_entry(name)
+            if entry:
+                result.append(entry)
+        
+        result.sort(key=lambda e: e.get("last_used", 0), reverse=True)
+        return result
+
+    def total_size(self):
+        return sum(entry.get("size", 0) for entry in self.entries())
+
+    def describe(self):
+        """Return a human readable listing of the cache"""
+        entries = self.entries()
+        if not entries:
+            return ["Build cache is empty."]
+        
+        lines = ["=== Build Cache ==="]
+        for entry in entries:
+            last_used = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry.get("last_used", 0)))
+            lines.append(
+                f"{entry['key'][:12]}  {format_size(entry.get('size', 0)):>10}  "
+                f"hits: {entry.get('hits', 0):<3} last used: {last_used}  "
+                f"{os.path.basename(entry.get('script', ''))}"
+            )
+        lines.append(
+            f"Total: {len(entries)} entries, {format_size(sum(e.get('size', 0) for e in entries))} "
+            f"of {format_size(self.max_size)} limit"
+        )
+        lines.append(f"Location: {self.cache_dir}")
+        return lines
+
+    def prune(self, max_size=None, keep=None):
+        """Evict least recently used entries until the cache fits the limit, never the keep key"""
+        limit = self.max_size if max_size is None else max_size
+        evicted = []
+        
+        with self.lock:
+            entries = self.entries()
+            total = sum(entry.get("size", 0) for entry in entries)
+            # The entry just stored counts towards the limit but is never the one evicted
+            entries = [entry for entry in entries if entry["key"] != keep]
+            
+            while entries and total > limit:
+                entry = entries.pop()
+                remove_path(self._entry_dir(entry["key"]))
+                total -= entry.get("size", 0)
+                evicted.append(entry)
+        
+        return evicted
+
+    def clear(self):
+        """Remove every cache entry"""
+        return self.prune(max_size=0)
+
+
+class OutputLog:
+    """Complete terminal output spilled to disk, with a line index for paging and search"""
+
+    def __init__(self, path=None, keep_logs=5):
+        log_dir = os.path.join(APP_DATA_DIR, "logs")
+        if path is None:
+            os.makedirs(log_dir, exist_ok=True)
+            self._remove_old_logs(log_dir, keep_logs - 1)
+            path = os.path.join(log_dir, time.strftime("terminal-%Y%m%d-%H%M%S") + f"-{os.getpid()}.log")
+        
+        self.path = path
+        self.writer = open(path, "ab")
+        self.reader = open(path, "rb")
+        self.size = self.writer.tell()
+        # Byte offset where each line starts, the last one is the line being written
+        self.offsets = array("q", [self.size])
+        self.lock = threading.Lock()
+
+    def _remove_old_logs(self, log_dir, keep):
+        """Delete the logs of older sessions, keeping the newest ones"""
+        logs = sorted(
+            (os.path.join(log_dir, name) for name in os.listdir(log_dir) if name.startswith("terminal-")),
+            key=os.path.getmtime,
+            reverse=True
+        )
+        for path in logs[max(0, keep):]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def append(self, text):
+        """Write text to the log and index its line breaks"""
+        data = text.encode("utf-8", "replace")
+        with self.lock:
+            self.writer.write(data)
+            pos = data.find(b"\n")
+            while pos != -1:
+                self.offsets.append(self.size + pos + 1)
+                pos = data.find(b"\n", pos + 1)
+            self.size += len(data)
+
+    def line_count(self):
+        """Number of lines, including an unterminated last line"""
+        with self.lock:
+            return len(self.offsets) - (1 if self.offsets[-1] == self.size else 0)
+
+    def read_lines(self, start, count):
+        """Return up to count lines starting at the given line number"""
+        with self.lock:
+            self.writer.flush()
+            last = len(self.offsets) - 1
+            start = max(0, min(start, last))
+            end = min(start + count, last)
+            end_offset = self.offsets[end] if end < last else self.size
+            self.reader.seek(self.offsets[start])
+            data = self.reader.read(end_offset - self.offsets[start])
+        return data.decode("utf-8", "replace").splitlines(keepends=True)
+
+    def search(self, pattern, limit=500, use_regex=False):
+        """Return (line number, line) pairs matching the pattern, case insensitive"""
+        if use_regex:
+            matcher = re.compile(pattern, re.IGNORECASE).search
+        else:
+            needle = pattern.lower()
+            matcher = lambda line: needle in line.lower()
+        
+        with self.lock:
+            self.writer.flush()
+        
+        results = []
+        with open(self.path, "rb") as f:
+            for line_no, raw in enumerate(f):
+                line = raw.decode("utf-8", "replace")
+                if matcher(line):
+                    results.append((line_no, line.rstrip("\n")))
+                    if len(results) >= limit:
+                        break
+        return results
+
+    def close(self):
+        with self.lock:
+            self.writer.close()
+            self.reader.close()
+
+
+class CompilerCache:
+    """Hit and miss statistics of ccache or clcache around a single build"""
+
+    # ccache --print-stats counters
+    HIT_COUNTERS = ("direct_cache_hit", "preprocessed_cache_hit")
+    MISS_COUNTERS = ("cache_miss",)
+
+    def __init__(self, binary, env=None):
+        self.binary = binary
+        self.env = dict(os.environ, **(env or {}))
+        self.is_clcache = os.path.basename(binary).lower().startswith("clcache")
+        self.stats_log = None
+        self.before = None
+
+    def _run(self, *args):
+        try:
+            result = subprocess.run([self.binary] + list(args), capture_output=True,
+                                    text=True, timeout=15, env=self.env)
+            return result.stdout if result.returncode == 0 else ""
+        except (OSError, subprocess.SubprocessError):
+            return ""
+
+    def read_counters(self):
+        """Return the cache-wide hit/miss counters and the cache size"""
+        counters = {"hits": 0, "misses": 0, "size": None, "max_size": None}
+        
+        if not self.is_clcache:
+            # Machine readable statistics, ccache 4 and newer
+            output = self._run("--print-stats")
+            if output:
+                values = {}
+                for line in output.splitlines():
+                    name, _, value = line.partition("\t")
+                    if value.strip().isdigit():
+                        values[name] = int(value)
+                counters["hits"] = sum(values.get(name, 0) for name in self.HIT_COUNTERS)
+                counters["misses"] = sum(values.get(name, 0) for name in self.MISS_COUNTERS)
+                if "cache_size_kibibyte" in values:
+                    counters["size"] = values["cache_size_kibibyte"] * 1024
+                max_size = self._run("--get-config", "max_size").strip()
+                counters["max_size"] = parse_size(max_size) if max_size else None
+                return counters
+        
+        # Human readable statistics, older ccache and clcache
+        for line in self._run("-s").splitlines():
+            lower = line.lower()
+            number = re.search(r"(\d+)\s*$", line)
+            size = re.search(r"([\d.]+\s*[KMGT]?i?B)\s*$", line, re.IGNORECASE)
+            if "max" in lower and "size" in lower and size:
+                counters["max_size"] = parse_size(size.group(1))
+            elif "size" in lower and size:
+                counters["size"] = parse_size(size.group(1))
+            elif "hit" in lower and number and "rate" not in lower:
+                counters["hits"] += int(number.group(1))
+            elif "miss" in lower and number:
+                counters["misses"] += int(number.group(1))
+        return counters
+
+    def begin(self):
+        """Snapshot the counters before a build, returns extra environment for it"""
+        self.before = self.read_counters()
+        if self.is_clcache:
+            return {}
+        
+        # ccache 4.4+ logs each compilation of this build, which keeps concurrent builds apart
+        fd, self.stats_log = tempfile.mkstemp(prefix="compyler-ccache-", suffix=".log")
+        os.close(fd)
+        return {"CCACHE_STATSLOG": self.stats_log}
+
+    def _read_stats_log(self):
+        hits = misses = 0
+        try:
+            with open(self.stats_log, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    name = line.strip()
+                    if name in self.HIT_COUNTERS:
+                        hits += 1
+                    elif name in self.MISS_COUNTERS:
+                        misses += 1
+        except (OSError, TypeError):
+            return None
+        return (hits, misses) if hits or misses else None
+
+    def finish(self):
+        """Return the statistics of the build since begin()"""
+        after = self.read_counters()
+        per_build = self._read_stats_log()
+        if self.stats_log:
+            try:
+                os.remove(self.stats_log)
+            except OSError:
+                pass
+            self.stats_log = None
+        
+        if per_build:
+            hits, misses = per_build
+        else:
+            hits = after["hits"] - (self.before or {}).get("hits", 0)
+            misses = after["misses"] - (self.before or {}).get("misses", 0)
+        
+        return {
+            "hits": max(0, hits),
+            "misses": max(0, misses),
+            "size": after["size"],
+            "max_size": after["max_size"]
+        }
+
+    @staticmethod
+    def summary(stats, compile_seconds=None):
+        """Describe cache statistics, estimating the time saved from the compile phase"""
+        total = stats["hits"] + stats["misses"]
+        if not total:
+            return ["Compiler cache: no C compilations went through the cache"]
+        
+        lines = [
+            f"Compiler cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hits'] * 100 / total:.1f}% hit rate)"
+        ]
+        
+        # Assume a hit would have taken as long as an average miss
+        if compile_seconds and stats["misses"] and stats["hits"]:
+            saved = compile_seconds / stats["misses"] * stats["hits"]
+            lines.append(f"Compiler cache: saved about {format_duration(saved)} of C compilation")
+        
+        if stats.get("size") is not None:
+            limit = f" of {format_size(stats['max_size'])}" if stats.get("max_size") else ""
+            lines.append(f"Compiler cache: size {format_size(stats['size'])}{limit}")
+        return lines
+
+
+class IncrementalBuild:
+    """Persistent build directory of a project, with a content-hash manifest of its modules"""
+
+    def __init__(self, script_path, options, root=None):
+        self.script_path = os.path.abspath(script_path)
+        self.root = root or os.path.join(APP_DATA_DIR, "incremental")
+        self.relevant_options = sorted(o for o in options if not o.startswith(NON_OUTPUT_OPTIONS))
+        
+        hasher = hashlib.sha256()
+        hasher.update(self.script_path.encode("utf-8"))
+        hasher.update(json.dumps(self.relevant_options).encode("utf-8"))
+        self.key = hasher.hexdigest()
+        self.build_dir = os.path.join(self.root, self.key[:16])
+        self.manifest_path = os.path.join(self.build_dir, ".compyler-manifest.json")
+
+    def build_options(self, options):
+        """Point Nuitka at the persistent build directory instead of the output directory"""
+        # Nuitka translates every module again, but unchanged modules give the same C code
+        # at the same paths, so ccache serves their objects and only changed ones compile
+        kept = [o for o in options if not o.startswith("--output-dir=") and o != "--remove-output"]
+        return kept + [f"--output-dir={self.build_dir}"]
+
+    def load_manifest(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def scan(self):
+        """Return the content hash of every local module, by path relative to the script"""
+        base_dir = os.path.dirname(self.script_path)
+        sources, _ = find_local_imports(self.script_path)
+        modules = {}
+        for path in sources:
+            try:
+                modules[os.path.relpath(path, base_dir)] = hash_file(path)
+            except OSError:
+                continue
+        return modules
+
+    def changes(self, modules):
+        """Compare with the last successful build, returns (added, changed, removed) or None for a first build"""
+        manifest = self.load_manifest()
+        if not manifest:
+            return None
+        previous = manifest.get("modules", {})
+        added = sorted(name for name in modules if name not in previous)
+        changed = sorted(name for name in modules if name in previous and previous[name] != modules[name])
+        removed = sorted(name for name in previous if name not in modules)
+        return added, changed, removed
+
+    def describe_changes(self, modules, compiler_cache=True):
+        # The manifest only reports what changed, the compiler cache is what skips unchanged modules
+        if not compiler_cache:
+            return (f"Incremental build: no compiler cache, only the build directory {self.build_dir} is reused, "
+                    f"all {len(modules)} modules are compiled again")
+        changes = self.changes(modules)
+        if changes is None:
+            return f"Incremental build: first build, {len(modules)} modules, keeping objects in {self.build_dir}"
+        
+        touched = [name for group in changes for name in group]
+        if not touched:
+            return f"Incremental build: no module changed out of {len(modules)}, relinking"
+        shown = ", ".join(touched[:5]) + (f" and {len(touched) - 5} more" if len(touched) > 5 else "")
+        return f"Incremental build: {len(touched)} of {len(modules)} modules changed ({shown})"
+
+    def sync(self, output_dir):
+        """Copy the build results to the output directory, returns the number of files updated"""
+        os.makedirs(output_dir, exist_ok=True)
+        copied = 0
+        for name in BuildCache.collect_artifacts(self.build_dir, self.script_path):
+            copied += sync_tree(os.path.join(self.build_dir, name), os.path.join(output_dir, name))
+        return copied
+
+    def commit(self, modules):
+        """Remember the modules of a successful build"""
+        manifest = {
+            "script": self.script_path,
+            "options": self.relevant_options,
+            "modules": modules,
+            "updated_at": time.time()
+        }
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    @staticmethod
+    def describe_all(root=None):
+        """Return a human readable listing of the incremental build directories"""
+        root = root or os.path.join(APP_DATA_DIR, "incremental")
+        try:
+            names = sorted(os.listdir(root))
+        except OSError:
+            names = []
+        if not names:
+            return ["No incremental build directories."]
+        
+        lines = ["=== Incremental Builds ==="]
+        total = 0
+        for name in names:
+            path = os.path.join(root, name)
+            size = get_path_size(path)
+            total += size
+            try:
+                with open(os.path.join(path, ".compyler-manifest.json"), "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                manifest = {}
+            updated = time.strftime('%Y-%m-%d %H:%M', time.localtime(manifest.get("updated_at", 0)))
+            lines.append(
+                f"{name[:12]}  {format_size(size):>10}  modules: {len(manifest.get('modules', {})):<4} "
+                f"updated: {updated}  {manifest.get('script', '(never completed)')}"
+            )
+        lines.append(f"Total: {len(names)} projects, {format_size(total)}")
+        lines.append(f"Location: {root}")
+        return lines
+
+    @staticmethod
+    def clear_all(root=None):
+        """Remove every incremental build directory, returns how many were removed"""
+        root = root or os.path.join(APP_DATA_DIR, "incremental")
+        try:
+            names = os.listdir(root)
+        except OSError:
+            return 0
+        for name in names:
+            remove_path(os.path.join(root, name))
+        return len(names)
+
+
+class OnefileCache:
+    """Extraction directories of onefile programs built with a cached extraction"""
+
+    @staticmethod
+    def root():
+        """The directory of Compyler's builds in the user cache, {CACHE_DIR} of the onefile bootstrap"""
+        if os.name == "nt":
+            base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        elif sys.platform == "darwin":
+            base = os.path.expanduser("~/Library/Caches")
+        else:
+            base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        return os.path.join(base, ONEFILE_CACHE_NAME)
+
+    @classmethod
+    def extraction_dir(cls, artifact, build_id):
+        """Where a build of the program unpacks itself, {PROGRAM_BASE} is the file name without suffix"""
+        return os.path.join(cls.root(), os.path.splitext(os.path.basename(artifact))[0], build_id)
+
+    @classmethod
+    def forget(cls, artifact, build_id):
+        """Remove the extraction of a build, its next launch unpacks it again"""
+        remove_path(cls.extraction_dir(artifact, build_id))
+
+    @classmethod
+    def prune(cls, artifact, build_id, keep=ONEFILE_CACHE_KEEP):
+        """Remove older extractions of a program, a copy of the previous build may still be in use"""
+        program_dir = os.path.dirname(cls.extraction_dir(artifact, build_id))
+        try:
+            names = [name for name in os.listdir(program_dir) if name != build_id]
+        except OSError:
+            return 0
+        names.sort(key=lambda name: os.path.getmtime(os.path.join(program_dir, name)), reverse=True)
+        stale = names[max(0, keep - 1):]
+        for name in stale:
+            remove_path(os.path.join(program_dir, name))
+        return len(stale)
+
+    @classmethod
+    def describe_all(cls):
+        """Return a human readable listing of the cached extractions"""
+        root = cls.root()
+        try:
+            programs = sorted(os.listdir(root))
+        except OSError:
+            programs = []
+        
+        lines = ["=== Onefile Extractions ==="]
+        count = total = 0
+        for program in programs:
+            program_dir = os.path.join(root, program)
+            try:
+                builds = sorted(os.listdir(program_dir))
+            except OSError:
+                continue
+            for build_id in builds:
+                path = os.path.join(program_dir, build_id)
+                size = get_path_size(path)
+                used = time.strftime('%Y-%m-%d %H:%M', time.localtime(os.path.getmtime(path)))
+                lines.append(f"{program:<20} {build_id[:12]}  {format_size(size):>10}  unpacked: {used}")
+                count += 1
+                total += size
+        if not count:
+            return ["No cached onefile extractions."]
+        lines.append(f"Total: {count} extractions, {format_size(total)}")
+        lines.append(f"Location: {root}")
+        return lines
+
+    @classmethod
+    def clear_all(cls):
+        """Remove every cached extraction, returns how many programs were removed"""
+        root = cls.root()
+        try:
+            programs = os.listdir(root)
+        except OSError:
+            return 0
+        for program in programs:
+            remove_path(os.path.join(root, program))
+        return len(programs)
+
+
+class DependencyCache:
+    """Shared store of third-party packages compiled once as Nuitka extension modules"""
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or os.path.join(APP_DATA_DIR, "deps")
+        self.lock = threading.Lock()
+        self.key_locks = {}
+        self.distributions = None
+
+    @staticmethod
+    def locate(name):
+        """Return (path, is_package) of an installed pure Python package, None if it can't be cached"""
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, ValueError):
+            return None
+        if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+            return None
+        if "site-packages" not in spec.origin and "dist-packages" not in spec.origin:
+            return None
+        if not spec.submodule_search_locations:
+            return spec.origin, False
+        
+        # Native extensions and data files would not be part of the compiled module
+        root = os.path.dirname(spec.origin)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+            if any(not f.endswith((".py", ".pyi", ".typed")) for f in filenames):
+                return None
+        return root, True
+
+    def package_version(self, name):
+        """Return the installed distribution version of a top-level package"""
+        try:
+            import importlib.metadata
+            if self.distributions is None:
+                self.distributions = importlib.metadata.packages_distributions()
+            dists = self.distributions.get(name)
+            if dists:
+                return importlib.metadata.version(dists[0])
+        except Exception:
+            pass
+        return "unknown"
+
+    @staticmethod
+    def _source_files(path):
+        if os.path.isfile(path):
+            return [path]
+        files = []
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+            files.extend(os.path.join(dirpath, f) for f in sorted(filenames) if f.endswith(".py"))
+        return files
+
+    def fingerprint(self, path):
+        """Cheap fingerprint of the package sources, catches edits without a version change"""
+        hasher = hashlib.sha256()
+        for file_path in self._source_files(path):
+            stat = os.stat(file_path)
+            hasher.update(f"{os.path.relpath(file_path, path)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+        return hasher.hexdigest()
+
+    def imports(self, name, path):
+        """Return the top-level modules the package imports from outside itself"""
+        found = set()
+        for file_path in self._source_files(path):
+            try:
+                with open(file_path, "rb") as f:
+                    tree = ast.parse(f.read(), filename=file_path)
+            except (OSError, SyntaxError, ValueError):
+                continue
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    found.update(alias.name.split(".")[0] for alias in node.names)
+                elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+                    found.add(node.module.split(".")[0])
+        found.discard(name)
+        return sorted(found)
+
+    def compute_key(self, name, version, fingerprint, toolchain_version, flags):
+        hasher = hashlib.sha256()
+        hasher.update(f"package:{name}:{version}:{fingerprint}\n".encode("utf-8"))
+        hasher.update(f"toolchain:{toolchain_version.strip()}\n".encode("utf-8"))
+        for flag in sorted(flags):
+            hasher.update(f"flag:{flag}\n".encode("utf-8"))
+        return hasher.hexdigest()
+
+    def _entry_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def _read_entry(self, key):
+        try:
+            with open(os.path.join(self._entry_dir(key), "entry.json"), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("file"):
+            entry["path"] = os.path.join(self._entry_dir(key), "files", entry["file"])
+        return entry
+
+    def _write_entry(self, directory, entry):
+        entry = {k: v for k, v in entry.items() if k != "path"}
+        path = os.path.join(directory, "entry.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(entry, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def ensure(self, name, flags, toolchain_version, env=None, jobs=None, on_output=None, on_start=None,
+               timeout=None):
+        """Return the cache entry of a package, compiling it first if needed, None if it can't be used"""
+        located = self.locate(name)
+        if not located:
+            return None
+        path, is_package = located
+        version = self.package_version(name)
+        key = self.compute_key(name, version, self.fingerprint(path), toolchain_version, flags)
+        
+        with self.lock:
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+        
+        # Concurrent builds needing the same package wait for a single compilation
+        with key_lock:
+            entry = self._read_entry(key)
+            if entry is None:
+                entry = self._compile(key, name, version, path, is_package, flags, env, jobs, on_output,
+                                      on_start, timeout)
+            elif not entry.get("failed"):
+                entry["hits"] = entry.get("hits", 0) + 1
+                entry["last_used"] = time.time()
+                try:
+                    self._write_entry(self._entry_dir(key), entry)
+                except OSError:
+                    pass
+        
+        if entry is None or entry.get("failed"):
+            return None
+        return entry
+
+    def _compile(self, key, name, version, path, is_package, flags, env, jobs, on_output, on_start=None,
+                 timeout=None):
+        """Compile a package as an extension module into a new cache entry, None if it was stopped"""
+        def emit(text):
+            if on_output:
+                on_output(text)
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        staging = os.path.join(self.cache_dir, f".{key}.{os.getpid()}.tmp")
+        remove_path(staging)
+        work_dir = os.path.join(staging, "build")
+        files_dir = os.path.join(staging, "files")
+        os.makedirs(work_dir)
+        os.makedirs(files_dir)
+        
+        command = ["python", "-m", "nuitka", "--module", path, f"--output-dir={work_dir}"]
+        if is_package:
+            command.append(f"--include-package={name}")
+        command.extend(flags)
+        if jobs:
+            command.append(f"--jobs={jobs}")
+        
+        emit(f"Dependency cache: compiling {name} {version} once for all projects...\n")
+        started = time.time()
+        log_path = os.path.join(staging, "build.log")
+        try:
+            # Supervised like the build itself, so Cancel and the time limit stop it with its compilers
+            with open(log_path, "w", encoding="utf-8", errors="replace") as log:
+                process = ProcessSupervisor.shared().spawn(
+                    command, log.writelines, timeout=timeout, stdin=subprocess.DEVNULL,
+                    env=dict(os.environ, **(env or {})), **PROCESS_GROUP_OPTIONS)
+                if on_start:
+                    on_start(process)
+                returncode = process.wait()
+        except OSError as e:
+            returncode = 1
+            with open(log_path, "a", encoding="utf-8") as log:
+                log.write(f"{str(e)}\n")
+        
+        # A stopped compilation says nothing about the package, it is tried again next time
+        if returncode < 0:
+            remove_path(staging)
+            emit(f"Dependency cache: compiling {name} was stopped\n")
+            return None
+        
+        products = [f for f in os.listdir(work_dir)
+                    if f.startswith(name + ".") and f.endswith((".so", ".pyd"))]
+        entry = {
+            "key": key,
+            "name": name,
+            "version": version,
+            "python": sys.version.split()[0],
+            "flags": sorted(flags),
+            "source": path,
+            "imports": self.imports(name, path),
+            "seconds": round(time.time() - started, 1),
+            "created": time.time(),
+            "last_used": time.time(),
+            "hits": 0,
+            "failed": returncode != 0 or not products
+        }
+        
+        if entry["failed"]:
+            emit(f"Dependency cache: {name} could not be compiled as a module, it is compiled with the program "
+                 f"(log: {os.path.join(self._entry_dir(key), 'build.log')})\n")
+        else:
+            product = products[0]
+            shutil.move(os.path.join(work_dir, product), os.path.join(files_dir, product))
+            entry["file"] = product
+            entry["size"] = os.path.getsize(os.path.join(files_dir, product))
+            entry["sha256"] = hash_file(os.path.join(files_dir, product))
+            emit(f"Dependency cache: stored {name} {version} ({format_size(entry['size'])}, "
+                 f"{format_duration(entry['seconds'])})\n")
+        
+        remove_path(work_dir)
+        self._write_entry(staging, entry)
+        remove_path(self._entry_dir(key))
+        os.replace(staging, self._entry_dir(key))
+        return self._read_entry(key)
+
+    def entries(self):
+        """Return all entries, most recently used first"""
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return []
+        entries = [self._read_entry(name) for name in names if not name.startswith(".")]
+        return sorted((e for e in entries if e), key=lambda e: e.get("last_used", 0), reverse=True)
+
+    def describe(self):
+        """Return a human readable listing of the cache"""
+        entries = self.entries()
+        if not entries:
+            return ["Dependency cache is empty."]
+        
+        lines = ["=== Dependency Cache ==="]
+        for entry in entries:
+            last_used = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry.get("last_used", 0)))
+            state = "failed" if entry.get("failed") else format_size(entry.get("size", 0))
+            lines.append(
+                f"{entry['key'][:12]}  {entry['name'] + ' ' + entry['version']:<30} {state:>10}  "
+                f"python {entry.get('python', '?')}  hits: {entry.get('hits', 0):<3} last used: {last_used}"
+            )
+        lines.append(f"Total: {len(entries)} entries, {format_size(get_path_size(self.cache_dir))}")
+        lines.append(f"Location: {self.cache_dir}")
+        return lines
+
+    def verify(self):
+        """Check every entry against its checksum and the installed package, returns report lines"""
+        lines = []
+        for entry in self.entries():
+            label = f"{entry['key'][:12]}  {entry['name']} {entry['version']}"
+            if entry.get("failed"):
+                lines.append(f"{label}: compilation failed, evict it to try again")
+            elif not os.path.isfile(entry["path"]):
+                lines.append(f"{label}: missing module file")
+            elif hash_file(entry["path"]) != entry.get("sha256"):
+                lines.append(f"{label}: checksum mismatch, the module file is corrupt")
+            elif self.package_version(entry["name"]) != entry["version"]:
+                lines.append(f"{label}: stale, {entry['name']} {self.package_version(entry['name'])} is installed now")
+            else:
+                lines.append(f"{label}: ok")
+        return lines or ["Dependency cache is empty."]
+
+    def evict(self, selector):
+        """Remove the entries of a package name or key prefix, returns the removed entries"""
+        evicted = []
+        with self.lock:
+            for entry in self.entries():
+                if selector in (entry["name"], "all") or entry["key"].startswith(selector):
+                    remove_path(self._entry_dir(entry["key"]))
+                    evicted.append(entry)
+        return evicted
+
+    def clear(self):
+        return self.evict("all")
+
+
+class BuildEstimate:
+    """Expected duration and phase timeline of a build, predicted from previous builds"""
+
+    def __init__(self, phases, phase_lines=None, samples=0, source="project"):
+        self.phases = {phase: max(0.0, phases.get(phase, 0.0)) for phase in PHASE_ORDER}
+        self.phase_lines = phase_lines or {}
+        self.duration = sum(self.phases.values())
+        self.samples = samples
+        self.source = source
+        
+        # Expected start of each phase, measured from the start of the build
+        self.offsets = {}
+        offset = 0.0
+        for phase in PHASE_ORDER:
+            self.offsets[phase] = offset
+            offset += self.phases[phase]
+
+    def describe(self):
+        builds = f"{self.samples} previous build{'s' if self.samples != 1 else ''}"
+        if self.source == "project":
+            origin = f"from {builds} of this script"
+        else:
+            origin = f"fitted on {builds} of other scripts"
+        return f"Expected build time: {format_duration(self.duration)} ({origin})"
+
+    def _completed(self, phase, phase_elapsed, phase_lines):
+        """Return the expected seconds of work done once phase_elapsed into phase"""
+        if phase not in self.offsets:
+            phase = "initialize"
+        expected = self.phases[phase]
+        if not expected:
+            fraction = 0.95
+        else:
+            fraction = phase_elapsed / expected
+            # The output volume is a second, independent clock for the phase
+            expected_lines = self.phase_lines.get(phase)
+            if expected_lines and phase_lines:
+                fraction = max(fraction, phase_lines / expected_lines)
+        return self.offsets[phase] + min(0.95, fraction) * expected
+
+    def progress(self, elapsed, phase=None, phase_elapsed=0, phase_lines=0):
+        """Return the expected overall progress in percent"""
+        if not self.duration:
+            return 0
+        return min(99.0, self._completed(phase, phase_elapsed, phase_lines) * 100 / self.duration)
+
+    def remaining(self, elapsed, phase=None, phase_elapsed=0, phase_lines=0):
+        """Return the expected seconds until the build finishes"""
+        completed = self._completed(phase, phase_elapsed, phase_lines)
+        remaining = max(0.0, self.duration - completed)
+        
+        # A build running slower or faster than usual will likely stay that way
+        if completed > self.duration * 0.1 and elapsed > 0:
+            remaining *= min(2.0, max(0.5, elapsed / completed))
+        return max(1.0, remaining)
+
+
+class BuildHistory:
+    """Per-project record of previous builds: phase durations, output lines and module counts"""
+
+    def __init__(self, path=None, max_records=HISTORY_MAX_RECORDS):
+        self.path = path or os.path.join(APP_DATA_DIR, "history.json")
+        self.max_records = max_records
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def compute_key(script_path, options):
+        """Identify a project by its script and the options that shape the build"""
+        # The jobs count is recorded per build instead, it changes with the auto jobs mode
+        relevant = sorted(o for o in options if not o.startswith(("--output-dir=", "--jobs=")))
+        digest = hashlib.sha256()
+        digest.update(os.path.abspath(script_path).encode("utf-8"))
+        digest.update(json.dumps(relevant).encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def build_profile(options):
+        return sorted(o for o in options if o in BUILD_PROFILE_OPTIONS)
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data.get("projects"), dict):
+                return data
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {"projects": {}}
+
+    def _save(self, data):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + f".{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def record(self, job):
+        """Add a finished build to the history of its project"""
+        record = {
+            "finished_at": job.end_time,
+            "duration": job.end_time - job.start_time,
+            "phases": job.phase_durations(),
+            "lines": job.line_count,
+            "phase_lines": dict(job.phase_lines),
+            "modules": job.module_count,
+            "jobs": job.jobs
+        }
+        if job.profile:
+            record["peak_rss"] = job.profile.data["peak_rss"]
+            record["phase_peak_rss"] = {}
+            for phase in job.profile.data["phases"]:
+                if phase["peak_rss"]:
+                    previous = record["phase_peak_rss"].get(phase["phase"], 0)
+                    record["phase_peak_rss"][phase["phase"]] = max(previous, phase["peak_rss"])
+        key = self.compute_key(job.script_path, job.options)
+        
+        with self.lock:
+            # Reload first, other Compyler processes may have written meanwhile
+            data = self._load()
+            project = data["projects"].setdefault(key, {"builds": []})
+            project["script"] = os.path.abspath(job.script_path)
+            project["profile"] = self.build_profile(job.options)
+            project["builds"] = (project["builds"] + [record])[-self.max_records:]
+            self._save(data)
+        return record
+
+    def record_benchmark(self, script_path, options, result):
+        """Add a post-build benchmark to the history of its project"""
+        key = self.compute_key(script_path, options)
+        with self.lock:
+            data = self._load()
+            project = data["projects"].setdefault(key, {"builds": []})
+            project["script"] = os.path.abspath(script_path)
+            project["profile"] = self.build_profile(options)
+            project["benchmarks"] = (project.get("benchmarks", []) + [result])[-self.max_records:]
+            self._save(data)
+
+    def benchmarks(self, script_path, options):
+        """Return the recorded benchmarks of a project, oldest first"""
+        with self.lock:
+            project = self._load()["projects"].get(self.compute_key(script_path, options), {})
+        return project.get("benchmarks", [])
+
+    def builds(self, script_path, options):
+        """Return the recorded builds of a project, oldest first"""
+        with self.lock:
+            project = self._load()["projects"].get(self.compute_key(script_path, options), {})
+        return project.get("builds", [])
+
+    def job_memory(self, script_path, options):
+        """Return the measured memory of one C compile job of a project, None without measurements"""
+        samples = []
+        for build in self.builds(script_path, options):
+            peaks = build.get("phase_peak_rss") or {}
+            if not build.get("jobs") or not peaks:
+                continue
+            # What the tree needs beyond Nuitka itself, split over the parallel jobs
+            baseline = max(peaks.get("initialize", 0), peaks.get("dependency_scan", 0), peaks.get("c_generation", 0))
+            compile_peak = max(peaks.get("c_compilation", 0), peaks.get("linking", 0))
+            if compile_peak > baseline:
+                samples.append(build)
+                build["job_memory"] = (compile_peak - baseline) / build["jobs"]
+        if not samples:
+            return None
+        return max(128 * 1024 ** 2, int(self._weighted(samples, lambda b: b["job_memory"])))
+
+    def estimate(self, script_path, options, modules=None):
+        """Predict the next build of a project, None when there is nothing to learn from"""
+        with self.lock:
+            projects = self._load()["projects"]
+        
+        project = projects.get(self.compute_key(script_path, options))
+        if project and project.get("builds"):
+            return self._estimate_from_project(project["builds"])
+        
+        if modules:
+            profile = self.build_profile(options)
+            others = [p for p in projects.values() if p.get("builds")]
+            similar = [p for p in others if p.get("profile") == profile]
+            return self._estimate_from_others(similar or others, modules)
+        return None
+
+    @staticmethod
+    def _weighted(builds, value):
+        """Average a value over the builds, halving the weight of each older one"""
+        total = weight_sum = 0.0
+        for age, build in enumerate(reversed(builds)):
+            weight = 0.5 ** age
+            total += value(build) * weight
+            weight_sum += weight
+        return total / weight_sum
+
+    def _estimate_from_project(self, builds):
+        phases = {
+            phase: self._weighted(builds, lambda b, p=phase: b.get("phases", {}).get(p, 0.0))
+            for phase in PHASE_ORDER
+        }
+        phase_lines = {
+            phase: self._weighted(builds, lambda b, p=phase: b.get("phase_lines", {}).get(p, 0))
+            for phase in PHASE_ORDER
+        }
+        return BuildEstimate(phases, phase_lines, len(builds), "project")
+
+    def _estimate_from_others(self, projects, modules):
+        """Fit duration = a + b * modules over the latest build of other projects"""
+        samples = [p["builds"][-1] for p in projects if p["builds"][-1].get("modules")]
+        if not samples:
+            return None
+        
+        xs = [s["modules"] for s in samples]
+        ys = [s["duration"] for s in samples]
+        mean_x = sum(xs) / len(xs)
+        mean_y = sum(ys) / len(ys)
+        spread = sum((x - mean_x) ** 2 for x in xs)
+        slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread if spread else 0
+        if slope > 0:
+            duration = mean_y + slope * (modules - mean_x)
+        else:
+            # Not enough variety to fit a line, scale by modules instead
+            duration = mean_y * modules / mean_x
+        duration = max(duration, min(ys))
+        
+        # Split the predicted duration like the other builds split theirs
+        shares = {phase: 0.0 for phase in PHASE_ORDER}
+        for sample in samples:
+            total = sum(sample.get("phases", {}).values()) or sample["duration"]
+            for phase in PHASE_ORDER:
+                shares[phase] += sample.get("phases", {}).get(phase, 0.0) / total / len(samples)
+        share_sum = sum(shares.values()) or 1.0
+        phases = {phase: duration * share / share_sum for phase, share in shares.items()}
+        return BuildEstimate(phases, None, len(samples), "fitted")
+
+
+class ProcessTreeMonitor:
+    """Samples the resident memory and CPU time of a process and all its descendants"""
+
+    def __init__(self, pid, interval=PROFILE_SAMPLE_INTERVAL):
+        self.pid = pid
+        self.interval = interval
+        self.samples = []
+        self.stopped = threading.Event()
+        self.thread = None
+
+    @property
+    def available(self):
+        return PROCESS_TREE_SUPPORTED
+
+    def start(self):
+        if self.available:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread:
+            self.thread.join()
+
+    def read_tree(self):
+        """Return (rss bytes, cpu seconds) of the whole tree, None once the root is gone"""
+        processes = list_process_tree(self.pid)
+        if not processes:
+            return None
+        return sum(p.rss for p in processes), sum(p.cpu for p in processes)
+
+    def _run(self):
+        while True:
+            try:
+                sample = self.read_tree()
+            except Exception:
+                sample = None
+            if sample:
+                self.samples.append((time.time(),) + sample)
+            if self.stopped.wait(self.interval):
+                break
+
+    def peak_rss(self, start=None, end=None):
+        values = [rss for t, rss, _ in self.samples
+                  if (start is None or t >= start) and (end is None or t <= end)]
+        return max(values) if values else None
+
+    def cpu_at(self, moment):
+        """Return the CPU seconds the tree had used by the given time"""
+        cpu = 0.0
+        for t, _, value in self.samples:
+            if t > moment:
+                break
+            cpu = max(cpu, value)
+        return cpu
+
+
+class MemoryGovernor:
+    """Holds back compiler processes that start while the system is short of memory, and stops the newest compile
+    when memory runs out anyway, so the build can be run again with fewer jobs"""
+
+    def __init__(self, pid, job_memory=DEFAULT_JOB_MEMORY, on_event=None, interval=1.0):
+        self.pid = pid
+        self.job_memory = job_memory
+        self.on_event = on_event
+        self.interval = interval
+        self.held = []
+        self.seen = set()
+        self.pauses = 0
+        self.kills = 0
+        self.stopped = threading.Event()
+        self.thread = None
+        
+        total, _ = get_memory_info()
+        # Hold new compiles below the low watermark, release one once a job fits above it, kill below the critical one
+        self.low_watermark = max(512 * 1024 ** 2, int((total or 0) * 0.05))
+        self.high_watermark = self.low_watermark + job_memory
+        self.critical_watermark = self.low_watermark // 2
+
+    @property
+    def available(self):
+        return PROCESS_TREE_SUPPORTED and hasattr(signal, "SIGSTOP")
+
+    def start(self):
+        if self.available:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop watching and release everything still held"""
+        self.stopped.set()
+        if self.thread:
+            self.thread.join()
+        while self.held:
+            self._release(self.held.pop(0))
+
+    def _emit(self, text):
+        if self.on_event:
+            self.on_event(text)
+
+    def _release(self, process):
+        try:
+            os.kill(process.pid, signal.SIGCONT)
+        except OSError:
+            pass
+
+    def _resume_oldest(self, reason):
+        process = min(self.held, key=lambda p: p.started)
+        self.held.remove(process)
+        self._release(process)
+        self._emit(f"Resuming {process.name} (pid {process.pid}), {reason}\n")
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            self.poll()
+            
+    def poll(self):
+        """Check memory once and hold, kill or release compiler processes"""
+        _, available = get_memory_info()
+        if available is None:
+            return
+            
+        compilers = [p for p in list_process_tree(self.pid) if p.name in COMPILER_PROCESS_NAMES]
+        # Processes that finished while held are forgotten
+        alive = {p.pid for p in compilers}
+        self.held = [p for p in self.held if p.pid in alive]
+        held_pids = {p.pid for p in self.held}
+        started = [p for p in compilers if p.pid not in self.seen]
+        self.seen |= alive
+        running = [p for p in compilers if p.pid not in held_pids]
+                
+        if self.held and not running:
+            # Nothing else is left to finish and free memory, Nuitka would wait on the held compile forever
+            self._resume_oldest(f"{format_size(available)} available and nothing else compiling")
+        elif available < self.low_watermark:
+            # A stopped process keeps its memory, only compiles that just started and hold little are stopped,
+            # which lowers the number of compiles running at the same time
+            for process in sorted(started, key=lambda p: p.started, reverse=True):
+                if len(running) <= 1:
+                    break
+                try:
+                    os.kill(process.pid, signal.SIGSTOP)
+                except OSError:
+                    continue
+                running.remove(process)
+                self.held.append(process)
+                self.pauses += 1
+                self._emit(f"Memory pressure: {format_size(available)} available, holding back {process.name} "
+                           f"(pid {process.pid}) until memory recovers\n")
+            
+            # Killing frees the memory, the failed compile is done again when the build is retried
+            if available < self.critical_watermark and len(running) > 1:
+                victim = max(running, key=lambda p: p.started)
+                try:
+                    os.kill(victim.pid, signal.SIGKILL)
+                except OSError:
+                    return
+                self.kills += 1
+                self._emit(f"Memory exhausted: {format_size(available)} available, stopping {victim.name} "
+                           f"(pid {victim.pid}, {format_size(victim.rss)}), the build is retried with fewer jobs\n")
+        elif available > self.high_watermark and self.held:
+            self._resume_oldest(f"memory recovered, {format_size(available)} available")
+
+
+class BuildProfile:
+    """Per-phase timing, memory and CPU profile of a finished build"""
+
+    SUFFIX = ".build-profile.json"
+
+    def __init__(self, data):
+        self.data = data
+
+    @classmethod
+    def from_job(cls, job, monitor=None):
+        start = job.start_time
+        end = job.end_time or time.time()
+        samples = monitor.samples if monitor else []
+        cpus = os.cpu_count() or 1
+        
+        phases = []
+        for index, (phase, started) in enumerate(job.phase_history):
+            ended = job.phase_history[index + 1][1] if index + 1 < len(job.phase_history) else end
+            entry = {
+                "phase": phase,
+                "label": PHASE_LABELS.get(phase, "Initialization"),
+                "start": round(started - start, 3),
+                "end": round(ended - start, 3),
+                "duration": round(ended - started, 3),
+                "lines": job.phase_line_counts[index] if index < len(job.phase_line_counts) else 0,
+                "peak_rss": None,
+                "cpu_seconds": None
+            }
+            if samples:
+                entry["peak_rss"] = monitor.peak_rss(started, ended)
+                entry["cpu_seconds"] = round(monitor.cpu_at(ended) - monitor.cpu_at(started), 3)
+            phases.append(entry)
+        
+        duration = end - start
+        cpu_seconds = round(max(value for _, _, value in samples), 3) if samples else None
+        return cls({
+            "script": os.path.abspath(job.script_path),
+            "command": job.command(),
+            "status": job.status,
+            "returncode": job.returncode,
+            "started_at": start,
+            "finished_at": end,
+            "duration": round(duration, 3),
+            "lines": job.line_count,
+            "phases": phases,
+            "phase_durations": {phase: round(seconds, 3) for phase, seconds in job.phase_durations().items()},
+            "peak_rss": monitor.peak_rss() if samples else None,
+            "cpu_seconds": cpu_seconds,
+            "cpu_count": cpus,
+            "cpu_utilization": round(cpu_seconds / (duration * cpus), 3) if cpu_seconds and duration else None,
+            "sample_interval": monitor.interval if monitor else None,
+            "jobs": job.jobs,
+            "memory_pauses": job.memory_pauses,
+            "memory_kills": job.memory_kills,
+            "farm": job.farm_stats,
+            "compiler_cache": job.compiler_cache_stats
+        })
+
+    def save(self, output_dir):
+        """Write the profile next to the build output, returns its path"""
+        stem = os.path.splitext(os.path.basename(self.data["script"]))[0]
+        path = os.path.join(output_dir, stem + self.SUFFIX)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=2)
+        return path
+
+    def summary(self):
+        """Describe where the build time went, slowest phases first"""
+        data = self.data
+        duration = data["duration"] or 1
+        phases = sorted(data["phase_durations"].items(), key=lambda item: -item[1])
+        parts = [
+            f"{PHASE_SHORT_NAMES.get(phase, phase)} {format_duration(seconds)} ({seconds * 100 / duration:.0f}%)"
+            for phase, seconds in phases if seconds >= 0.05 * duration
+        ]
+        lines = [f"Build time {format_duration(data['duration'])}: " + ", ".join(parts)]
+        
+        resources = []
+        if data["peak_rss"]:
+            resources.append(f"peak memory {format_size(data['peak_rss'])}")
+        if data["cpu_utilization"] is not None:
+            busy = data["cpu_seconds"] / duration
+            resources.append(f"CPU {data['cpu_utilization'] * 100:.0f}% of {data['cpu_count']} cores "
+                             f"({busy:.1f} busy on average)")
+        if resources:
+            text = ", ".join(resources)
+            lines.append(text[0].upper() + text[1:])
+        return lines
+
+
+class BuildBenchmark:
+    """Size breakdown and startup times of a build artifact, next to the script run by CPython"""
+
+    def __init__(self, script_path, options, output_dir, runs=BENCHMARK_RUNS, timeout=BENCHMARK_TIMEOUT,
+                 onefile_build_id=None):
+        self.script_path = os.path.abspath(script_path)
+        self.module = "--module" in options
+        self.runs = runs
+        self.timeout = timeout
+        self.onefile_build_id = onefile_build_id
+        self.artifact, self.bundle = find_build_artifact(output_dir, script_path, options)
+
+    def forget_extraction(self):
+        """Drop the cached onefile extraction, so the first run measures the unpacking as a first launch does"""
+        if not self.onefile_build_id:
+            return None
+        OnefileCache.forget(self.artifact, self.onefile_build_id)
+        return OnefileCache.extraction_dir(self.artifact, self.onefile_build_id)
+
+    def run(self):
+        """Measure the artifact, returns the result dictionary"""
+        result = {"finished_at": time.time(), "artifact": self.artifact}
+        result.update(self.measure_size(self.bundle))
+        if self.runs <= 0:
+            return result
+        
+        # The interpreter Nuitka runs with, the script is timed under it as the baseline
+        python = shutil.which("python") or sys.executable
+        if self.module:
+            name = os.path.splitext(os.path.basename(self.script_path))[0]
+            command = [python, "-c", f"import {name}"]
+        else:
+            command = [self.artifact]
+            extraction = self.forget_extraction()
+            if extraction:
+                result["onefile_extraction"] = extraction
+        result["startup"] = self.measure_startup(command, os.path.dirname(self.artifact), self.bundle)
+        result["python_startup"] = self.measure_startup([python, self.script_path],
+                                                        os.path.dirname(self.script_path), self.script_path)
+        return result
+
+    @staticmethod
+    def _entry_name(name):
+        """Name of a bundled module without the platform tag of extension modules"""
+        for suffix in sorted(importlib.machinery.EXTENSION_SUFFIXES, key=len, reverse=True):
+            if name.endswith(suffix) and len(name) > len(suffix):
+                return name[:-len(suffix)]
+        return name
+
+    @classmethod
+    def measure_size(cls, bundle, top=BENCHMARK_TOP_ENTRIES):
+        """Return the size of the artifact and of its largest bundled modules, extensions and libraries"""
+        if not os.path.isdir(bundle):
+            size = os.path.getsize(bundle)
+            return {"size": size, "files": 1, "breakdown": [[os.path.basename(bundle), size]]}
+        
+        # Packages count as a whole, they are what gets added or dropped
+        entries = collections.Counter()
+        files = 0
+        for dirpath, _, names in os.walk(bundle):
+            for name in names:
+                path = os.path.join(dirpath, name)
+                try:
+                    size = os.lstat(path).st_size
+                except OSError:
+                    continue
+                entries[cls._entry_name(os.path.relpath(path, bundle).split(os.sep)[0])] += size
+                files += 1
+        
+        breakdown = [[name, size] for name, size in entries.most_common(top)]
+        rest = sum(entries.values()) - sum(size for _, size in breakdown)
+        if rest:
+            breakdown.append([f"{len(entries) - len(breakdown)} more", rest])
+        return {"size": sum(entries.values()), "files": files, "breakdown": breakdown}
+
+    def measure_startup(self, command, cwd, evict=None):
+        """Time complete runs of a program without arguments, the first one with its files out of the page cache"""
+        times = []
+        returncode = None
+        evicted = False
+        for index in range(self.runs):
+            if index == 0 and evict:
+                evicted = evict_page_cache(evict)
+            start = time.perf_counter()
+            try:
+                process = ProcessSupervisor.shared().spawn(
+                    command, timeout=self.timeout, cwd=cwd, stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **PROCESS_GROUP_OPTIONS)
+            except OSError as e:
+                return {"error": str(e)}
+            returncode = process.wait()
+            elapsed = time.perf_counter() - start
+            if process.timed_out:
+                return {"error": f"still running after {format_duration(self.timeout)}"}
+            times.append(elapsed)
+        
+        warm = sorted(times[1:]) or times
+        return {"cold": round(times[0], 4), "warm": round(warm[len(warm) // 2], 4), "runs": len(times),
+                "returncode": returncode, "cold_evicted": evicted}
+
+    @staticmethod
+    def regressions(result, previous):
+        """Compare a result with the previous benchmark of the project, returns a line per regression"""
+        if not previous:
+            return []
+        lines = []
+        
+        size, before = result["size"], previous.get("size")
+        if before and size > before * (1 + BENCHMARK_SIZE_TOLERANCE):
+            old = dict(previous.get("breakdown") or [])
+            growth = sorted(((size_now - old.get(name, 0), name) for name, size_now in result["breakdown"]),
+                            reverse=True)
+            grown = ", ".join(f"{name} +{format_size(delta)}" for delta, name in growth[:3] if delta > 0)
+            lines.append(f"Size regression: {format_size(before)} -> {format_size(size)} "
+                         f"(+{(size / before - 1) * 100:.0f}%)" + (f", grew: {grown}" if grown else ""))
+        
+        # The cold start depends too much on the rest of the system to be compared
+        now = (result.get("startup") or {}).get("warm")
+        then = (previous.get("startup") or {}).get("warm")
+        if now and then and now > then * (1 + BENCHMARK_STARTUP_TOLERANCE) and now - then > BENCHMARK_STARTUP_MIN_DELTA:
+            lines.append(f"Startup regression: warm start {then * 1000:.0f} ms -> {now * 1000:.0f} ms "
+                         f"(+{(now / then - 1) * 100:.0f}%)")
+        return lines
+
+    @staticmethod
+    def summary(result):
+        """Describe a benchmark result in a few lines"""
+        largest = ", ".join(f"{name} {format_size(size)}" for name, size in result["breakdown"][:5])
+        lines = [f"Size {format_size(result['size'])} in {result['files']} file{'s' if result['files'] != 1 else ''}"
+                 + (f": {largest}" if result["files"] > 1 else "")]
+        
+        startup = result.get("startup")
+        if result.get("onefile_extraction"):
+            lines.append(f"Onefile extraction cached in {result['onefile_extraction']}, "
+                         f"the cold start includes unpacking it")
+        if startup and "error" in startup:
+            lines.append(f"Startup not measured: {startup['error']}")
+        elif startup:
+            text = (f"Startup over {startup['runs']} runs: cold {startup['cold'] * 1000:.0f} ms, "
+                    f"warm {startup['warm'] * 1000:.0f} ms")
+            python = result.get("python_startup") or {}
+            if "warm" in python and startup["warm"] and python["warm"]:
+                ratio = python["warm"] / startup["warm"]
+                comparison = f"{ratio:.1f}x faster" if ratio >= 1 else f"{1 / ratio:.1f}x slower"
+                text += (f"; CPython cold {python['cold'] * 1000:.0f} ms, warm {python['warm'] * 1000:.0f} ms "
+                         f"({comparison} than CPython)")
+            lines.append(text)
+            if startup["returncode"]:
+                lines.append(f"The program exited with code {startup['returncode']} when started without arguments")
+        
+        lines.extend(result.get("regressions", []))
+        return lines
+
+
+class SupervisedProcess:
+    """A child process run by the supervisor, with the Popen methods its callers use"""
+
+    def __init__(self, supervisor, args, on_output=None, on_exit=None, timeout=None, shell=False, options=None):
+        self.supervisor = supervisor
+        self.args = args
+        self.on_output = on_output
+        self.on_exit = on_exit
+        self.timeout = timeout
+        self.shell = shell
+        self.options = options or {}
+        self.process = None
+        self.pid = None
+        self.returncode = None
+        self.timed_out = False
+        self.done = threading.Event()
+        self._timer = None
+        # Input is written by the loop, 'process.stdin.write' keeps working for the callers
+        self.stdin = self
+
+    async def _start(self):
+        options = dict(stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        options.update(self.options)
+        if self.shell:
+            self.process = await asyncio.create_subprocess_shell(self.args, **options)
+        else:
+            self.process = await asyncio.create_subprocess_exec(*self.args, **options)
+        self.pid = self.process.pid
+        if self.timeout:
+            self._timer = self.supervisor.loop.call_later(self.timeout, self._expire)
+        self.supervisor.loop.create_task(self._supervise())
+
+    async def _supervise(self):
+        try:
+            if self.process.stdout is not None:
+                await self._read()
+            returncode = await self.process.wait()
+        finally:
+            if self._timer:
+                self._timer.cancel()
+        self.returncode = returncode
+        self.done.set()
+        self.supervisor.processes.discard(self)
+        self._call(self.on_exit, returncode)
+
+    async def _read(self):
+        """Read the output in large chunks and deliver the complete lines of each chunk at once"""
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        pending = ""
+        while True:
+            chunk = await self.process.stdout.read(SUPERVISOR_CHUNK_SIZE)
+            text = pending + decoder.decode(chunk, final=not chunk)
+            # Universal newlines like text mode Popen, a trailing '\r' may still become '\r\n'
+            if chunk and text.endswith("\r"):
+                text, carry = text[:-1], "\r"
+            else:
+                carry = ""
+            parts = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+            pending = parts.pop() + carry
+            lines = [part + "\n" for part in parts]
+            if not chunk and pending:
+                lines.append(pending)
+            if lines:
+                self._call(self.on_output, lines)
+            if not chunk:
+                return
+
+    def _call(self, callback, value):
+        # A failing callback must not stop the supervision of the process
+        if callback:
+            try:
+                callback(value)
+            except Exception:
+                pass
+
+    def _expire(self):
+        self.timed_out = True
+        self._stop()
+
+    def _stop(self):
+        """Terminate, and kill if it is still running after the grace period"""
+        self._signal(signal.SIGTERM)
+        self.supervisor.loop.call_later(SUPERVISOR_KILL_GRACE, self._signal, getattr(signal, "SIGKILL", signal.SIGTERM))
+
+    def _signal(self, signum):
+        if self.returncode is not None:
+            return
+        try:
+            # A process started in its own session takes its children along,
+            # they would otherwise keep the output pipe open after it exits
+            if self.options.get("start_new_session") and hasattr(os, "killpg"):
+                os.killpg(self.pid, signum)
+                # Processes paused for memory only see the signal once they run again
+                if signum == signal.SIGTERM:
+                    os.killpg(self.pid, signal.SIGCONT)
+            elif self.options.get("creationflags", 0) & getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0):
+                # Windows has no process groups to signal, taskkill walks the tree instead
+                self.supervisor.loop.create_task(asyncio.create_subprocess_exec(
+                    "taskkill", "/T", "/F", "/PID", str(self.pid),
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+            elif self.process.returncode is None:
+                self.process.send_signal(signum)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def _write(self, data):
+        try:
+            self.process.stdin.write(data)
+        except (AttributeError, OSError, RuntimeError):
+            pass
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        """Wait until the process exited and its output was delivered"""
+        if not self.done.wait(timeout):
+            raise subprocess.TimeoutExpired(self.args, timeout)
+        return self.returncode
+
+    def send_signal(self, signum):
+        self.supervisor.loop.call_soon_threadsafe(self._signal, signum)
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(getattr(signal, "SIGKILL", signal.SIGTERM))
+
+    def cancel(self):
+        """Stop the process, killing it when it ignores the request"""
+        self.supervisor.loop.call_soon_threadsafe(self._stop)
+
+    def write(self, text):
+        """Send input to the process"""
+        self.supervisor.loop.call_soon_threadsafe(self._write, text.encode("utf-8"))
+
+    def flush(self):
+        pass
+
+
+class ProcessSupervisor:
+    """One asyncio event loop in a background thread supervising all child processes"""
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.processes = set()
+        self.thread = threading.Thread(target=self._run, name="compyler-supervisor", daemon=True)
+        self.thread.start()
+
+    @classmethod
+    def shared(cls):
+        """Return the supervisor of this process, started on first use"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def spawn(self, args, on_output=None, on_exit=None, timeout=None, shell=False, **options):
+        """Start a process, output goes to on_output as lists of lines, raises OSError when it can't start"""
+        process = SupervisedProcess(self, args, on_output, on_exit, timeout, shell, options)
+        asyncio.run_coroutine_threadsafe(process._start(), self.loop).result()
+        self.processes.add(process)
+        return process
+
+    def cancel_all(self):
+        """Stop every process still running"""
+        for process in list(self.processes):
+            process.cancel()
+
+
+class PoolTask:
+    """A command running on a worker of the pool"""
+
+    def __init__(self, command, on_output=None, on_exit=None):
+        self.command = command
+        self.on_output = on_output
+        self.on_exit = on_exit
+        self.worker = None
+        self.returncode = None
+        self.done = threading.Event()
+
+    @property
+    def running(self):
+        return not self.done.is_set()
+
+    def write(self, text):
+        """Send input to the command"""
+        self.worker.stdin.write(text)
+        self.worker.stdin.flush()
+
+    def cancel(self):
+        """Stop the command, its worker is discarded"""
+        if self.running and self.worker:
+            self.worker.close()
+
+    def _output(self, text):
+        if self.on_output:
+            self.on_output(text)
+
+    def _finish(self, returncode):
+        # Waiters wake up once the pool took note of the new working directory
+        self.returncode = returncode
+        try:
+            if self.on_exit:
+                self.on_exit(returncode)
+        finally:
+            self.done.set()
+
+
+class ShellWorker:
+    """A persistent shell running one command at a time, the end is marked by a sentinel line"""
+
+    def __init__(self):
+        self.sentinel = f"__compyler_done_{secrets.token_hex(8)}__"
+        # The shell reads commands and the commands read input from separate pipes,
+        # so input typed early can't be taken for a command or the other way around
+        command_read, command_write = os.pipe()
+        input_read, input_write = os.pipe()
+        self.task = None
+        self.cwd = None
+        self.pending = ""
+        self.last_used = time.time()
+        try:
+            self.process = ProcessSupervisor.shared().spawn(
+                ["/bin/sh", f"/dev/fd/{command_read}"],
+                self._read,
+                self._exited,
+                stdin=input_read,
+                pass_fds=(command_read,),
+                start_new_session=True
+            )
+        finally:
+            os.close(command_read)
+            os.close(input_read)
+        self.commands = os.fdopen(command_write, "w", buffering=1)
+        self.stdin = os.fdopen(input_write, "w", buffering=1)
+
+    @property
+    def alive(self):
+        return self.process.poll() is None
+
+    @property
+    def busy(self):
+        return self.task is not None
+
+    def run(self, task, cwd):
+        """Start a command, eval keeps a syntax error from swallowing the sentinel"""
+        self.task = task
+        task.worker = self
+        self.commands.write(f"cd {shlex.quote(cwd)} 2>/dev/null; eval {shlex.quote(task.command)}\n"
+                            f"printf '\\n%s %d %s\\n' {self.sentinel} $? \"$PWD\"\n")
+
+    def _read(self, lines):
+        """Route a batch of output lines to the running command, called by the supervisor"""
+        batch = []
+        for line in lines:
+            index = line.find(self.sentinel)
+            if index < 0:
+                # The newline printed before the sentinel is held back until the next line
+                if self.pending:
+                    batch.append(self.pending)
+                self.pending = line if line == "\n" else ""
+                if not self.pending:
+                    batch.append(line)
+                continue
+            
+            # Output not ending in a newline shares the line with the sentinel
+            if self.pending and index > 0:
+                batch.append(self.pending)
+            if index > 0:
+                batch.append(line[:index])
+            self.pending = ""
+            status, _, cwd = line[index + len(self.sentinel):].strip().partition(" ")
+            self.cwd = cwd or self.cwd
+            task, self.task = self.task, None
+            self.last_used = time.time()
+            if task:
+                if batch:
+                    task._output(batch)
+                task._finish(int(status) if status.lstrip("-").isdigit() else 1)
+            batch = []
+        
+        if batch and self.task:
+            self.task._output(batch)
+
+    def _exited(self, returncode):
+        # 'exit' or a kill ends the shell together with its command
+        if self.task:
+            task, self.task = self.task, None
+            task._finish(returncode)
+
+    def close(self):
+        """Stop the shell and whatever it is running"""
+        if not self.alive:
+            return
+        try:
+            os.killpg(self.process.pid, signal.SIGTERM)
+        except OSError:
+            self.process.terminate()
+
+
+class PythonWorker:
+    """A persistent Python interpreter that forks a warm child for every request"""
+
+    def __init__(self, python="python", preload=("nuitka",)):
+        self.python = python
+        self.ids = itertools.count(1)
+        self.replies = queue.Queue()
+        self.busy = False
+        self.last_used = time.time()
+        # Files of the preloaded modules and their state once imported, None until the worker reports them
+        self.preloaded = None
+        self.process = ProcessSupervisor.shared().spawn(
+            [python, "-u", "-c", PYTHON_WORKER_SOURCE] + list(preload),
+            self._read,
+            lambda returncode: self.replies.put(None),
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+
+    @property
+    def alive(self):
+        return self.process.poll() is None
+
+    @property
+    def stale(self):
+        """Whether a preloaded module was reinstalled since the worker imported it, e.g. by pip install -U"""
+        preloaded = self.preloaded
+        return bool(preloaded) and any(self._stamp(path) != stamp for path, stamp in preloaded.items())
+
+    @staticmethod
+    def _stamp(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+    def _read(self, lines):
+        for line in lines:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if "preloaded" in message:
+                self.preloaded = {path: self._stamp(path) for path in message["preloaded"]}
+            else:
+                self.replies.put(message)
+
+    def run(self, args, timeout=None):
+        """Run 'python ARGS' in a forked child, returns (returncode, output)"""
+        request_id = next(self.ids)
+        self.process.write(json.dumps({"id": request_id, "args": list(args)}) + "\n")
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            try:
+                reply = self.replies.get(timeout=None if deadline is None else max(0, deadline - time.time()))
+            except queue.Empty:
+                self.close()
+                raise subprocess.TimeoutExpired(args, timeout)
+            if reply is None:
+                raise OSError("the Python worker exited")
+            if reply.get("id") == request_id:
+                self.last_used = time.time()
+                return reply["returncode"], reply["output"]
+
+    def close(self):
+        if not self.alive:
+            return
+        try:
+            os.killpg(self.process.pid, signal.SIGTERM)
+        except OSError:
+            self.process.terminate()
+
+
+class WorkerPool:
+    """Bounded pool of warm shell and Python workers for terminal commands and toolchain probes"""
+
+    def __init__(self, size=WORKER_POOL_SIZE, idle_timeout=WORKER_IDLE_TIMEOUT, python="python"):
+        self.size = max(1, size)
+        self.idle_timeout = idle_timeout
+        self.python = python
+        self.shells = []
+        self.pythons = []
+        self.cwd = os.getcwd()
+        self.lock = threading.Lock()
+        self.closed = False
+        threading.Thread(target=self._reap, daemon=True).start()
+
+    def warm(self):
+        """Start one worker of each kind ahead of the first request"""
+        if not WORKERS_SUPPORTED:
+            return
+        def start():
+            try:
+                shell = ShellWorker()
+                python = PythonWorker(self.python)
+            except OSError:
+                return
+            with self.lock:
+                self.shells.append(shell)
+                self.pythons.append(python)
+        threading.Thread(target=start, daemon=True).start()
+
+    def run_shell(self, command, on_output=None, on_exit=None):
+        """Run a command line on an idle shell, returns its PoolTask"""
+        task = PoolTask(command, on_output, lambda returncode: self._shell_done(task, returncode, on_exit))
+        if not WORKERS_SUPPORTED:
+            return self._run_once(task)
+        
+        # Workers are started outside the lock, the supervisor may be waiting for it
+        with self.lock:
+            self.shells = [shell for shell in self.shells if shell.alive]
+            shell = next((shell for shell in self.shells if not shell.busy), None)
+            if shell is not None:
+                shell.task = task
+        if shell is None:
+            shell = ShellWorker()
+            with self.lock:
+                # Beyond the bound the shell only lives for this command
+                if len(self.shells) < self.size:
+                    self.shells.append(shell)
+        shell.run(task, self.cwd)
+        return task
+
+    def _shell_done(self, task, returncode, on_exit):
+        """Keep 'cd' in effect for the next command, whichever shell runs it"""
+        worker = task.worker
+        if worker is not None:
+            if worker.cwd:
+                self.cwd = worker.cwd
+            with self.lock:
+                if worker not in self.shells:
+                    worker.close()
+        if on_exit:
+            on_exit(returncode)
+
+    def _run_once(self, task):
+        """Run the command on a fresh shell, for platforms without pooled workers"""
+        process = ProcessSupervisor.shared().spawn(task.command, task._output, task._finish, shell=True, cwd=self.cwd)
+        task.worker = argparse.Namespace(process=process, stdin=process, close=process.cancel)
+        return task
+
+    def run_python(self, args, timeout=None):
+        """Run 'python ARGS' on a warm interpreter, returns (returncode, output)"""
+        if not WORKERS_SUPPORTED:
+            result = subprocess.run([self.python] + list(args), capture_output=True, text=True, timeout=timeout)
+            return result.returncode, result.stdout + result.stderr
+        
+        with self.lock:
+            # A worker with an outdated Nuitka would report the old version, busy ones are closed when done
+            for worker in self.pythons:
+                if worker.stale and not worker.busy:
+                    worker.close()
+            self.pythons = [worker for worker in self.pythons if worker.alive and not worker.stale]
+            worker = next((worker for worker in self.pythons if not worker.busy), None)
+            if worker is not None:
+                worker.busy = True
+        if worker is None:
+            worker = PythonWorker(self.python)
+            worker.busy = True
+            with self.lock:
+                if len(self.pythons) < self.size:
+                    self.pythons.append(worker)
+        try:
+            return worker.run(args, timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            return -1, ""
+        finally:
+            worker.busy = False
+            with self.lock:
+                if worker not in self.pythons:
+                    worker.close()
+
+    def _reap(self):
+        """Stop workers that have been idle longer than the timeout"""
+        while not self.closed:
+            time.sleep(min(10, self.idle_timeout))
+            now = time.time()
+            with self.lock:
+                for workers in (self.shells, self.pythons):
+                    for worker in list(workers):
+                        if not worker.alive or (not worker.busy and now - worker.last_used > self.idle_timeout):
+                            worker.close()
+                            workers.remove(worker)
+
+    def describe(self):
+        """Describe the workers of the pool"""
+        now = time.time()
+        lines = [f"Worker pool: up to {self.size} shells and {self.size} Python interpreters, "
+                 f"idle ones stop after {format_duration(self.idle_timeout)}"]
+        if not WORKERS_SUPPORTED:
+            lines.append("  Commands start a new shell on this platform")
+        with self.lock:
+            for kind, workers in (("shell", self.shells), ("python", self.pythons)):
+                for worker in workers:
+                    state = "busy" if worker.busy else f"idle {format_duration(now - worker.last_used)}"
+                    lines.append(f"  {kind} pid {worker.process.pid}: {state}")
+        lines.append(f"  Working directory: {self.cwd}")
+        return lines
+
+    def shutdown(self):
+        """Stop all workers"""
+        self.closed = True
+        with self.lock:
+            for worker in self.shells + self.pythons:
+                worker.close()
+            self.shells, self.pythons = [], []
+
+
+class ToolchainProbe:
+    """Detects Nuitka, Python, the C compiler and ccache in the background"""
+
+    def __init__(self, python="python", cache_path=None, pool=None):
+        self.python = python
+        self.pool = pool
+        self.cache_path = cache_path or os.path.join(APP_DATA_DIR, "toolchain.json")
+        self.result = None
+        self.fresh = False
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+        self.thread = None
+        self.callbacks = []
+
+    def interpreter_key(self):
+        """Identify the interpreter by its resolved path and modification time"""
+        path = shutil.which(self.python) or sys.executable
+        path = os.path.realpath(path)
+        try:
+            mtime = int(os.stat(path).st_mtime)
+        except OSError:
+            mtime = 0
+        return f"{path}:{mtime}", path
+
+    def start(self):
+        """Load the cached result for the current interpreter and refresh it asynchronously"""
+        key, _ = self.interpreter_key()
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                self.result = json.load(f).get(key)
+        except (OSError, ValueError):
+            self.result = None
+        self.refresh()
+
+    def refresh(self):
+        """Probe the toolchain again in a background thread"""
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.fresh = False
+            self.done.clear()
+            self.thread = threading.Thread(target=self._refresh, daemon=True)
+            self.thread.start()
+
+    def _refresh(self):
+        try:
+            result = self.probe()
+        except Exception as e:
+            result = dict(self.result or {}, error=str(e))
+        
+        with self.lock:
+            self.result = result
+            self.fresh = True
+            callbacks, self.callbacks = self.callbacks, []
+        self.done.set()
+        
+        # A Compile waiting for the result must hear about it even if it can't be cached
+        try:
+            self._save(result)
+        finally:
+            for callback in callbacks:
+                callback(result)
+
+    def _save(self, result):
+        # A failed first probe has nothing to be cached under
+        if "key" not in result:
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        
+        data[result["key"]] = result
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = self.cache_path + f".{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def when_ready(self, callback):
+        """Call back with a fresh result, immediately if one is available"""
+        with self.lock:
+            if not self.fresh:
+                self.callbacks.append(callback)
+                return
+        callback(self.result)
+
+    def wait(self, timeout=None):
+        """Block until the running probe finishes, returns the latest result"""
+        self.done.wait(timeout)
+        return self.result or {}
+
+    def _first_line(self, command):
+        """Run a short command and return the first line of its output"""
+        try:
+            if self.pool is not None and command[0] == self.python:
+                _, output = self.pool.run_python(command[1:], timeout=10)
+            else:
+                result = subprocess.run(command, capture_output=True, text=True, timeout=10)
+                output = result.stdout or result.stderr
+        except (OSError, subprocess.SubprocessError):
+            return ""
+        output = output.strip()
+        return output.splitlines()[0] if output else ""
+
+    def probe(self):
+        """Detect the toolchain, this blocks for a few seconds"""
+        key, interpreter = self.interpreter_key()
+        result = {
+            "key": key,
+            "interpreter": interpreter,
+            "python_version": self._first_line([self.python if self.pool else interpreter, "--version"]),
+            "nuitka_version": get_nuitka_version(self.pool),
+            "c_compiler": None,
+            "c_compiler_version": "",
+            "ccache": None,
+            "ccache_version": "",
+            "probed_at": time.time()
+        }
+        result["nuitka_installed"] = bool(result["nuitka_version"])
+        
+        # C compiler, an explicit CC wins like it does for Nuitka
+        candidates = [os.environ["CC"]] if os.environ.get("CC") else []
+        candidates += ["cl", "gcc", "clang"] if sys.platform == "win32" else ["gcc", "clang", "cc"]
+        for candidate in candidates:
+            path = shutil.which(candidate)
+            if path:
+                result["c_compiler"] = path
+                # MSVC prints its banner without arguments
+                is_msvc = os.path.basename(path).lower().startswith("cl")
+                result["c_compiler_version"] = self._first_line([path] if is_msvc else [path, "--version"])
+                break
+        
+        # Compiler cache
+        path = find_compiler_cache()
+        if path:
+            result["ccache"] = path
+            result["ccache_version"] = self._first_line([path, "--version"])
+        
+        return result
+
+    def describe(self):
+        """Return a human readable summary of the detected toolchain"""
+        result = self.result or {}
+        nuitka = result.get("nuitka_version", "").splitlines()
+        lines = [
+            f"Nuitka: {nuitka[0] if nuitka else 'not installed'}",
+            f"Python: {result.get('python_version') or 'unknown'} ({result.get('interpreter', self.python)})",
+            f"C compiler: {result.get('c_compiler_version') or 'not found'}"
+            + (f" ({result['c_compiler']})" if result.get("c_compiler") else ""),
+            f"ccache: {result.get('ccache_version') or 'not found'}"
+            + (f" ({result['ccache']})" if result.get("ccache") else "")
+        ]
+        return lines
+
+
+def parse_address(address, default_port=FARM_DEFAULT_PORT):
+    """Split 'host:port' into a host and a port number"""
+    host, _, port = address.strip().rpartition(":")
+    if not host:
+        return port.strip("[]"), default_port
+    return host.strip("[]"), int(port)
+
+
+def parse_farm_workers(text):
+    """Parse a comma separated list of build farm workers, such as 'local:4, build1:7700'"""
+    return [spec.strip() for spec in re.split(r"[,\s]+", text or "") if spec.strip()]
+
+
+def send_message(sock, message):
+    """Send one length-prefixed JSON message of the build farm protocol"""
+    data = json.dumps(message).encode("utf-8")
+    sock.sendall(len(data).to_bytes(4, "big") + data)
+
+
+def _receive_exactly(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1024 * 1024))
+        if not chunk:
+            raise ConnectionError("connection closed in the middle of a message")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def receive_message(sock):
+    """Receive one length-prefixed JSON message of the build farm protocol"""
+    size = int.from_bytes(_receive_exactly(sock, 4), "big")
+    if size > FARM_MAX_MESSAGE:
+        raise ValueError(f"build farm message of {format_size(size)} is too large")
+    return json.loads(_receive_exactly(sock, size).decode("utf-8"))
+
+
+def farm_request(address, message, timeout=None):
+    """Send a request to a farm coordinator or worker and return its reply"""
+    with socket.create_connection(parse_address(address), timeout=10) as sock:
+        sock.settimeout(timeout)
+        send_message(sock, message)
+        return receive_message(sock)
+
+
+def pack_data(data):
+    """Compress binary data for a JSON message, preprocessed C shrinks to a fraction"""
+    return base64.b64encode(zlib.compress(data, 1)).decode("ascii")
+
+
+def unpack_data(text):
+    return zlib.decompress(base64.b64decode(text))
+
+
+def compiler_version(compiler):
+    """Return the first line of 'compiler --version', or an empty string"""
+    try:
+        result = subprocess.run([compiler, "--version"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    output = result.stdout.strip()
+    return output.splitlines()[0] if output else ""
+
+
+def split_compile_args(args):
+    """Split a compiler command line into local preprocessing and remote compiling
+
+    Returns (preprocess_args, remote_args, source, output, language), or None when the
+    command is not the compilation of a single unit a worker can take.
+    """
+    if "-c" not in args:
+        return None
+    preprocess, remote, sources, output = [], [], [], None
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        if arg in ("-o",) + FARM_PREPROCESSOR_OPTIONS:
+            if index + 1 >= len(args):
+                return None
+            if arg == "-o":
+                output = args[index + 1]
+            else:
+                preprocess += [arg, args[index + 1]]
+            index += 1
+        elif arg.startswith(("-I", "-D", "-U")):
+            preprocess.append(arg)
+        elif not arg.startswith("-"):
+            sources.append(arg)
+        elif FARM_REMOTE_OPTION.match(arg):
+            # Options like -O2 or -std= also define macros, the preprocessor needs them too
+            preprocess.append(arg)
+            remote.append(arg)
+        elif arg != "-c":
+            return None
+        index += 1
+
+    if len(sources) != 1:
+        return None
+    language = FARM_SOURCE_LANGUAGES.get(os.path.splitext(sources[0])[1].lower())
+    if language is None:
+        return None
+    if output is None:
+        output = os.path.splitext(os.path.basename(sources[0]))[0] + ".o"
+    return preprocess, remote, sources[0], output, language
+
+
+def write_farm_wrapper():
+    """Write the 'gcc' wrapper that sends compilations to the build farm, returns its path"""
+    if os.name == "nt":
+        raise OSError("the build farm compiler wrapper needs a POSIX system")
+    path = os.path.join(FARM_WRAPPER_DIR, "gcc")
+    script = (f"#!/bin/sh\n"
+              f"exec {shlex.quote(sys.executable)} {shlex.quote(os.path.abspath(__file__))} farm-cc \"$@\"\n")
+
+    # Rewriting it every build would change its mtime and make ccache miss
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            current = f.read()
+    except OSError:
+        current = None
+    if current != script:
+        os.makedirs(FARM_WRAPPER_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(script)
+        os.chmod(path, 0o755)
+    return path
+
+
+def farm_compile(args):
+    """Entry point of the compiler wrapper: preprocess here, compile on the farm, returns the exit code"""
+    compiler = os.environ.get("COMPYLER_FARM_CC") or "gcc"
+    coordinator = os.environ.get("COMPYLER_FARM")
+
+    # Version checks, linking and anything unusual go to the real compiler unchanged
+    unit = split_compile_args(args) if coordinator else None
+    if unit is None:
+        return subprocess.call([compiler] + args)
+    preprocess_args, remote_args, source, output, language = unit
+
+    result = subprocess.run([compiler] + preprocess_args + ["-E", source], capture_output=True)
+    if result.stderr:
+        sys.stderr.write(result.stderr.decode("utf-8", "replace"))
+    if result.returncode != 0:
+        return result.returncode
+
+    try:
+        reply = farm_request(coordinator, {
+            "op": "compile",
+            "session": os.environ.get("COMPYLER_FARM_SESSION", ""),
+            "args": remote_args,
+            "language": language,
+            "name": os.path.basename(source),
+            "source": pack_data(result.stdout)
+        })
+    except (OSError, ValueError) as e:
+        reply = {"local": True, "error": str(e)}
+
+    # No free worker, or no farm at all: compile here with the original command
+    if reply.get("local") or "returncode" not in reply:
+        return subprocess.call([compiler] + args)
+
+    if reply.get("stderr"):
+        sys.stderr.write(reply["stderr"])
+    if reply["returncode"] == 0:
+        temporary = output + ".farm-tmp"
+        with open(temporary, "wb") as f:
+            f.write(unpack_data(reply["object"]))
+        os.replace(temporary, output)
+    return reply["returncode"]
+
+
+class FarmServer(socketserver.ThreadingTCPServer):
+    """Threaded TCP server handing every build farm request to a handler function"""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address, handle_message):
+        self.handle_message = handle_message
+        super().__init__(address, FarmRequestHandler)
+
+
+class FarmRequestHandler(socketserver.BaseRequestHandler):
+    """Reads one request from a connection and writes the reply"""
+
+    def handle(self):
+        try:
+            reply = self.server.handle_message(receive_message(self.request))
+        except (OSError, ValueError) as e:
+            reply = {"error": str(e)}
+        try:
+            send_message(self.request, reply)
+        except OSError:
+            pass
+
+
+class FarmWorker:
+    """Compiles preprocessed C units sent by build farm coordinators"""
+
+    def __init__(self, host="127.0.0.1", port=FARM_DEFAULT_PORT, slots=None, compiler=None, token=""):
+        self.slots = max(1, slots or os.cpu_count() or 1)
+        self.compiler = compiler or os.environ.get("CC") or "gcc"
+        self.version = compiler_version(self.compiler)
+        self.token = token
+        self.semaphore = threading.BoundedSemaphore(self.slots)
+        self.server = FarmServer((host, port), self.handle_message)
+
+    @property
+    def address(self):
+        host, port = self.server.server_address[:2]
+        return f"{host}:{port}"
+
+    def serve(self):
+        """Serve requests until the process is stopped"""
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+
+    def handle_message(self, message):
+        if self.token and not hmac.compare_digest(str(message.get("token", "")), self.token):
+            return {"error": "invalid token"}
+        
+        op = message.get("op")
+        if op == "hello":
+            return {"slots": self.slots, "compiler": self.version}
+        if op != "compile":
+            return {"error": f"unknown request '{op}'"}
+        
+        # Only code generation options, nothing that reads or writes files of the worker
+        args = message.get("args", [])
+        if not all(isinstance(arg, str) and FARM_REMOTE_OPTION.match(arg) for arg in args):
+            return {"error": "refused compiler options"}
+        
+        suffix = ".ii" if message.get("language") == "c++" else ".i"
+        with self.semaphore, tempfile.TemporaryDirectory(prefix="compyler-farm-") as directory:
+            source = os.path.join(directory, "unit" + suffix)
+            target = os.path.join(directory, "unit.o")
+            with open(source, "wb") as f:
+                f.write(unpack_data(message["source"]))
+            started = time.time()
+            try:
+                result = subprocess.run([self.compiler] + args + ["-c", source, "-o", target],
+                                        capture_output=True, cwd=directory, timeout=FARM_COMPILE_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                return {"error": f"compilation of {message.get('name', 'unit')} timed out"}
+            reply = {
+                "returncode": result.returncode,
+                "stderr": result.stderr.decode("utf-8", "replace"),
+                "seconds": round(time.time() - started, 3)
+            }
+            if result.returncode == 0:
+                with open(target, "rb") as f:
+                    reply["object"] = pack_data(f.read())
+        return reply
+
+
+class BuildFarm:
+    """Coordinator of one build, hands the C units of the compiler wrapper to the workers"""
+
+    def __init__(self, specs, compiler=None, token=None, on_event=None):
+        self.specs = list(specs)
+        # A CC that is already the wrapper would call itself
+        if not compiler or os.path.dirname(os.path.abspath(compiler)) == os.path.abspath(FARM_WRAPPER_DIR):
+            compiler = shutil.which("gcc") or "gcc"
+        self.compiler = compiler
+        self.token = os.environ.get("COMPYLER_FARM_TOKEN", "") if token is None else token
+        self.session = secrets.token_hex(16)
+        self.on_event = on_event
+        self.workers = []
+        self.local_units = 0
+        self.condition = threading.Condition()
+        self.server = None
+
+    def _emit(self, text):
+        if self.on_event:
+            self.on_event(text)
+
+    def start(self):
+        """Start the local workers, greet the remote ones and listen for the compiler wrapper"""
+        version = compiler_version(self.compiler)
+        for spec in self.specs:
+            if spec == "local" or spec.startswith("local:"):
+                slots = spec.partition(":")[2]
+                self._spawn_local(int(slots) if slots.isdigit() else None)
+            else:
+                self._add_worker(spec, spec, self.token)
+        
+        for worker in self.workers:
+            if version and worker["compiler"] and worker["compiler"] != version:
+                self._emit(f"Warning: build farm worker {worker['name']} uses '{worker['compiler']}', "
+                           f"this machine '{version}'\n")
+        
+        self.server = FarmServer(("127.0.0.1", 0), self.handle_message)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def _spawn_local(self, slots):
+        """Run a worker process on this machine, reachable over the loopback interface"""
+        token = secrets.token_hex(16)
+        command = [sys.executable, os.path.abspath(__file__), "farm-worker", "--bind", "127.0.0.1:0",
+                   "--compiler", self.compiler]
+        if slots:
+            command += ["--slots", str(slots)]
+        # The token goes through the environment, the command line is visible to every user
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True,
+                                   env=dict(os.environ, COMPYLER_FARM_TOKEN=token))
+        match = re.search(r"listening on (\S+)", process.stdout.readline())
+        if not match:
+            process.kill()
+            process.wait()
+            self._emit("Warning: could not start a local build farm worker\n")
+            return
+        name = f"local-{sum(1 for worker in self.workers if worker['process']) + 1}"
+        self._add_worker(name, match.group(1), token, process)
+
+    def _add_worker(self, name, address, token, process=None):
+        try:
+            hello = farm_request(address, {"op": "hello", "token": token}, timeout=10)
+        except (OSError, ValueError) as e:
+            hello = {"error": str(e)}
+        if "error" in hello:
+            self._emit(f"Warning: build farm worker {name} is not available: {hello['error']}\n")
+            if process:
+                process.kill()
+            return
+        self.workers.append({
+            "name": name, "address": address, "token": token, "process": process,
+            "slots": max(1, int(hello.get("slots", 1))), "compiler": hello.get("compiler", ""),
+            "busy": 0, "up": True, "units": 0, "seconds": 0.0, "bytes": 0
+        })
+
+    def capacity(self):
+        """Number of units the available workers compile at the same time"""
+        return sum(worker["slots"] for worker in self.workers if worker["up"])
+
+    def wrapper_env(self):
+        """Environment that makes Nuitka compile through the farm"""
+        return {
+            "CC": write_farm_wrapper(),
+            "COMPYLER_FARM": "%s:%d" % self.server.server_address[:2],
+            "COMPYLER_FARM_SESSION": self.session,
+            "COMPYLER_FARM_CC": self.compiler
+        }
+
+    def _acquire(self):
+        """Reserve a slot on the least busy worker, None when all of them are busy"""
+        with self.condition:
+            free = [worker for worker in self.workers if worker["up"] and worker["busy"] < worker["slots"]]
+            if not free:
+                return None
+            worker = min(free, key=lambda w: w["busy"] / w["slots"])
+            worker["busy"] += 1
+            return worker
+
+    def handle_message(self, message):
+        if not hmac.compare_digest(str(message.get("session", "")), self.session):
+            return {"error": "invalid session"}
+        
+        request = dict(message)
+        request.pop("session", None)
+        for _ in range(len(self.workers)):
+            # With every worker busy the wrapper compiles on this machine instead of waiting
+            worker = self._acquire()
+            if worker is None:
+                break
+            request["token"] = worker["token"]
+            try:
+                reply = farm_request(worker["address"], request, timeout=FARM_COMPILE_TIMEOUT)
+            except (OSError, ValueError) as e:
+                reply = {"error": str(e)}
+            finally:
+                with self.condition:
+                    worker["busy"] -= 1
+            
+            if "error" in reply:
+                with self.condition:
+                    worker["up"] = False
+                self._emit(f"Warning: build farm worker {worker['name']} failed ({reply['error']}), "
+                           f"no more units are sent to it\n")
+                continue
+            with self.condition:
+                worker["units"] += 1
+                worker["seconds"] += reply.get("seconds", 0)
+                worker["bytes"] += len(message.get("source", ""))
+            reply["worker"] = worker["name"]
+            return reply
+        
+        with self.condition:
+            self.local_units += 1
+        return {"local": True}
+
+    def stop(self):
+        """Stop listening and shut the local workers down"""
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        for worker in self.workers:
+            process = worker["process"]
+            if process and process.poll() is None:
+                process.terminate()
+                try:
+                    process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+
+    def to_dict(self):
+        return {
+            "workers": [
+                dict({key: worker[key] for key in ("name", "address", "slots", "compiler", "up", "units", "bytes")},
+                     seconds=round(worker["seconds"], 3))
+                for worker in self.workers
+            ],
+            "local_units": self.local_units
+        }
+
+    def summary(self):
+        """Describe how the C units were spread over the workers"""
+        remote = sum(worker["units"] for worker in self.workers)
+        lines = [f"Build farm: {remote} units compiled on {len(self.workers)} "
+                 f"worker{'s' if len(self.workers) != 1 else ''}, {self.local_units} on this machine"]
+        for worker in self.workers:
+            lines.append(f"  {worker['name']} ({worker['address']}, {worker['slots']} slots): "
+                         f"{worker['units']} units, {format_duration(worker['seconds'])} compiling, "
+                         f"{format_size(worker['bytes'])} sent" + ("" if worker["up"] else ", failed"))
+        return lines
+
+
+def watch_directories(script_path):
+    """Return the directories holding the script and the local modules it imports"""
+    local, _ = find_local_imports(script_path)
+    return sorted({os.path.dirname(path) for path in local})
+
+
+class SourceWatcher:
+    """Reports the Python sources changed in a set of directories once a burst of saves settled"""
+
+    # Event masks of inotify(7)
+    IN_MODIFY = 0x2
+    IN_CLOSE_WRITE = 0x8
+    IN_MOVED_FROM = 0x40
+    IN_MOVED_TO = 0x80
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    EVENT_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    def __init__(self, directories, on_change, debounce=WATCH_DEBOUNCE, poll_interval=WATCH_POLL_INTERVAL):
+        self.on_change = on_change
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.directories = set()
+        self.pending = set()
+        self.last_event = 0
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.libc = None
+        self.watches = {}
+        self.snapshot = {}
+        self.inotify = self._open_inotify()
+        self.set_directories(directories)
+
+    @property
+    def method(self):
+        return "inotify" if self.inotify is not None else f"polling every {self.poll_interval:g}s"
+
+    def _open_inotify(self):
+        """Return an inotify descriptor, or None where polling has to do"""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            import ctypes
+            import ctypes.util
+            self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = self.libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        return fd if fd >= 0 else None
+
+    def set_directories(self, directories):
+        """Watch a new set of directories, the imports of the script may have changed"""
+        directories = {os.path.abspath(directory) for directory in directories if os.path.isdir(directory)}
+        with self.lock:
+            if self.inotify is not None:
+                for wd, directory in list(self.watches.items()):
+                    if directory not in directories:
+                        self.libc.inotify_rm_watch(self.inotify, wd)
+                        del self.watches[wd]
+                for directory in directories - set(self.watches.values()):
+                    wd = self.libc.inotify_add_watch(self.inotify, os.fsencode(directory), self.EVENT_MASK)
+                    if wd >= 0:
+                        self.watches[wd] = directory
+            self.directories = directories
+            if self.inotify is None:
+                self.snapshot = self._scan()
+
+    def _scan(self):
+        """Return the size and modification time of every source in the watched directories"""
+        snapshot = {}
+        for directory in self.directories:
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if not entry.name.endswith(WATCH_SUFFIXES):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                snapshot[entry.path] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread:
+            self.thread.join(self.poll_interval + 1)
+        if self.inotify is not None:
+            os.close(self.inotify)
+            self.inotify = None
+
+    def _run(self):
+        while not self.stopped.is_set():
+            # With changes pending, wake up when the burst should be over
+            timeout = self.poll_interval
+            if self.pending:
+                timeout = min(timeout, max(0, self.last_event + self.debounce - time.time()))
+            if self.inotify is not None:
+                self._read_events(timeout)
+            elif not self.stopped.wait(timeout):
+                self._poll()
+            self._flush()
+
+    def _read_events(self, timeout):
+        try:
+            readable, _, _ = select.select([self.inotify], [], [], timeout)
+            if not readable:
+                return
+            data = os.read(self.inotify, 64 * 1024)
+        except (OSError, ValueError):
+            return
+        
+        offset = 0
+        while offset + 16 <= len(data):
+            wd, _, _, length = struct.unpack_from("iIII", data, offset)
+            name = data[offset + 16:offset + 16 + length].rstrip(b"\0")
+            offset += 16 + length
+            directory = self.watches.get(wd)
+            if directory and name:
+                self._changed(os.path.join(directory, os.fsdecode(name)))
+
+    def _poll(self):
+        with self.lock:
+            snapshot = self._scan()
+            previous, self.snapshot = self.snapshot, snapshot
+        for path in set(snapshot) | set(previous):
+            if snapshot.get(path) != previous.get(path):
+                self._changed(path)
+
+    def _changed(self, path):
+        # Editors write swap and backup files next to the source
+        name = os.path.basename(path)
+        if not name.endswith(WATCH_SUFFIXES) or name.startswith((".", "#")):
+            return
+        with self.lock:
+            self.pending.add(path)
+            self.last_event = time.time()
+
+    def _flush(self):
+        with self.lock:
+            if not self.pending or time.time() - self.last_event < self.debounce:
+                return
+            changed = sorted(self.pending)
+            self.pending.clear()
+        try:
+            self.on_change(changed)
+        except Exception:
+            pass
+
+
+class CompilationJob:
+    """A single Nuitka build with its own options, progress, log and result"""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, script_path, options, use_cache=False, env=None, incremental=False,
+                 use_dependency_cache=False, auto_jobs=False, farm_workers=None, timeout=None,
+                 low_priority=False, benchmark_runs=0):
+        self.id = next(CompilationJob._ids)
+        self.script_path = script_path
+        self.options = list(options)
+        self.use_cache = use_cache
+        self.env = dict(env or {})
+        self.incremental = IncrementalBuild(script_path, self.options) if incremental else None
+        self.use_dependency_cache = use_dependency_cache
+        self.dependency_options = []
+        self.dependency_entries = []
+        self.auto_jobs = auto_jobs
+        self.memory_pauses = 0
+        self.memory_kills = 0
+        self.farm_workers = list(farm_workers or [])
+        self.timeout = timeout
+        self.low_priority = low_priority
+        # A jobs count chosen on purpose is not replaced by the share of a batch
+        self.fixed_jobs = False
+        self.benchmark_runs = benchmark_runs
+        self.benchmark = None
+        self.onefile_build_id = None
+        self.partial_outputs = set()
+        self.timed_out = False
+        self.farm = None
+        self.farm_stats = None
+        
+        # The output directory is part of the option set
+        self.output_dir = os.path.dirname(os.path.abspath(script_path))
+        for option in self.options:
+            if option.startswith("--output-dir="):
+                self.output_dir = option.split("=", 1)[1]
+        
+        # State, updated from the worker thread running the job
+        self.status = "pending"
+        self.progress = 0
+        self.phase = "waiting"
+        self.phase_history = []
+        # Only the latest lines are kept, like the terminal, logged counts every line ever added
+        self.log = collections.deque(maxlen=TERMINAL_MAX_LINES)
+        self.logged = 0
+        self.log_lock = threading.Lock()
+        self.line_count = 0
+        self.phase_lines = {}
+        self.phase_line_counts = []
+        self.module_count = None
+        self.profile = None
+        self.profile_path = None
+        self.estimate = None
+        self.returncode = None
+        self.error = None
+        self.cache_hit = False
+        self.compiler_cache_stats = None
+        self.jobs = None
+        for option in self.options:
+            if option.startswith("--jobs="):
+                self.jobs = int(option.split("=", 1)[1])
+        self.process = None
+        self.start_time = None
+        self.end_time = None
+        self.cancelled = False
+
+    @property
+    def name(self):
+        return os.path.basename(self.script_path)
+
+    def elapsed(self):
+        """Return the run time of the job in seconds"""
+        if self.start_time is None:
+            return 0
+        return (self.end_time or time.time()) - self.start_time
+
+    def set_jobs(self, jobs):
+        """Replace the parallel jobs budget of this build"""
+        self.jobs = jobs
+        self.options = [o for o in self.options if not o.startswith("--jobs=")]
+        self.options.append(f"--jobs={jobs}")
+
+    def command(self):
+        """Return the Nuitka command line for this job"""
+        options = self.incremental.build_options(self.options) if self.incremental else self.options
+        if self.onefile_build_id:
+            options = [option.replace(ONEFILE_BUILD_TOKEN, self.onefile_build_id) for option in options]
+        return ["python", "-m", "nuitka"] + options + self.dependency_options + [self.script_path]
+
+    def note(self, text):
+        """Add a line to the log without counting it as build output"""
+        with self.log_lock:
+            self.log.append(text)
+            self.logged += 1
+
+    def log_since(self, count):
+        """Return the lines added after the first count ones and the new count, dropped lines are skipped"""
+        with self.log_lock:
+            lines = list(self.log)
+            return lines[max(0, len(lines) - (self.logged - count)):], self.logged
+
+    def _enter_phase(self, phase):
+        """Start timing a phase, the time of a phase entered again adds up"""
+        if phase != self.phase:
+            self.phase_history.append((phase, time.time()))
+            self.phase_line_counts.append(0)
+        self.phase = phase
+        self.progress = max(self.progress, PHASE_MIN_PROGRESS.get(phase, 0))
+
+    def _emit(self, text, on_output):
+        """Record an output line, track progress and forward it"""
+        self.note(text)
+        self.line_count += 1
+        
+        percentage, phase = detect_progress(text)
+        if percentage is not None:
+            self.progress = max(self.progress, min(99, percentage))
+        elif phase:
+            self._enter_phase(phase)
+        
+        counted = self.phase if self.phase in PHASE_LABELS else "initialize"
+        self.phase_lines[counted] = self.phase_lines.get(counted, 0) + 1
+        if self.phase_line_counts:
+            self.phase_line_counts[-1] += 1
+        
+        if on_output:
+            on_output(text)
+
+    def build_dir(self):
+        """Return Nuitka's build directory for this job, where the object files are"""
+        stem = os.path.splitext(os.path.basename(self.script_path))[0]
+        base = self.incremental.build_dir if self.incremental else self.output_dir
+        return os.path.join(base, stem + ".build")
+
+    def _resume_key(self):
+        """Identify the inputs, a cancelled build is only resumed with the same ones"""
+        return BuildHistory.compute_key(self.script_path, self.options)
+
+    def _scan_modules(self, history):
+        """Count the modules of the script, and predict the build from other projects if this one has no history"""
+        try:
+            module_count = ImportGraph(self.script_path).scan().module_count
+        except Exception:
+            return
+        self.module_count = module_count
+        if self.estimate is None and self.status == "running":
+            self.estimate = history.estimate(self.script_path, self.options, module_count)
+
+    def _check_resume(self, on_output):
+        """Look for objects left by a cancelled build with the same inputs, returns their mtimes"""
+        marker = os.path.join(self.build_dir(), PARTIAL_BUILD_MARKER)
+        try:
+            with open(marker, "r", encoding="utf-8") as f:
+                partial = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if partial.get("key") != self._resume_key():
+            self._emit("The cancelled build in the build directory used other options, compiling everything\n",
+                       on_output)
+            return {}
+        
+        objects = {}
+        for root, _, files in os.walk(self.build_dir()):
+            for name in files:
+                if name.endswith((".o", ".obj")):
+                    path = os.path.join(root, name)
+                    objects[path] = os.stat(path).st_mtime_ns
+        when = time.strftime("%H:%M:%S", time.localtime(partial.get("cancelled_at", 0)))
+        self._emit(f"Resuming the build cancelled at {when}: {len(objects)} compiled objects are kept\n", on_output)
+        return objects
+
+    def _finish_resume(self, objects, on_output):
+        """Report how many objects of the cancelled build were not compiled again"""
+        reused = 0
+        for path, mtime in objects.items():
+            try:
+                reused += os.stat(path).st_mtime_ns == mtime
+            except OSError:
+                continue
+        self._emit(f"Reused {reused} of {len(objects)} objects from the cancelled build\n", on_output)
+
+    def _clean_cancelled(self, on_output):
+        """Leave the build directory consistent: no half written files, and a marker to resume from"""
+        removed = 0
+        for path in self.partial_outputs:
+            try:
+                # Only what this build started writing, never an older complete file
+                if os.path.isfile(path) and os.stat(path).st_mtime >= self.start_time:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                continue
+        
+        kept = 0
+        build_dir = self.build_dir()
+        if os.path.isdir(build_dir):
+            for _, _, files in os.walk(build_dir):
+                kept += sum(1 for name in files if name.endswith((".o", ".obj")))
+            try:
+                with open(os.path.join(build_dir, PARTIAL_BUILD_MARKER), "w", encoding="utf-8") as f:
+                    json.dump({"key": self._resume_key(), "cancelled_at": time.time(), "objects": kept}, f)
+            except OSError:
+                pass
+        self._emit(f"Build cancelled: removed {removed} partially written file{'s' if removed != 1 else ''}, "
+                   f"{kept} compiled objects are kept for the next build\n", on_output)
+
+    def _emit_lines(self, lines, on_output):
+        for line in lines:
+            self._emit(line, on_output)
+
+    def phase_durations(self):
+        """Return the seconds spent in each phase seen so far"""
+        durations = {}
+        end = self.end_time or time.time()
+        for index, (phase, started) in enumerate(self.phase_history):
+            ended = self.phase_history[index + 1][1] if index + 1 < len(self.phase_history) else end
+            durations[phase] = durations.get(phase, 0) + ended - started
+        return durations
+
+    def run(self, build_cache=None, toolchain_version="", on_output=None, on_start=None, history=None,
+            dependency_cache=None):
+        """Run the build, restoring from the cache when possible, returns the exit code"""
+        self.status = "running"
+        self.start_time = time.time()
+        self.phase = "initialize"
+        self.phase_history = [("initialize", self.start_time)]
+        self.phase_line_counts = [0]
+        
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            
+            # Look for a previous build with identical inputs
+            cache_key = None
+            if build_cache is not None and self.use_cache and toolchain_version:
+                cache_key = build_cache.compute_key(self.script_path, self.options, toolchain_version)
+            
+            # A cached onefile extraction is named after the inputs, a changed build never finds a stale one
+            if any(ONEFILE_BUILD_TOKEN in option for option in self.options):
+                self.onefile_build_id = (cache_key or (build_cache or BuildCache()).compute_key(
+                    self.script_path, self.options, toolchain_version or get_nuitka_version()))[:16]
+            
+            if cache_key:
+                restored = build_cache.restore(cache_key, self.output_dir)
+                if restored:
+                    self._emit(f"Build cache hit ({cache_key[:12]}), Nuitka skipped.\n", on_output)
+                    for name in restored:
+                        self._emit(f"Restored: {os.path.join(self.output_dir, name)}\n", on_output)
+                    self.cache_hit = True
+                    return self._finish(0)
+                self._emit(f"Build cache miss ({cache_key[:12]}), running Nuitka.\n", on_output)
+            build_start = time.time()
+            
+            # Predict the build from the previous ones of this project
+            if history is not None:
+                self.estimate = history.estimate(self.script_path, self.options, self.module_count)
+                if self.estimate:
+                    self._emit(self.estimate.describe() + "\n", on_output)
+                # The GUI passes the count of its pre-scan, otherwise the graph is walked next to Nuitka,
+                # a walk through the standard library takes seconds the build shouldn't wait for
+                if self.module_count is None:
+                    threading.Thread(target=self._scan_modules, args=(history,), daemon=True).start()
+            
+            # Find out which modules changed since the last incremental build
+            incremental_modules = None
+            if self.incremental:
+                incremental_modules = self.incremental.scan()
+                os.makedirs(self.incremental.build_dir, exist_ok=True)
+                compiler_cache = bool(self.env.get("NUITKA_CCACHE_BINARY") or self.env.get("NUITKA_CLCACHE_BINARY"))
+                self._emit(self.incremental.describe_changes(incremental_modules, compiler_cache) + "\n", on_output)
+            
+            # Hand the C compilation to the build farm workers
+            if self.farm_workers:
+                self._start_farm(on_output)
+            
+            # Size the parallelism to the cores and the memory the compile jobs will need
+            if self.auto_jobs:
+                job_memory = history.job_memory(self.script_path, self.options) if history is not None else None
+                lto = any(o in ("--lto", "--lto=yes") for o in self.options)
+                jobs, reason = choose_jobs(job_memory, lto)
+                # Within a batch the share of the jobs budget is an upper bound
+                if self.jobs:
+                    jobs = min(jobs, self.jobs)
+                # The farm slots come on top, units beyond them are compiled here
+                if self.farm:
+                    jobs = max(jobs, self.farm.capacity())
+                    reason += f", {self.farm.capacity()} build farm slots"
+                self.set_jobs(jobs)
+                self._emit(f"Parallel jobs: {jobs} (auto: {reason})\n", on_output)
+            
+            # Reuse third-party packages compiled once for all projects
+            if dependency_cache is not None and self.use_dependency_cache:
+                self._prepare_dependencies(dependency_cache, toolchain_version or get_nuitka_version(), on_output)
+                if self.cancelled:
+                    self._stop_farm(on_output)
+                    return self._finish(-1)
+            
+            command = self.command()
+            self._emit(f"Executing: {' '.join(command)}\n", on_output)
+            
+            # Let the C compiler cache report what this build got out of it
+            env = dict(os.environ, **self.env)
+            compiler_cache = None
+            ccache_binary = self.env.get("NUITKA_CCACHE_BINARY") or self.env.get("NUITKA_CLCACHE_BINARY")
+            if ccache_binary:
+                compiler_cache = CompilerCache(ccache_binary, self.env)
+                env.update(compiler_cache.begin())
+            if self.farm:
+                env.update(self.farm.wrapper_env())
+            
+            # Objects of a cancelled build with the same inputs are still in the build directory
+            resumed_objects = self._check_resume(on_output)
+            
+            # A build nobody is waiting for yet must not slow the machine down
+            spawn_options = dict(PROCESS_GROUP_OPTIONS)
+            if self.low_priority and os.name == "nt":
+                spawn_options["creationflags"] |= subprocess.BELOW_NORMAL_PRIORITY_CLASS
+            
+            retries = 0
+            while True:
+                # The supervisor reads the output, this thread only waits for the end
+                self.process = ProcessSupervisor.shared().spawn(
+                    command,
+                    lambda lines: self._emit_lines(lines, on_output),
+                    env=env,
+                    **spawn_options
+                )
+                if self.low_priority and hasattr(os, "setpriority"):
+                    # The compilers are started later and inherit it
+                    try:
+                        os.setpriority(os.PRIO_PGRP, self.process.pid, SPECULATIVE_NICENESS)
+                    except OSError:
+                        pass
+                if self.cancelled:
+                    self.cancel()
+                if on_start:
+                    on_start(self.process)
+                monitor = ProcessTreeMonitor(self.process.pid).start()
+                governor = None
+                if self.auto_jobs:
+                    job_memory = history.job_memory(self.script_path, self.options) if history is not None else None
+                    governor = MemoryGovernor(self.process.pid, job_memory or DEFAULT_JOB_MEMORY,
+                                              lambda text: self._emit(text, on_output)).start()
+                
+                try:
+                    try:
+                        returncode = self.process.wait(self.timeout)
+                    except subprocess.TimeoutExpired:
+                        # Stopped like a cancel, so the partial files are cleaned up the same way
+                        self._emit(f"Build stopped after the {format_duration(self.timeout)} time limit\n",
+                                   on_output)
+                        self.timed_out = True
+                        self.cancel()
+                        returncode = self.process.wait()
+                finally:
+                    monitor.stop()
+                    if governor:
+                        governor.stop()
+                        self.memory_pauses += governor.pauses
+                        self.memory_kills += governor.kills
+            
+                # A compile stopped for memory fails the build, the objects already compiled are kept for the retry
+                if (returncode == 0 or self.cancelled or not governor or not governor.kills
+                        or retries >= MEMORY_RETRIES):
+                    break
+                retries += 1
+                jobs = max(1, (self.jobs or 2) // 2)
+                self.set_jobs(jobs)
+                command = self.command()
+                self._emit(f"Retrying the build with {jobs} parallel jobs after running out of memory\n", on_output)
+                self._emit(f"Executing: {' '.join(command)}\n", on_output)
+            self._stop_farm(on_output)
+            
+            if self.cancelled:
+                self._clean_cancelled(on_output)
+            elif returncode == 0:
+                if resumed_objects:
+                    self._finish_resume(resumed_objects, on_output)
+                try:
+                    os.remove(os.path.join(self.build_dir(), PARTIAL_BUILD_MARKER))
+                except OSError:
+                    pass
+            
+            if self.dependency_entries and returncode == 0 and not self.cancelled:
+                self._install_dependencies(self.incremental.build_dir if self.incremental else self.output_dir)
+            
+            # Bring the results of the persistent build directory to the output directory
+            if self.incremental and returncode == 0 and not self.cancelled:
+                copied = self.incremental.sync(self.output_dir)
+                self.incremental.commit(incremental_modules)
+                self._emit(f"Incremental build: updated {copied} file{'s' if copied != 1 else ''} "
+                           f"in {self.output_dir}\n", on_output)
+            
+            if compiler_cache:
+                self.compiler_cache_stats = compiler_cache.finish()
+                compile_seconds = self.phase_durations().get("c_compilation")
+                for line in CompilerCache.summary(self.compiler_cache_stats, compile_seconds):
+                    self._emit(line + "\n", on_output)
+            
+            # Keep the result for the next build with the same inputs
+            if returncode == 0 and cache_key and not self.cancelled:
+                try:
+                    artifacts_dir = self.incremental.build_dir if self.incremental else self.output_dir
+                    entry = build_cache.store(cache_key, self.script_path, artifacts_dir,
+                                              self.options, since=build_start)
+                    if entry:
+                        self._emit(f"Stored build in cache ({cache_key[:12]}, {format_size(entry['size'])})\n",
+                                   on_output)
+                except Exception as e:
+                    self._emit(f"Warning: could not store build in cache: {str(e)}\n", on_output)
+            
+            result = self._finish(returncode)
+            
+            # Keep a timing profile of every build next to its output
+            self.profile = BuildProfile.from_job(self, monitor)
+            if history is not None and returncode == 0 and not self.cancelled:
+                history.record(self)
+            if returncode == 0 and not self.cancelled:
+                self._prune_onefile_cache(on_output)
+                self._benchmark(history, on_output)
+            try:
+                self.profile_path = self.profile.save(self.output_dir)
+                for line in self.profile.summary():
+                    self._emit(line + "\n", on_output)
+                self._emit(f"Timing profile: {self.profile_path}\n", on_output)
+            except OSError as e:
+                self._emit(f"Warning: could not save the timing profile: {str(e)}\n", on_output)
+            if self.benchmark:
+                for line in BuildBenchmark.summary(self.benchmark):
+                    self._emit(line + "\n", on_output)
+            return result
+        except Exception as e:
+            self.error = str(e)
+            self._stop_farm(on_output)
+            self._finish(-1)
+            raise
+
+    def _prune_onefile_cache(self, on_output):
+        """Remove the extractions of older builds of a onefile program with a cached extraction"""
+        if not self.onefile_build_id:
+            return
+        artifact = find_build_artifact(self.output_dir, self.script_path, self.options)[0]
+        if not artifact:
+            return
+        self._emit(f"Onefile extraction: {OnefileCache.extraction_dir(artifact, self.onefile_build_id)}\n", on_output)
+        try:
+            removed = OnefileCache.prune(artifact, self.onefile_build_id)
+        except OSError as e:
+            self._emit(f"Warning: could not remove older onefile extractions: {str(e)}\n", on_output)
+            return
+        if removed:
+            self._emit(f"Removed {removed} older onefile extraction{'s' if removed != 1 else ''}\n", on_output)
+
+    def _benchmark(self, history, on_output):
+        """Measure what the build produced and compare it with the previous build of the project"""
+        benchmark = BuildBenchmark(self.script_path, self.options, self.output_dir, self.benchmark_runs,
+                                   onefile_build_id=self.onefile_build_id)
+        if not benchmark.artifact:
+            self._emit("Benchmark: the built program was not found in the output directory\n", on_output)
+            return
+        if self.benchmark_runs:
+            self._emit(f"Benchmark: starting {os.path.basename(benchmark.artifact)} and the script "
+                       f"{self.benchmark_runs} times each\n", on_output)
+        try:
+            result = benchmark.run()
+        except Exception as e:
+            self._emit(f"Warning: could not benchmark the build: {str(e)}\n", on_output)
+            return
+        
+        if history is not None:
+            previous = history.benchmarks(self.script_path, self.options)
+            result["regressions"] = BuildBenchmark.regressions(result, previous[-1] if previous else None)
+            history.record_benchmark(self.script_path, self.options, result)
+        self.benchmark = result
+        self.profile.data["benchmark"] = result
+
+    def _start_farm(self, on_output):
+        """Start the coordinator and the local workers of the build farm"""
+        try:
+            write_farm_wrapper()
+            farm = BuildFarm(self.farm_workers, self.env.get("CC") or os.environ.get("CC"),
+                             on_event=lambda text: self._emit(text, on_output)).start()
+        except (OSError, ValueError) as e:
+            self._emit(f"Build farm unavailable ({str(e)}), compiling on this machine\n", on_output)
+            return
+        if not farm.capacity():
+            farm.stop()
+            self._emit("Build farm: no worker is available, compiling on this machine\n", on_output)
+            return
+        self.farm = farm
+        workers = ", ".join(f"{worker['name']} ({worker['slots']} slots)" for worker in farm.workers)
+        self._emit(f"Build farm: {farm.capacity()} slots on {workers}\n", on_output)
+
+    def _stop_farm(self, on_output):
+        if not self.farm:
+            return
+        farm, self.farm = self.farm, None
+        farm.stop()
+        self.farm_stats = farm.to_dict()
+        for line in farm.summary():
+            self._emit(line + "\n", on_output)
+
+    def _prepare_dependencies(self, dependency_cache, toolchain_version, on_output):
+        """Swap cached compiled packages in for compiling them as part of the build"""
+        self.dependency_options = []
+        self.dependency_entries = []
+        if "--module" in self.options or "--follow-imports" not in self.options:
+            return
+        
+        flags = [o for o in self.options if o.startswith(DEPENDENCY_FLAG_PREFIXES)]
+        _, external = find_local_imports(self.script_path)
+        
+        # The compilations are a phase of their own, Cancel and the time limit apply to them like to Nuitka
+        def started(process):
+            self.process = process
+            if self.cancelled:
+                self.cancel()
+        
+        self._enter_phase("dependency_cache")
+        for name in external:
+            if self.cancelled:
+                break
+            # Packages the user already placed with their own options are left alone
+            if any(o.endswith(f"={name}") for o in self.options):
+                continue
+            timeout = max(1, self.timeout - (time.time() - self.start_time)) if self.timeout else None
+            entry = dependency_cache.ensure(name, flags, toolchain_version, self.env, self.jobs,
+                                            lambda text: self._emit(text, on_output), started, timeout)
+            if self.process is not None and self.process.timed_out:
+                self._emit(f"Build stopped after the {format_duration(self.timeout)} time limit\n", on_output)
+                self.timed_out = self.cancelled = True
+            if entry:
+                self.dependency_entries.append(entry)
+        self.process = None
+        self._enter_phase("initialize")
+        if self.cancelled:
+            return
+        
+        if not self.dependency_entries:
+            return
+        
+        # What the compiled packages import themselves must still be part of the program
+        cached = {entry["name"] for entry in self.dependency_entries}
+        needed = set()
+        for entry in self.dependency_entries:
+            self.dependency_options.append(f"--nofollow-import-to={entry['name']}")
+            needed.update(name for name in entry.get("imports", ()) if name not in cached)
+        for name in sorted(needed - set(sys.builtin_module_names)):
+            try:
+                if importlib.util.find_spec(name) is not None:
+                    self.dependency_options.append(f"--include-module={name}")
+            except (ImportError, ValueError):
+                continue
+        
+        # A onefile program is packed by Nuitka, the modules have to go in as data files
+        if "--onefile" in self.options:
+            for entry in self.dependency_entries:
+                self.dependency_options.append(f"--include-data-files={entry['path']}={entry['file']}")
+        
+        names = ", ".join(f"{entry['name']} {entry['version']}" for entry in self.dependency_entries)
+        self._emit(f"Dependency cache: using {len(self.dependency_entries)} precompiled packages ({names})\n",
+                   on_output)
+
+    def _install_dependencies(self, target_dir):
+        """Copy the cached extension modules next to the built program"""
+        if "--onefile" in self.options:
+            return
+        if "--standalone" in self.options:
+            stem = os.path.splitext(os.path.basename(self.script_path))[0]
+            target_dir = os.path.join(target_dir, stem + ".dist")
+        os.makedirs(target_dir, exist_ok=True)
+        for entry in self.dependency_entries:
+            shutil.copy2(entry["path"], os.path.join(target_dir, entry["file"]))
+
+    def _finish(self, returncode):
+        self.returncode = returncode
+        self.end_time = time.time()
+        if self.timed_out:
+            self.status = "timed out"
+        elif self.cancelled:
+            self.status = "cancelled"
+        elif returncode == 0:
+            self.status = "cached" if self.cache_hit else "succeeded"
+            self.progress = 100
+        else:
+            self.status = "failed"
+        return returncode
+
+    def cancel(self):
+        """Stop the build with every compiler and linker it started"""
+        self.cancelled = True
+        if self.process and self.process.poll() is None:
+            # Remember what is being written, it is incomplete once the writers are gone
+            self.partial_outputs |= in_flight_outputs(self.process.pid)
+            self.process.cancel()
+
+
+class SpeculativeBuild:
+    """A low priority build started before the options are final, adopted if they turn out the same"""
+
+    def __init__(self, script_path, options, env=None, root=None, **job_options):
+        self.script_path = os.path.abspath(script_path)
+        self.output_dir = self.output_dir_for(script_path, options)
+        
+        # Built aside, the output directory only changes if the build is adopted
+        name = hashlib.sha256(self.script_path.encode("utf-8")).hexdigest()[:16]
+        self.staging_dir = os.path.join(root or SPECULATIVE_DIR, name)
+        staged = [o for o in options if not o.startswith("--output-dir=")] + [f"--output-dir={self.staging_dir}"]
+        self.job = CompilationJob(script_path, staged, True, env, low_priority=True, **job_options)
+        
+        self.build_cache = None
+        self.key = None
+        self.key_ready = threading.Event()
+        self.lines = []
+        self.forward = None
+        self.lock = threading.Lock()
+        self.thread = None
+
+    @staticmethod
+    def output_dir_for(script_path, options):
+        """The directory Nuitka writes to for these options"""
+        output_dir = os.path.dirname(os.path.abspath(script_path))
+        for option in options:
+            if option.startswith("--output-dir="):
+                output_dir = option.split("=", 1)[1]
+        return output_dir
+
+    def start(self, build_cache, get_toolchain_version, history=None, dependency_cache=None, on_done=None):
+        """Start the build in a worker thread"""
+        self.build_cache = build_cache
+        
+        def run():
+            try:
+                version = get_toolchain_version()
+                if version:
+                    self.key = build_cache.compute_key(self.script_path, self.job.options, version)
+                self.key_ready.set()
+                if not self.key or self.job.cancelled:
+                    return
+                self.job.run(build_cache, version, on_output=self._output, history=history,
+                             dependency_cache=dependency_cache)
+            except Exception as e:
+                self._output(f"ERROR: {str(e)}\n")
+            finally:
+                self.key_ready.set()
+                if on_done and not self.job.cancelled:
+                    on_done(self)
+        
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+        return self
+
+    def _output(self, text):
+        with self.lock:
+            if self.forward:
+                self.forward(text)
+            else:
+                self.lines.append(text)
+
+    def matches(self, script_path, options, toolchain_version):
+        """Whether building these inputs would produce the same result"""
+        self.key_ready.wait(30)
+        if not self.key or not toolchain_version or os.path.abspath(script_path) != self.script_path:
+            return False
+        # Reading the script and its imports again also catches edits made since the start
+        return self.build_cache.compute_key(script_path, options, toolchain_version) == self.key
+
+    def usable(self):
+        """Whether the build is still running or ended with a result, a failed one is not reused"""
+        return self.job.status in ("pending", "running", "succeeded", "cached")
+
+    def adopt(self, on_output, output_dir=None):
+        """Follow the build to its end and deliver the result to the output directory, returns the exit code"""
+        # The cache key ignores the output directory, so it may have changed since the script was selected
+        if output_dir:
+            self.output_dir = output_dir
+        with self.lock:
+            for text in self.lines:
+                on_output(text)
+            self.lines = []
+            self.forward = on_output
+        self.thread.join()
+        
+        if self.job.returncode != 0 or self.job.cancelled:
+            return self.job.returncode if self.job.returncode is not None else -1
+        try:
+            copied = self.deliver()
+        except OSError as e:
+            on_output(f"ERROR: could not copy the speculative build to {self.output_dir}: {str(e)}\n")
+            return -1
+        on_output(f"Speculative build: updated {copied} file{'s' if copied != 1 else ''} in {self.output_dir}\n")
+        return 0
+
+    def deliver(self):
+        """Copy the results from the staging directory to the real output directory"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        copied = 0
+        for name in BuildCache.collect_artifacts(self.staging_dir, self.script_path):
+            copied += sync_tree(os.path.join(self.staging_dir, name), os.path.join(self.output_dir, name))
+        return copied
+
+    def discard(self):
+        """Stop the build, the compiler cache keeps what it compiled so far"""
+        self.job.cancel()
+
+    def describe(self):
+        """One line about the state of the build"""
+        job = self.job
+        if job.status in ("succeeded", "cached"):
+            return (f"Speculative build of {job.name} ready after {format_duration(job.elapsed())}, "
+                    f"Compile with the same options to use it")
+        if job.returncode is None:
+            return f"Speculative build of {job.name} was not started"
+        return f"Speculative build of {job.name} {job.status}, Compile runs the build again"
+
+
+class BatchCompiler:
+    """Schedules compilation jobs across a bounded pool of Nuitka processes"""
+
+    def __init__(self, max_workers=2, total_jobs=None, build_cache=None, on_output=None, on_job_done=None,
+                 get_toolchain_version=get_nuitka_version, history=None, dependency_cache=None):
+        self.max_workers = max(1, max_workers)
+        self.total_jobs = max(1, total_jobs or os.cpu_count() or 1)
+        self.build_cache = build_cache
+        self.history = history
+        self.dependency_cache = dependency_cache
+        self.on_output = on_output
+        self.on_job_done = on_job_done
+        self.jobs = []
+        self.pending = queue.Queue()
+        self.threads = []
+        self.lock = threading.Lock()
+        self.cancelled = False
+        self.get_toolchain_version = get_toolchain_version
+        self.toolchain_version = None
+
+    def add(self, job):
+        """Queue a job, it runs on the next free worker"""
+        self.jobs.append(job)
+        self.pending.put(job)
+
+    def remove(self, job):
+        """Drop a job that hasn't started yet"""
+        with self.lock:
+            if job.status != "pending":
+                return False
+            job.status = "removed"
+            self.jobs.remove(job)
+            return True
+
+    def is_running(self):
+        return any(thread.is_alive() for thread in self.threads)
+
+    def start(self):
+        """Start the worker pool, it stops once the queue is empty"""
+        if self.is_running():
+            return
+        
+        self.cancelled = False
+        workers = max(1, min(self.max_workers, self.pending.qsize()))
+        self.threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(workers)]
+        for thread in self.threads:
+            thread.start()
+
+    def _next_job(self):
+        """Take the next pending job and give it a share of the jobs budget"""
+        with self.lock:
+            while True:
+                try:
+                    job = self.pending.get_nowait()
+                except queue.Empty:
+                    return None
+                if job.status == "pending":
+                    break
+            
+            # Split what running builds aren't using between the builds about to start
+            running = [j for j in self.jobs if j.status == "running"]
+            used = sum(j.jobs or 0 for j in running)
+            idle_workers = max(1, len(self.threads) - len(running))
+            starting = max(1, min(idle_workers, self.pending.qsize() + 1))
+            if not job.fixed_jobs:
+                job.set_jobs(max(1, (self.total_jobs - used) // starting))
+            job.status = "running"
+            return job
+
+    def _get_toolchain_version(self):
+        """Look up the Nuitka version once per batch, it is part of the cache key"""
+        with self.lock:
+            if self.toolchain_version is None:
+                self.toolchain_version = self.get_toolchain_version() if self.build_cache is not None else ""
+            return self.toolchain_version
+
+    def _worker(self):
+        while not self.cancelled:
+            job = self._next_job()
+            if job is None:
+                break
+            toolchain_version = self._get_toolchain_version()
+            
+            def forward(text, job=job):
+                if self.on_output:
+                    self.on_output(job, text)
+            
+            try:
+                job.run(self.build_cache, toolchain_version, on_output=forward, history=self.history,
+                        dependency_cache=self.dependency_cache)
+            except Exception as e:
+                job.note(f"\nERROR: {str(e)}\n")
+            
+            if self.on_job_done:
+                self.on_job_done(job)
+
+    def cancel(self):
+        """Cancel running jobs and drop the rest of the queue"""
+        self.cancelled = True
+        for job in self.jobs:
+            if job.status == "pending":
+                job.status = "cancelled"
+            job.cancel()
+
+    def wait(self):
+        for thread in self.threads:
+            thread.join()
+
+
+def workload_command(workload, artifact):
+    """Command line of a workload, '{program}' stands for the built program, otherwise it gets the arguments"""
+    workload = workload or ""
+    if "{program}" in workload:
+        return shlex.split(workload.replace("{program}", shlex.quote(artifact)))
+    return [artifact] + shlex.split(workload)
+
+
+def parse_explore_axis(text):
+    """Turn an axis of the explore mode into its alternatives, each a list of Nuitka options"""
+    name = text.strip().lower()
+    if name == "jobs":
+        cpus = os.cpu_count() or 1
+        return [[f"--jobs={jobs}"] for jobs in sorted({max(1, cpus // 4), max(1, cpus // 2), cpus})]
+    if name == "onefile":
+        cached = f"--onefile-tempdir-spec={ONEFILE_CACHE_SPEC}"
+        return [["--onefile"], ["--onefile", "--onefile-no-compression"],
+                ["--onefile", cached], ["--onefile", cached, "--onefile-no-compression"]]
+    if name in EXPLORE_AXES:
+        return [[option] for option in EXPLORE_AXES[name]]
+    # Alternatives are separated by commas, an empty one leaves the base options alone
+    return [alternative.split() for alternative in text.split(",")]
+
+
+class FlagExplorer:
+    """Builds a script with every combination of option axes, benchmarks the results and ranks them"""
+
+    def __init__(self, script_path, base_options, axes, env=None, workload=None, runs=BENCHMARK_RUNS,
+                 max_workers=2, use_cache=True, auto_jobs=False, use_dependency_cache=False,
+                 timeout=WORKLOAD_TIMEOUT, root=None):
+        self.script_path = os.path.abspath(script_path)
+        self.workload = workload
+        self.runs = max(1, runs)
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.batch = None
+        self.cancelled = False
+        self.results = []
+        
+        variants = [sum(combination, []) for combination in itertools.product(*axes)]
+        if len(variants) > EXPLORE_MAX_COMBINATIONS:
+            raise ValueError(f"{len(variants)} combinations, at most {EXPLORE_MAX_COMBINATIONS} can be explored")
+        
+        # One output directory per combination, the same on every run so the build cache can restore it
+        name = hashlib.sha256(self.script_path.encode("utf-8")).hexdigest()[:16]
+        self.root = os.path.join(root or EXPLORE_DIR, name)
+        self.jobs = []
+        self.variants = {}
+        for index, variant in enumerate(variants):
+            options = self.combine(base_options, variant)
+            slug = re.sub(r"[^A-Za-z0-9]+", "-", self.describe_variant(variant)).strip("-") or "base"
+            options.append(f"--output-dir={os.path.join(self.root, f'{index + 1}-{slug}')}")
+            # The jobs count only changes the build time, which a restored build would not show
+            fixed_jobs = any(o.startswith("--jobs=") for o in variant)
+            job = CompilationJob(script_path, options, use_cache and not fixed_jobs, env,
+                                 use_dependency_cache=use_dependency_cache, auto_jobs=auto_jobs and not fixed_jobs)
+            job.fixed_jobs = fixed_jobs
+            self.jobs.append(job)
+            self.variants[job.id] = variant
+
+    @staticmethod
+    def combine(base_options, variant):
+        """Replace the base options an axis decides about with the ones of the variant"""
+        keys = {option.split("=", 1)[0] for option in variant}
+        mode = any(option in EXPLORE_MODE_OPTIONS for option in variant)
+        # A mode comes with its own onefile options, none of the base options carry over
+        options = [o for o in base_options
+                   if o.split("=", 1)[0] not in keys and not o.startswith("--output-dir=")
+                   and not (mode and (o in EXPLORE_MODE_OPTIONS or o.startswith("--onefile-")))]
+        return options + list(variant)
+
+    @staticmethod
+    def describe_variant(variant):
+        """The options of a combination, with the cached extraction shortened to the flag of the build command"""
+        return " ".join(variant).replace(f"--onefile-tempdir-spec={ONEFILE_CACHE_SPEC}", "--onefile-cache")
+
+    def run(self, build_cache=None, history=None, dependency_cache=None, on_output=None, on_job_done=None):
+        """Build every combination, then benchmark them one at a time, returns the ranked results"""
+        self.batch = BatchCompiler(max_workers=self.max_workers, build_cache=build_cache, on_output=on_output,
+                                   on_job_done=on_job_done, history=history, dependency_cache=dependency_cache)
+        for job in self.jobs:
+            self.batch.add(job)
+        self.batch.start()
+        # Wake up regularly so Ctrl+C is still delivered
+        while self.batch.is_running():
+            time.sleep(0.2)
+        
+        # Measured after all builds, a running build would slow the workload down
+        self.results = []
+        for job in self.jobs:
+            if self.cancelled:
+                break
+            self.results.append(self._measure(job, history))
+        return self.ranked()
+
+    def _measure(self, job, history):
+        result = {"label": self.label(job), "options": job.options,
+                  "status": job.status, "output_dir": job.output_dir, "build_time": job.elapsed(),
+                  "cached": job.cache_hit, "size": None, "runtime": None, "cold": None, "error": job.error}
+        if job.returncode != 0:
+            return result
+        
+        # A restored build took no time, the build it came from did
+        if job.cache_hit and history is not None:
+            builds = history.builds(job.script_path, job.options)
+            if builds:
+                result["build_time"] = builds[-1]["duration"]
+        
+        benchmark = BuildBenchmark(job.script_path, job.options, job.output_dir, self.runs, self.timeout,
+                                   onefile_build_id=job.onefile_build_id)
+        if not benchmark.artifact:
+            result["error"] = "the built program was not found"
+            return result
+        result["artifact"] = benchmark.artifact
+        result["size"] = benchmark.measure_size(benchmark.bundle)["size"]
+        benchmark.forget_extraction()
+        
+        command = workload_command(self.workload, benchmark.artifact)
+        timing = benchmark.measure_startup(command, os.path.dirname(benchmark.artifact), benchmark.bundle)
+        if "error" in timing:
+            result["error"] = timing["error"]
+        else:
+            result["runtime"] = timing["warm"]
+            result["cold"] = timing["cold"]
+            if timing["returncode"]:
+                result["error"] = f"workload exited with code {timing['returncode']}"
+        return result
+
+    def label(self, job):
+        return self.describe_variant(self.variants[job.id]) or "(base options)"
+
+    def ranked(self):
+        """Fastest workload first, then the smallest and the quickest to build, failures last"""
+        def key(result):
+            measured = result["runtime"] is not None and not result["error"]
+            return (not measured, result["runtime"] or 0, result["size"] or 0, result["build_time"] or 0)
+        return sorted(self.results, key=key)
+
+    def cancel(self):
+        self.cancelled = True
+        if self.batch:
+            self.batch.cancel()
+
+    @staticmethod
+    def describe(results):
+        """Format ranked results as a table"""
+        def runtime(seconds):
+            return f"{seconds * 1000:.1f} ms" if seconds < 10 else format_duration(seconds)
+        
+        rows = [("#", "Options", "Build", "Size", "Runtime", "Cold")]
+        for index, result in enumerate(results, 1):
+            build = format_duration(result["build_time"]) + (" (cached)" if result["cached"] else "")
+            if result["runtime"] is not None and not result["error"]:
+                rows.append((str(index), result["label"], build, format_size(result["size"]),
+                             runtime(result["runtime"]), runtime(result["cold"])))
+            else:
+                problem = result["error"] or result["status"]
+                rows.append(("-", result["label"], build, format_size(result["size"]) if result["size"] else "",
+                             problem, ""))
+        widths = [max(len(row[column]) for row in rows) for column in range(5)]
+        return ["  ".join(value.ljust(width) for value, width in zip(row, widths + [0])).rstrip() for row in rows]
+
+
+class PgoBuild:
+    """Profile guided build: instrument, run the training command, rebuild with the recorded profile"""
+
+    def __init__(self, script_path, options, training, env=None, runs=BENCHMARK_RUNS, use_dependency_cache=False,
+                 auto_jobs=False, timeout=WORKLOAD_TIMEOUT, root=None):
+        # The profile flags are GCC's, MinGW included
+        if any(o == "--clang" or o.startswith("--msvc") for o in options):
+            raise ValueError("profile guided builds need GCC, remove --clang or --msvc")
+        
+        self.script_path = os.path.abspath(script_path)
+        self.options = [o for o in options if not o.startswith("--output-dir=")]
+        self.output_dir = os.path.dirname(self.script_path)
+        for option in options:
+            if option.startswith("--output-dir="):
+                self.output_dir = option.split("=", 1)[1]
+        self.training = training
+        self.env = dict(env or {})
+        self.runs = max(1, runs)
+        self.use_dependency_cache = use_dependency_cache
+        self.auto_jobs = auto_jobs
+        self.timeout = timeout
+        name = hashlib.sha256(self.script_path.encode("utf-8")).hexdigest()[:16]
+        self.root = os.path.join(root or PGO_DIR, name)
+        self.jobs = []
+        self.job = None
+        self.cancelled = False
+        self.result = None
+
+    def profile_dir(self, build_cache, toolchain_version):
+        """Directory of the profile data, valid while the sources, options and training stay the same"""
+        key = build_cache.compute_key(self.script_path, self.options, toolchain_version)
+        key = hashlib.sha256((key + self.training).encode("utf-8")).hexdigest()
+        return os.path.join(self.root, f"profile-{key[:16]}")
+
+    def _stage_env(self, template, profile_dir):
+        """Environment of a stage, Nuitka adds CCFLAGS and LDFLAGS to its own compiler flags"""
+        env = dict(self.env)
+        flags = template.format(profile=profile_dir)
+        for name in ("CCFLAGS", "LDFLAGS"):
+            env[name] = " ".join(filter(None, [os.environ.get(name, ""), self.env.get(name, ""), flags]))
+        return env
+
+    def _run_stage(self, name, env, use_cache, build_cache, toolchain_version, history, dependency_cache,
+                   on_output, on_job_start, on_job_done):
+        options = self.options + [f"--output-dir={os.path.join(self.root, name)}"]
+        job = CompilationJob(self.script_path, options, use_cache, env,
+                             use_dependency_cache=self.use_dependency_cache, auto_jobs=self.auto_jobs)
+        self.job = job
+        self.jobs.append(job)
+        if self.cancelled:
+            job.cancel()
+        if on_job_start:
+            on_job_start(job)
+        try:
+            job.run(build_cache, toolchain_version,
+                    on_output=lambda text: on_output(job, text) if on_output else None,
+                    history=history, dependency_cache=dependency_cache)
+        except Exception as e:
+            self._emit(f"ERROR: {str(e)}\n", on_output)
+        if on_job_done:
+            on_job_done(job)
+        if job.cancelled:
+            self.cancelled = True
+        return job
+
+    def _emit(self, text, on_output):
+        self.job.note(text)
+        if on_output:
+            on_output(self.job, text)
+
+    def _time(self, job, runs):
+        """Run the training command on the program of a stage, returns the timing or an error"""
+        benchmark = BuildBenchmark(self.script_path, job.options, job.output_dir, runs, self.timeout)
+        if not benchmark.artifact:
+            return {"error": "the built program was not found"}
+        return benchmark.measure_startup(workload_command(self.training, benchmark.artifact),
+                                         os.path.dirname(benchmark.artifact))
+
+    def run(self, build_cache, toolchain_version, on_output=None, on_job_start=None, on_job_done=None,
+            history=None, dependency_cache=None):
+        """Build the plain, instrumented and optimized stages, returns the exit code"""
+        def stage(name, env, use_cache, stage_history=None):
+            return self._run_stage(name, env, use_cache, build_cache, toolchain_version, stage_history,
+                                   dependency_cache, on_output, on_job_start, on_job_done)
+        
+        # The baseline, usually restored from the build cache
+        plain = stage("plain", self.env, True, history)
+        if plain.returncode != 0 or self.cancelled:
+            return plain.returncode if plain.returncode is not None else -1
+        
+        # Instrument and train only when the sources changed since the last profile
+        profile_dir = self.profile_dir(build_cache, toolchain_version)
+        marker = os.path.join(profile_dir, PGO_MARKER)
+        try:
+            with open(marker, "r", encoding="utf-8") as f:
+                recorded = json.load(f)
+            created = time.strftime("%Y-%m-%d %H:%M", time.localtime(recorded["created"]))
+            self._emit(f"PGO: reusing the profile recorded {created} for these sources "
+                       f"({recorded['files']} files)\n", on_output)
+        except (OSError, ValueError, KeyError):
+            for entry in os.listdir(self.root):
+                if entry.startswith("profile-"):
+                    remove_path(os.path.join(self.root, entry))
+            os.makedirs(profile_dir)
+            
+            # The build cache can't tell the stages apart, their flags are only in the environment
+            instrumented = stage("build", self._stage_env(PGO_GENERATE_FLAGS, profile_dir), False)
+            if instrumented.returncode != 0 or self.cancelled:
+                return instrumented.returncode if instrumented.returncode is not None else -1
+            
+            self._emit(f"PGO: training the instrumented build: {self.training or '(no arguments)'}\n", on_output)
+            training = self._time(instrumented, 1)
+            files = sum(name.endswith(".gcda") for _, _, names in os.walk(profile_dir) for name in names)
+            if "error" in training or not files:
+                problem = training.get("error") or "no profile data was written"
+                # The plain build works, only the optimization was lost
+                self._emit(f"Warning: PGO training run failed ({problem}), delivering the plain build\n", on_output)
+                self.result = {"error": problem}
+                self._deliver(plain, on_output)
+                return 0
+            self._emit(f"PGO: training took {format_duration(training['cold'])}, {files} profile files\n", on_output)
+            with open(marker, "w", encoding="utf-8") as f:
+                json.dump({"created": time.time(), "training": self.training, "files": files}, f)
+        
+        # Same build directory as the instrumented stage, the profile files are named after the object files
+        optimized = stage("build", self._stage_env(PGO_USE_FLAGS, profile_dir), False)
+        if optimized.returncode != 0 or self.cancelled:
+            return optimized.returncode if optimized.returncode is not None else -1
+        
+        # Both programs run the training command, one after the other
+        self.result = {"plain": self._time(plain, self.runs), "pgo": self._time(optimized, self.runs)}
+        plain_time, pgo_time = self.result["plain"].get("warm"), self.result["pgo"].get("warm")
+        if plain_time and pgo_time:
+            change = (plain_time / pgo_time - 1) * 100
+            self._emit(f"PGO: training command over {self.runs} runs: plain build {plain_time * 1000:.1f} ms, "
+                       f"PGO build {pgo_time * 1000:.1f} ms "
+                       f"({abs(change):.0f}% {'faster' if change >= 0 else 'slower'})\n", on_output)
+        else:
+            problem = self.result["plain"].get("error") or self.result["pgo"].get("error")
+            self._emit(f"PGO: runtimes not compared: {problem}\n", on_output)
+        
+        self._deliver(optimized, on_output)
+        return 0
+
+    def _deliver(self, job, on_output):
+        """Copy the artifacts of a stage to the output directory of the options"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        copied = 0
+        for name in BuildCache.collect_artifacts(job.output_dir, self.script_path):
+            copied += sync_tree(os.path.join(job.output_dir, name), os.path.join(self.output_dir, name))
+        self._emit(f"PGO: updated {copied} file{'s' if copied != 1 else ''} in {self.output_dir}\n", on_output)
+
+    def cancel(self):
+        """Stop the running stage and skip the remaining ones"""
+        self.cancelled = True
+        if self.job:
+            self.job.cancel()
+
 
 class SnakeGame:
     def __init__(self, parent_frame, theme):
@@ -114,8 +5080,10 @@ class SnakeGame:
         )
         self.info_label.pack(pady=5)
         
-        # Game variables
-        self.snake = []
+        # Game variables: the cells head first, the same cells as a set, and their canvas items
+        self.snake = collections.deque()
+        self.occupied = set()
+        self.segments = collections.deque()
         self.food = None
         self.direction = "Right"
         self.next_direction = "Right"
@@ -164,9 +5132,14 @@ class SnakeGame:
         self.update_score()
         
         # Reset snake
-        self.snake = []
+        self.snake = collections.deque()
+        self.occupied = set()
+        self.segments = collections.deque()
         for i in range(3):
-            self.snake.append((self.width//2 - i*self.cell_size, self.height//2))
+            cell = (self.width//2 - i*self.cell_size, self.height//2)
+            self.snake.append(cell)
+            self.occupied.add(cell)
+            self.segments.append(self.draw_segment(cell, i == 0))
         
         # Reset direction
         self.direction = "Right"
@@ -200,6 +5173,15 @@ class SnakeGame:
             self.canvas.delete("message")
             self.update()
     
+    def draw_segment(self, cell, head=False):
+        """Create the canvas item of one snake cell, returns its id"""
+        x, y = cell
+        return self.canvas.create_rectangle(
+            x, y, x + self.cell_size, y + self.cell_size,
+            fill=self.theme['accent_color'] if head else self.theme['text_color'],
+            tag="snake"
+        )
+
     def create_food(self):
         """Create a new food item at a random position"""
         cell_width = self.width // self.cell_size
@@ -211,7 +5193,7 @@ class SnakeGame:
             y = random.randint(1, cell_height - 2) * self.cell_size
             
             # Check if it overlaps with snake
-            if (x, y) not in self.snake:
+            if (x, y) not in self.occupied:
                 self.food = (x, y)
                 self.canvas.create_oval(
                     x, y, x + self.cell_size, y + self.cell_size,
@@ -257,9 +5239,9 @@ class SnakeGame:
         
         new_head = (head_x, head_y)
         
-        # Check for collisions
+        # Check for collisions, the tail still counts since it only moves after the head
         if (
-            new_head in self.snake or
+            new_head in self.occupied or
             head_x < 0 or head_x >= self.width or
             head_y < 0 or head_y >= self.height
         ):
@@ -269,8 +5251,12 @@ class SnakeGame:
             self.pause_button.config(state=tk.DISABLED)
             return
         
+        # The old head becomes part of the body
+        self.canvas.itemconfig(self.segments[0], fill=self.theme['text_color'])
+        
         # Add new head
-        self.snake.insert(0, new_head)
+        self.snake.appendleft(new_head)
+        self.occupied.add(new_head)
         
         # Check if food eaten
         if new_head == self.food:
@@ -281,21 +5267,18 @@ class SnakeGame:
             self.score += 10
             self.update_score()
             
+            # The snake grows by a new item at the head
+            self.segments.appendleft(self.draw_segment(new_head, True))
+            
             # Create new food
             self.create_food()
         else:
-            # Remove tail
-            self.snake.pop()
-        
-        # Redraw snake
-        self.canvas.delete("snake")
-        for i, (x, y) in enumerate(self.snake):
-            color = self.theme['accent_color'] if i == 0 else self.theme['text_color']
-            self.canvas.create_rectangle(
-                x, y, x + self.cell_size, y + self.cell_size,
-                fill=color,
-                tag="snake"
-            )
+            # Remove tail, its item is moved to the head instead of drawing a new one
+            self.occupied.discard(self.snake.pop())
+            segment = self.segments.pop()
+            self.canvas.coords(segment, head_x, head_y, head_x + self.cell_size, head_y + self.cell_size)
+            self.canvas.itemconfig(segment, fill=self.theme['accent_color'])
+            self.segments.appendleft(segment)
         
         # Continue the game loop
         self.after_id = self.parent.after(self.speed, self.update)
@@ -346,15 +5329,8 @@ class SnakeGame:
                     outline=self.theme['success_color'],
                     tag="animation"
                 )
-                self.snake.pop(0)
-                self.canvas.delete("snake")
-                
-                for x, y in self.snake:
-                    self.canvas.create_rectangle(
-                        x, y, x + self.cell_size, y + self.cell_size,
-                        fill=self.theme['text_color'],
-                        tag="snake"
-                    )
+                self.occupied.discard(self.snake.popleft())
+                self.canvas.delete(self.segments.popleft())
                 
                 self.parent.after(50, lambda: animate_disappear(iteration + 1))
         
@@ -363,6 +5339,459 @@ class SnakeGame:
         self.parent.after(1000, animate_disappear)
 
 
+class BatchWindow:
+    def __init__(self, app):
+        """Create the batch compilation window for the given application"""
+        self.app = app
+        self.theme = app.theme
+        self.batch = None
+        self.jobs = []
+        
+        self.window = tk.Toplevel(app.root)
+        self.window.title("Batch Compilation")
+        self.window.geometry("900x450")
+        self.window.configure(bg=self.theme['bg_color'])
+        
+        # Toolbar
+        toolbar = tk.Frame(self.window, bg=self.theme['bg_color'])
+        toolbar.pack(fill=tk.X, padx=10, pady=10)
+        
+        buttons = [
+            ("Add Scripts...", self.add_scripts),
+            ("Remove", self.remove_selected),
+            ("View Log", self.view_log),
+        ]
+        for text, command in buttons:
+            btn = tk.Button(
+                toolbar,
+                text=text,
+                command=command,
+                bg=self.theme['secondary_bg'],
+                fg=self.theme['text_color'],
+                font=("Segoe UI", 9),
+                relief=tk.FLAT,
+                padx=10,
+                pady=3,
+                cursor="hand2"
+            )
+            btn.pack(side=tk.LEFT, padx=(0, 5))
+            app.add_hover_effect(btn, self.theme['secondary_bg'], self.theme['accent_color'])
+        
+        self.cancel_btn = tk.Button(
+            toolbar,
+            text="Cancel",
+            command=self.cancel,
+            bg=self.theme['error_color'],
+            fg=self.theme['text_color'],
+            font=("Segoe UI", 9, "bold"),
+            relief=tk.FLAT,
+            padx=10,
+            pady=3,
+            cursor="hand2",
+            state=tk.DISABLED
+        )
+        self.cancel_btn.pack(side=tk.RIGHT)
+        
+        self.start_btn = tk.Button(
+            toolbar,
+            text="Start",
+            command=self.start,
+            bg=self.theme['accent_color'],
+            fg=self.theme['text_color'],
+            font=("Segoe UI", 9, "bold"),
+            relief=tk.FLAT,
+            padx=15,
+            pady=3,
+            cursor="hand2"
+        )
+        self.start_btn.pack(side=tk.RIGHT, padx=5)
+        app.add_hover_effect(self.start_btn, self.theme['accent_color'], self.theme['success_color'])
+        
+        # Number of concurrent Nuitka processes
+        self.workers_var = tk.StringVar(value=str(max(1, min(4, (os.cpu_count() or 2) // 4))))
+        tk.Spinbox(
+            toolbar,
+            from_=1,
+            to=16,
+            width=3,
+            textvariable=self.workers_var,
+            bg=self.theme['secondary_bg'],
+            fg=self.theme['text_color'],
+            font=("Segoe UI", 9)
+        ).pack(side=tk.RIGHT, padx=(5, 10))
+        
+        tk.Label(
+            toolbar,
+            text="Concurrent builds:",
+            bg=self.theme['bg_color'],
+            fg=self.theme['text_color'],
+            font=("Segoe UI", 9)
+        ).pack(side=tk.RIGHT)
+        
+        # Job list
+        columns = ("script", "status", "progress", "phase", "jobs", "time")
+        self.tree = ttk.Treeview(self.window, columns=columns, show="headings", selectmode="extended")
+        headings = {
+            "script": ("Script", 260),
+            "status": ("Status", 90),
+            "progress": ("Progress", 70),
+            "phase": ("Phase", 170),
+            "jobs": ("Jobs", 50),
+            "time": ("Time", 80)
+        }
+        for column, (heading, width) in headings.items():
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width, anchor="w" if column in ("script", "phase") else "center")
+        self.tree.pack(fill=tk.BOTH, expand=True, padx=10)
+        self.tree.bind("<Double-1>", lambda e: self.view_log())
+        
+        self.tree.tag_configure("succeeded", foreground=self.theme['success_color'])
+        self.tree.tag_configure("cached", foreground=self.theme['success_color'])
+        self.tree.tag_configure("failed", foreground=self.theme['error_color'])
+        
+        self.summary_label = tk.Label(
+            self.window,
+            text="Add scripts to the queue. Each script keeps the options selected when it was added.",
+            font=("Segoe UI", 9),
+            fg=self.theme['text_color'],
+            bg=self.theme['bg_color'],
+            anchor="w"
+        )
+        self.summary_label.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.refresh()
+
+    def add_scripts(self):
+        """Queue scripts with a snapshot of the current compilation options"""
+        paths = askopenfilenames(
+            title="Select Python Files",
+            filetypes=[("Python Files", "*.py"), ("All Files", "*.*")],
+            parent=self.window
+        )
+        
+        settings = self.app.get_compilation_settings()
+        options = build_nuitka_options(settings)
+        env = self.app.get_compilation_env(settings)
+        use_cache = self.app.options_vars.get("opt_build_cache", tk.BooleanVar(value=False)).get()
+        
+        for path in paths:
+            if not path.lower().endswith('.py') or not os.path.isfile(path):
+                self.app.append_to_terminal(f"Batch: skipped '{path}', not a Python file\n")
+                continue
+            
+            job = CompilationJob(path, options, use_cache, env, settings["incremental"],
+                                 use_dependency_cache=settings["dependency_cache"],
+                                 auto_jobs=settings["jobs"] == "auto",
+                                 farm_workers=settings["farm_workers"],
+                                 benchmark_runs=settings["benchmark_runs"])
+            self.jobs.append(job)
+            self.tree.insert("", tk.END, iid=str(job.id), values=(job.name, job.status, "0%", "", "", ""))
+            
+            # Jobs added while the pool is busy join the running batch
+            if self.batch and self.batch.is_running():
+                self.batch.add(job)
+
+    def selected_jobs(self):
+        selected = set(self.tree.selection())
+        return [job for job in self.jobs if str(job.id) in selected]
+
+    def remove_selected(self):
+        """Remove selected jobs that haven't started"""
+        for job in self.selected_jobs():
+            if job.status == "running":
+                continue
+            if self.batch and job in self.batch.jobs:
+                self.batch.remove(job)
+            self.jobs.remove(job)
+            self.tree.delete(str(job.id))
+
+    def start(self):
+        """Run every pending job on the worker pool"""
+        pending = [job for job in self.jobs if job.status == "pending"]
+        if not pending:
+            messagebox.showinfo("Batch Compilation", "There are no pending scripts in the queue", parent=self.window)
+            return
+        
+        try:
+            workers = int(self.workers_var.get())
+        except ValueError:
+            workers = 1
+        
+        # The parallel jobs budget is shared by all concurrent builds, "auto" shares the CPU count
+        total_jobs = None
+        if self.app.options_vars.get("opt_jobs", tk.BooleanVar(value=False)).get():
+            try:
+                total_jobs = int(self.app.jobs_var.get())
+            except ValueError:
+                pass
+        
+        self.app.apply_cache_limit()
+        self.batch = BatchCompiler(
+            max_workers=workers,
+            total_jobs=total_jobs,
+            build_cache=self.app.build_cache,
+            on_job_done=self.job_done,
+            get_toolchain_version=lambda: self.app.toolchain.wait(30).get("nuitka_version", ""),
+            history=self.app.build_history,
+            dependency_cache=self.app.dependency_cache
+        )
+        for job in pending:
+            self.batch.add(job)
+        
+        self.app.append_to_terminal(
+            f"\n=== Starting Batch: {len(pending)} scripts, {min(workers, len(pending))} concurrent builds, "
+            f"{self.batch.total_jobs} jobs budget ===\n")
+        self.batch.start()
+        self.start_btn.config(state=tk.DISABLED)
+        self.cancel_btn.config(state=tk.NORMAL)
+
+    def job_done(self, job):
+        """Report a finished job in the main terminal, called from a worker thread"""
+        message = f"Batch: {job.name} {job.status} in {self.app.format_time(job.elapsed())}"
+        if job.status == "failed":
+            message += f" (return code {job.returncode})" if job.error is None else f" ({job.error})"
+        self.app.output_queue.put(message + "\n")
+
+    def cancel(self):
+        if self.batch:
+            self.batch.cancel()
+            self.app.append_to_terminal("Batch cancelled.\n")
+
+    def refresh(self):
+        """Update the job list from the state of the running jobs"""
+        if not self.window.winfo_exists():
+            return
+        
+        for job in self.jobs:
+            phase = PHASE_LABELS.get(job.phase, "") if job.status == "running" else ""
+            self.tree.item(str(job.id), values=(
+                job.name,
+                job.status,
+                f"{int(job.progress)}%",
+                phase,
+                job.jobs or "",
+                self.app.format_time(job.elapsed()) if job.start_time else ""
+            ), tags=(job.status,))
+        
+        counts = {}
+        for job in self.jobs:
+            counts[job.status] = counts.get(job.status, 0) + 1
+        if self.jobs:
+            self.summary_label.config(text="  ".join(f"{status}: {count}" for status, count in sorted(counts.items())))
+        
+        running = bool(self.batch and self.batch.is_running())
+        self.start_btn.config(state=tk.DISABLED if running else tk.NORMAL)
+        self.cancel_btn.config(state=tk.NORMAL if running else tk.DISABLED)
+        
+        self.window.after(300, self.refresh)
+
+    def view_log(self):
+        """Show the output of the selected job in its own window"""
+        for job in self.selected_jobs()[:1]:
+            log_window = tk.Toplevel(self.window)
+            log_window.title(f"Log - {job.name}")
+            log_window.geometry("800x500")
+            
+            text = scrolledtext.ScrolledText(
+                log_window,
+                bg=self.theme['terminal_bg'],
+                fg=self.theme['terminal_text'],
+                font=("Consolas", 9),
+                relief=tk.FLAT
+            )
+            text.pack(fill=tk.BOTH, expand=True)
+            
+            # Follow the log while the job is running
+            def follow(shown=0):
+                if not log_window.winfo_exists():
+                    return
+                lines, shown = job.log_since(shown)
+                if lines:
+                    text.insert(tk.END, "".join(lines))
+                    text.see(tk.END)
+                if job.status in ("pending", "running"):
+                    log_window.after(500, lambda: follow(shown))
+            
+            follow()
+
+    def close(self):
+        """Hide the window, running jobs keep going"""
+        self.window.withdraw()
+
+
+class LogViewer:
+    def __init__(self, app, output_log):
+        """Create a window that pages through the full terminal log on disk"""
+        self.app = app
+        self.theme = app.theme
+        self.log = output_log
+        self.start = 0
+        self.highlight_line = None
+        
+        self.window = tk.Toplevel(app.root)
+        self.window.title("Terminal History")
+        self.window.geometry("900x600")
+        self.window.configure(bg=self.theme['bg_color'])
+        
+        # Search bar
+        search_frame = tk.Frame(self.window, bg=self.theme['bg_color'])
+        search_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.search_entry = tk.Entry(
+            search_frame,
+            bg=self.theme['terminal_bg'],
+            fg=self.theme['terminal_text'],
+            insertbackground=self.theme['terminal_text'],
+            font=("Consolas", 9)
+        )
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        self.search_entry.bind("<Return>", lambda e: self.search())
+        
+        self.regex_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            search_frame,
+            text="Regex",
+            variable=self.regex_var,
+            bg=self.theme['bg_color'],
+            fg=self.theme['text_color'],
+            selectcolor=self.theme['secondary_bg'],
+            activebackground=self.theme['bg_color'],
+            highlightthickness=0
+        ).pack(side=tk.LEFT)
+        
+        for text, command in (("Search", self.search), ("Go to End", self.go_to_end)):
+            btn = tk.Button(
+                search_frame,
+                text=text,
+                command=command,
+                bg=self.theme['accent_color'],
+                fg=self.theme['text_color'],
+                font=("Segoe UI", 9),
+                relief=tk.FLAT,
+                padx=10,
+                cursor="hand2"
+            )
+            btn.pack(side=tk.LEFT, padx=(5, 0))
+            app.add_hover_effect(btn, self.theme['accent_color'], self.theme['success_color'])
+        
+        self.position_label = tk.Label(
+            self.window,
+            text="",
+            font=("Segoe UI", 9),
+            fg=self.theme['accent_color'],
+            bg=self.theme['bg_color'],
+            anchor="w"
+        )
+        self.position_label.pack(fill=tk.X, padx=10)
+        
+        # Search results
+        self.results = tk.Listbox(
+            self.window,
+            height=6,
+            bg=self.theme['secondary_bg'],
+            fg=self.theme['text_color'],
+            font=("Consolas", 9),
+            relief=tk.FLAT
+        )
+        self.results.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(5, 10))
+        self.results.bind("<Double-1>", self.jump_to_result)
+        self.result_lines = []
+        
+        # Only the visible lines are loaded, the scrollbar covers the whole file
+        view_frame = tk.Frame(self.window, bg=self.theme['terminal_bg'])
+        view_frame.pack(fill=tk.BOTH, expand=True, padx=10)
+        
+        self.scrollbar = ttk.Scrollbar(view_frame, orient="vertical", command=self.on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.text = tk.Text(
+            view_frame,
+            bg=self.theme['terminal_bg'],
+            fg=self.theme['terminal_text'],
+            font=("Consolas", 9),
+            relief=tk.FLAT,
+            wrap=tk.NONE,
+            padx=5,
+            pady=5
+        )
+        self.text.pack(fill=tk.BOTH, expand=True)
+        self.text.tag_configure("match", background=self.theme['accent_color'])
+        self.text.bind("<MouseWheel>", lambda e: self.on_scroll("scroll", -1 if e.delta > 0 else 1, "units"))
+        self.text.bind("<Button-4>", lambda e: self.on_scroll("scroll", -1, "units"))
+        self.text.bind("<Button-5>", lambda e: self.on_scroll("scroll", 1, "units"))
+        self.text.bind("<Prior>", lambda e: self.on_scroll("scroll", -1, "pages"))
+        self.text.bind("<Next>", lambda e: self.on_scroll("scroll", 1, "pages"))
+        self.text.bind("<Configure>", lambda e: self.render())
+        
+        self.window.after(50, self.go_to_end)
+
+    def visible_lines(self):
+        linespace = max(1, tkfont.Font(font=self.text.cget("font")).metrics("linespace"))
+        return max(10, self.text.winfo_height() // linespace)
+
+    def render(self):
+        """Load the lines at the current position from the log file"""
+        total = self.log.line_count()
+        count = self.visible_lines()
+        self.start = max(0, min(self.start, total - count))
+        lines = self.log.read_lines(self.start, count)
+        
+        self.text.config(state=tk.NORMAL)
+        self.text.delete(1.0, tk.END)
+        self.text.insert(tk.END, "".join(lines))
+        if self.highlight_line is not None and self.start <= self.highlight_line < self.start + count:
+            row = self.highlight_line - self.start + 1
+            self.text.tag_add("match", f"{row}.0", f"{row}.end")
+        self.text.config(state=tk.DISABLED)
+        
+        if total:
+            self.scrollbar.set(self.start / total, min(1.0, (self.start + len(lines)) / total))
+        self.position_label.config(
+            text=f"Lines {self.start + 1}-{self.start + len(lines)} of {total}  |  {self.log.path}")
+
+    def on_scroll(self, action, amount=None, unit=None):
+        """Scrollbar and mouse wheel handler working in whole-file coordinates"""
+        if action == "moveto":
+            self.start = int(float(amount) * self.log.line_count())
+        elif action == "scroll":
+            step = self.visible_lines() - 1 if unit == "pages" else 3
+            self.start += int(amount) * step
+        self.render()
+        return "break"
+
+    def go_to_end(self):
+        self.start = self.log.line_count()
+        self.render()
+
+    def search(self):
+        """Search the full log and list the matching lines"""
+        pattern = self.search_entry.get().strip()
+        self.results.delete(0, tk.END)
+        if not pattern:
+            return
+        
+        try:
+            self.result_lines = self.log.search(pattern, use_regex=self.regex_var.get())
+        except re.error as e:
+            self.results.insert(tk.END, f"Invalid regular expression: {str(e)}")
+            return
+        
+        for line_no, line in self.result_lines:
+            self.results.insert(tk.END, f"{line_no + 1:>8}: {line}")
+        if not self.result_lines:
+            self.results.insert(tk.END, "No matches")
+
+    def jump_to_result(self, event=None):
+        selection = self.results.curselection()
+        if not selection or selection[0] >= len(self.result_lines):
+            return
+        
+        self.highlight_line = self.result_lines[selection[0]][0]
+        self.start = max(0, self.highlight_line - self.visible_lines() // 2)
+        self.render()
+
+
 class NuitkaCompilerApp:
     def __init__(self, root):
         self.root = root
@@ -405,6 +5834,7 @@ class NuitkaCompilerApp:
         
         # Output queue and state tracking
         self.output_queue = queue.Queue()
+        self.output_backlog = collections.deque()
         self.compilation_start_time = None
         self.compilation_progress = 0
         self.eta_text = "Calculating..."
@@ -412,6 +5842,38 @@ class NuitkaCompilerApp:
         self.smooth_progress_timer = None
         self.target_progress = 0
         
+        # Build cache for skipping Nuitka when inputs are unchanged
+        self.build_cache = BuildCache()
+        
+        # Previous builds of each project, for predicting the next one
+        self.build_history = BuildHistory()
+        self.current_job = None
+        
+        # Build started when a script is selected, adopted by Compile
+        self.speculative = None
+        
+        # Watch mode, a change during a build waits for the obsolete build to stop
+        self.watcher = None
+        self.watch_pending = False
+        
+        # Flag matrix explorer started from the terminal
+        self.explorer = None
+        self.cancel_requested = False
+        
+        # Third-party packages compiled once and shared by all projects
+        self.dependency_cache = DependencyCache()
+        
+        # Terminal commands and toolchain probes run on warm shells and interpreters
+        self.worker_pool = WorkerPool()
+        self.worker_pool.warm()
+        self.shell_task = None
+        
+        # Detect the toolchain in the background, the cached result is used meanwhile
+        self.toolchain = ToolchainProbe(pool=self.worker_pool)
+        self.toolchain.start()
+        self.toolchain.when_ready(self.toolchain_detected)
+        self.compile_when_ready = False
+        
         # Progress tracking
         self.progress_model = {
             "dependency_scan": {"weight": 10, "complete": False},
@@ -421,15 +5883,14 @@ class NuitkaCompilerApp:
             "packaging": {"weight": 10, "complete": False}
         }
         self.current_phase = "waiting"
-        self.output_log = []
-        
-        # Regex patterns for progress tracking
-        self.percentage_patterns = [
-            re.compile(r"(\d+)% completed"),
-            re.compile(r"Progress: (\d+)%"),
-            re.compile(r"Overall completion: (\d+)%"),
-            re.compile(r"Nuitka:INFO: (\d+)% done")
-        ]
+        
+        # Only recent output is kept in memory, everything is spilled to disk
+        self.output_log = collections.deque(maxlen=TERMINAL_MAX_LINES)
+        try:
+            self.full_log = OutputLog()
+        except OSError:
+            self.full_log = None
+        self.log_viewer = None
         
         # Command history for terminal
         self.command_history = []
@@ -438,6 +5899,13 @@ class NuitkaCompilerApp:
         # Success notification panel (initially hidden)
         self.success_panel_visible = False
         
+        # Batch compilation window (created on demand)
+        self.batch_window = None
+        
+        # Import graph of the selected script, scanned in the background
+        self.import_graph = None
+        self.import_scan_id = 0
+        
         # Create the main layout
         self.create_layout()
         
@@ -620,6 +6088,39 @@ class NuitkaCompilerApp:
             cursor="hand2"
         )
         self.compile_btn.pack(side=tk.RIGHT)
+        
+        # Cancel button, only enabled while a build runs
+        self.cancel_btn = tk.Button(
+            compile_frame,
+            text="Cancel",
+            command=self.cancel_compilation,
+            bg=self.theme['secondary_bg'],
+            fg=self.theme['text_color'],
+            font=("Segoe UI", 10),
+            relief=tk.GROOVE,
+            padx=15,
+            pady=8,
+            borderwidth=0,
+            cursor="hand2",
+            state=tk.DISABLED
+        )
+        self.cancel_btn.pack(side=tk.RIGHT, padx=(0, 10))
+        
+        # Batch button
+        self.batch_btn = tk.Button(
+            compile_frame,
+            text="Batch...",
+            command=self.open_batch_window,
+            bg=self.theme['accent_color'],
+            fg=self.theme['text_color'],
+            font=("Segoe UI", 10),
+            relief=tk.GROOVE,
+            padx=15,
+            pady=8,
+            borderwidth=0,
+            cursor="hand2"
+        )
+        self.batch_btn.pack(side=tk.RIGHT, padx=(0, 10))
 
     def create_options_panel(self):
         """Create compilation options panel"""
@@ -736,6 +6237,17 @@ class NuitkaCompilerApp:
         )
         self.location_label.pack(fill=tk.X, pady=2)
         
+        self.profile_label = tk.Label(
+            details_frame,
+            text="",
+            font=("Segoe UI", 9),
+            fg=self.theme['text_color'],
+            bg=self.theme['bg_color'],
+            anchor="w",
+            justify=tk.LEFT
+        )
+        self.profile_label.pack(fill=tk.X, pady=2)
+        
         # Button frame
         btn_frame = tk.Frame(self.success_frame, bg=self.theme['bg_color'])
         btn_frame.pack(fill=tk.X, padx=20, pady=10)
@@ -774,11 +6286,13 @@ class NuitkaCompilerApp:
         self.add_hover_effect(ok_btn, self.theme['accent_color'], self.theme['success_color'])
         self.add_hover_effect(open_btn, self.theme['secondary_bg'], self.theme['accent_color'])
 
-    def show_success_panel(self, executable_name):
+    def show_success_panel(self, executable_name, profile=None, benchmark=None):
         """Show the success notification panel with executable details"""
         # Update text
         self.executable_label.config(text=f"Executable created: {executable_name}")
         self.location_label.config(text=f"Location: {self.output_dir}")
+        lines = (profile.summary() if profile else []) + (BuildBenchmark.summary(benchmark) if benchmark else [])
+        self.profile_label.config(text="\n".join(lines))
         
         # Show the panel if not already visible
         if not self.success_panel_visible:
@@ -799,9 +6313,12 @@ class NuitkaCompilerApp:
         mode_options = [
             {"name": "standalone", "text": "Standalone", "tooltip": "Create standalone package with all dependencies", "default": True},
             {"name": "onefile", "text": "Onefile", "tooltip": "Combine everything into a single executable file"},
+            {"name": "onefile_cache", "text": "Onefile: Cache Extraction", "tooltip": "Unpack a onefile program into the user cache on its first launch and reuse it on later launches, instead of unpacking it to a new temporary folder every time"},
+            {"name": "onefile_no_compression", "text": "Onefile: No Compression", "tooltip": "Store the onefile payload uncompressed: a larger file that starts without decompressing"},
             {"name": "module", "text": "Module", "tooltip": "Compile as Python extension module"},
             {"name": "follow_imports", "text": "Follow Imports", "tooltip": "Automatically follow all imports", "default": True},
-            {"name": "no_follow_imports", "text": "No Follow Imports", "tooltip": "Don't automatically follow imports"}
+            {"name": "no_follow_imports", "text": "No Follow Imports", "tooltip": "Don't automatically follow imports"},
+            {"name": "incremental", "text": "Incremental Build", "tooltip": "Keep the build directory between builds, with the compiler cache only changed modules are compiled again, without it every module is"}
         ]
         
         self.add_checkboxes(mode_frame, "mode", mode_options)
@@ -813,7 +6330,14 @@ class NuitkaCompilerApp:
         
         opt_options = [
             {"name": "lto", "text": "Link Time Optimization (LTO)", "tooltip": "Enable link-time optimization"},
-            {"name": "jobs", "text": "Parallel Jobs", "tooltip": "Use multiple processors for compilation", "default": True}
+            {"name": "jobs", "text": "Parallel Jobs", "tooltip": "Use multiple processors for compilation", "default": True},
+            {"name": "build_cache", "text": "Build Cache", "tooltip": "Restore previous output when script, imports, options and Nuitka version are unchanged", "default": True},
+            {"name": "compiler_cache", "text": "Compiler Cache (ccache)", "tooltip": "Cache compiled C files with ccache (clcache on Windows) and report hit rates", "default": True},
+            {"name": "dependency_cache", "text": "Dependency Cache", "tooltip": "Compile pure Python third-party packages once as extension modules and reuse them in every project"},
+            {"name": "build_farm", "text": "Build Farm", "tooltip": "Compile the C files on build farm workers, 'local' runs a worker process on this machine"},
+            {"name": "speculative", "text": "Speculative Build", "tooltip": "Start building a script in the background with the current options as soon as it is selected, Compile uses that build when the options did not change"},
+            {"name": "pgo", "text": "Profile Guided Optimization (PGO)", "tooltip": "Build an instrumented program, run the training command on it and build again with the recorded profile (GCC only)"},
+            {"name": "benchmark", "text": "Startup Benchmark", "tooltip": "After each build, start the program and the script under CPython a few times, compare their startup and flag size or startup regressions"}
         ]
         
         self.add_checkboxes(opt_frame, "opt", opt_options)
@@ -831,19 +6355,147 @@ class NuitkaCompilerApp:
         )
         jobs_label.pack(side=tk.LEFT, padx=(5, 5))
         
-        self.jobs_var = tk.StringVar(value=str(max(1, os.cpu_count() or 4)))
+        # "auto" sizes the jobs to the cores and free memory, and backs off under memory pressure
+        self.jobs_var = tk.StringVar(value="auto")
         
         jobs_spinbox = tk.Spinbox(
             jobs_frame, 
-            from_=1, 
-            to=32, 
-            width=3,
+            values=("auto",) + tuple(str(i) for i in range(1, max(32, os.cpu_count() or 1) + 1)),
+            width=5,
             textvariable=self.jobs_var,
             bg=self.theme['secondary_bg'],
             fg=self.theme['text_color'],
             font=("Segoe UI", 9)
         )
         jobs_spinbox.pack(side=tk.LEFT, padx=(5, 0))
+        
+        # Build cache size limit
+        cache_frame = tk.Frame(opt_frame, bg=self.theme['bg_color'])
+        cache_frame.pack(fill=tk.X, pady=5, padx=25)
+        
+        cache_label = tk.Label(
+            cache_frame,
+            text="Build cache limit (MB):",
+            bg=self.theme['bg_color'],
+            fg=self.theme['text_color'],
+            font=("Segoe UI", 9)
+        )
+        cache_label.pack(side=tk.LEFT, padx=(5, 5))
+        
+        self.cache_limit_var = tk.StringVar(value=str(self.build_cache.max_size // (1024 * 1024)))
+        
+        cache_spinbox = tk.Spinbox(
+            cache_frame,
+            from_=0,
+            to=1024 * 1024,
+            increment=256,
+            width=7,
+            textvariable=self.cache_limit_var,
+            bg=self.theme['secondary_bg'],
+            fg=self.theme['text_color'],
+            font=("Segoe UI", 9)
+        )
+        cache_spinbox.pack(side=tk.LEFT, padx=(5, 0))
+        
+        # Compiler cache directory and size limit
+        ccache_frame = tk.Frame(opt_frame, bg=self.theme['bg_color'])
+        ccache_frame.pack(fill=tk.X, pady=5, padx=25)
+        
+        tk.Label(
+            ccache_frame,
+            text="ccache directory:",
+            bg=self.theme['bg_color'],
+            fg=self.theme['text_color'],
+            font=("Segoe UI", 9)
+        ).pack(side=tk.LEFT, padx=(5, 5))
+        
+        self.ccache_dir_var = tk.StringVar(value="")
+        tk.Entry(
+            ccache_frame,
+            textvariable=self.ccache_dir_var,
+            width=24,
+            bg=self.theme['secondary_bg'],
+            fg=self.theme['text_color'],
+            insertbackground=self.theme['text_color'],
+            font=("Segoe UI", 9)
+        ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 5))
+        
+        tk.Button(
+            ccache_frame,
+            text="...",
+            command=self.browse_ccache_dir,
+            bg=self.theme['accent_color'],
+            fg=self.theme['text_color'],
+            font=("Segoe UI", 9),
+            relief=tk.FLAT,
+            padx=6,
+            cursor="hand2"
+        ).pack(side=tk.LEFT)
+        
+        tk.Label(
+            ccache_frame,
+            text="Max size:",
+            bg=self.theme['bg_color'],
+            fg=self.theme['text_color'],
+            font=("Segoe UI", 9)
+        ).pack(side=tk.LEFT, padx=(10, 5))
+        
+        self.ccache_size_var = tk.StringVar(value=DEFAULT_CCACHE_SIZE)
+        tk.Entry(
+            ccache_frame,
+            textvariable=self.ccache_size_var,
+            width=6,
+            bg=self.theme['secondary_bg'],
+            fg=self.theme['text_color'],
+            insertbackground=self.theme['text_color'],
+            font=("Segoe UI", 9)
+        ).pack(side=tk.LEFT)
+        
+        # Build farm workers, 'local[:slots]' or 'host:port' of a 'compyler.py farm-worker'
+        farm_frame = tk.Frame(opt_frame, bg=self.theme['bg_color'])
+        farm_frame.pack(fill=tk.X, pady=5, padx=25)
+        
+        tk.Label(
+            farm_frame,
+            text="Farm workers:",
+            bg=self.theme['bg_color'],
+            fg=self.theme['text_color'],
+            font=("Segoe UI", 9)
+        ).pack(side=tk.LEFT, padx=(5, 5))
+        
+        self.farm_workers_var = tk.StringVar(value="local")
+        tk.Entry(
+            farm_frame,
+            textvariable=self.farm_workers_var,
+            width=30,
+            bg=self.theme['secondary_bg'],
+            fg=self.theme['text_color'],
+            insertbackground=self.theme['text_color'],
+            font=("Segoe UI", 9)
+        ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+        
+        # Training command of profile guided builds
+        pgo_frame = tk.Frame(opt_frame, bg=self.theme['bg_color'])
+        pgo_frame.pack(fill=tk.X, pady=5, padx=25)
+        
+        tk.Label(
+            pgo_frame,
+            text="PGO training command:",
+            bg=self.theme['bg_color'],
+            fg=self.theme['text_color'],
+            font=("Segoe UI", 9)
+        ).pack(side=tk.LEFT, padx=(5, 5))
+        
+        self.pgo_training_var = tk.StringVar(value="{program}")
+        tk.Entry(
+            pgo_frame,
+            textvariable=self.pgo_training_var,
+            width=30,
+            bg=self.theme['secondary_bg'],
+            fg=self.theme['text_color'],
+            insertbackground=self.theme['text_color'],
+            font=("Segoe UI", 9)
+        ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
 
     def create_gui_tab(self):
         """Create GUI options tab"""
@@ -979,6 +6631,22 @@ class NuitkaCompilerApp:
         )
         self.clear_btn.pack(side=tk.RIGHT)
         
+        # History button
+        self.history_btn = tk.Button(
+            terminal_header,
+            text="History",
+            command=self.open_log_viewer,
+            bg=self.theme['secondary_bg'],
+            fg=self.theme['text_color'],
+            font=("Segoe UI", 8),
+            relief=tk.GROOVE,
+            padx=10,
+            pady=2,
+            borderwidth=0,
+            cursor="hand2"
+        )
+        self.history_btn.pack(side=tk.RIGHT, padx=(0, 5))
+        
         # Progress bar
         self.progress_bar = ttk.Progressbar(
             self.terminal_panel,
@@ -1124,7 +6792,10 @@ class NuitkaCompilerApp:
             (self.browse_btn, self.theme['accent_color'], self.theme['success_color']),
             (self.output_browse_btn, self.theme['accent_color'], self.theme['success_color']),
             (self.compile_btn, self.theme['accent_color'], self.theme['success_color']),
+            (self.batch_btn, self.theme['accent_color'], self.theme['success_color']),
+            (self.cancel_btn, self.theme['secondary_bg'], self.theme['error_color']),
             (self.clear_btn, self.theme['secondary_bg'], self.theme['accent_color']),
+            (self.history_btn, self.theme['secondary_bg'], self.theme['accent_color']),
             (self.send_btn, self.theme['accent_color'], self.theme['success_color'])
         ]
         
@@ -1226,10 +6897,83 @@ class NuitkaCompilerApp:
             self.status_label.config(text=f"Python script selected: {os.path.basename(file_path)}")
             self.append_to_terminal(f"File selected: {file_path}\n")
             
+            # Find out how big the build will be while the options are being chosen
+            self.start_import_scan(file_path)
+            self.start_speculative_build(file_path)
+        
+            # Watch mode follows the selected script
+            if self.watcher:
+                self.start_watch(file_path)
+        
         except Exception as e:
             self.append_to_terminal(f"Error during file selection: {str(e)}\n")
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
+    def start_speculative_build(self, file_path):
+        """Start building a newly selected script with the current options before Compile is pressed"""
+        self.discard_speculative_build()
+        if not self.options_vars.get("opt_speculative", tk.BooleanVar(value=False)).get():
+            return
+        
+        settings = self.get_compilation_settings()
+        speculative = SpeculativeBuild(file_path, build_nuitka_options(settings), self.get_compilation_env(settings),
+                                       incremental=settings["incremental"],
+                                       use_dependency_cache=settings["dependency_cache"],
+                                       auto_jobs=settings["jobs"] == "auto",
+                                       benchmark_runs=settings["benchmark_runs"])
+        self.speculative = speculative.start(
+            self.build_cache, lambda: self.toolchain.wait(30).get("nuitka_version", ""),
+            history=self.build_history, dependency_cache=self.dependency_cache,
+            on_done=lambda build: self.output_queue.put(build.describe() + "\n"))
+        self.append_to_terminal("Speculative build started in the background with the current options\n")
+
+    def discard_speculative_build(self):
+        """Stop a speculative build that can no longer be used"""
+        if self.speculative:
+            speculative, self.speculative = self.speculative, None
+            speculative.discard()
+
+    def start_import_scan(self, file_path, top=5):
+        """Scan the import graph of a script in a worker thread"""
+        self.import_scan_id += 1
+        scan_id = self.import_scan_id
+        self.import_graph = None
+        
+        def run():
+            try:
+                graph = ImportGraph(file_path).scan()
+            except Exception as e:
+                self.output_queue.put(f"Import scan failed: {str(e)}\n")
+                return
+            self.root.after(0, lambda: self.import_scan_finished(graph, scan_id, top))
+        
+        threading.Thread(target=run, daemon=True).start()
+
+    def import_scan_finished(self, graph, scan_id, top=5):
+        """Show the result of an import scan, unless another script was selected meanwhile"""
+        if scan_id != self.import_scan_id:
+            return
+        self.import_graph = graph
+        self.append_to_terminal("\n".join(graph.describe(top)) + "\n")
+        
+        if self.compilation_start_time is None:
+            self.status_label.config(
+                text=f"Python script selected: {os.path.basename(graph.script_path)} "
+                     f"({graph.module_count} modules, {format_size(graph.total_size)} of sources)")
+
+    def handle_scan_command(self, args):
+        """Scan the import graph of the selected script again"""
+        if not self.file_path:
+            self.append_to_terminal("No script selected.\n")
+            return
+        try:
+            top = int(args[0]) if args else 10
+        except ValueError:
+            self.append_to_terminal("Usage: scan [N]\n")
+            return
+        self.append_to_terminal(f"Scanning the imports of {os.path.basename(self.file_path)}...\n")
+        self.start_import_scan(self.file_path, top)
+
     def browse_output_dir(self):
         """Open directory browser to select output directory"""
         try:
@@ -1251,6 +6995,18 @@ class NuitkaCompilerApp:
             messagebox.showerror("Error", f"Error selecting output directory: {str(e)}")
             self.append_to_terminal(f"Error selecting output directory: {str(e)}\n")
 
+    def browse_ccache_dir(self):
+        """Select the directory used by the C compiler cache"""
+        directory = askdirectory(
+            title="Select Compiler Cache Directory",
+            initialdir=self.ccache_dir_var.get() or os.path.expanduser("~"),
+            parent=self.root
+        )
+        
+        if directory:
+            self.ccache_dir_var.set(directory)
+            self.append_to_terminal(f"Compiler cache directory selected: {directory}\n")
+
     def browse_icon(self):
         """Browse for an icon file for the executable"""
         icon_path = askopenfilename(
@@ -1264,57 +7020,61 @@ class NuitkaCompilerApp:
             self.icon_label.config(text=os.path.basename(icon_path))
             self.append_to_terminal(f"Icon selected: {icon_path}\n")
 
-    def get_compilation_options(self):
-        """Get selected Nuitka options as command line arguments"""
-        options = []
-        
-        # Mode options
-        if self.options_vars.get("mode_standalone", tk.BooleanVar(value=False)).get():
-            options.append("--standalone")
-        
-        if self.options_vars.get("mode_onefile", tk.BooleanVar(value=False)).get():
-            options.append("--onefile")
-        
-        if self.options_vars.get("mode_module", tk.BooleanVar(value=False)).get():
-            options.append("--module")
-        
-        if self.options_vars.get("mode_follow_imports", tk.BooleanVar(value=False)).get():
-            options.append("--follow-imports")
-        
-        if self.options_vars.get("mode_no_follow_imports", tk.BooleanVar(value=False)).get():
-            options.append("--no-follow-imports")
-        
-        # Optimization options
-        if self.options_vars.get("opt_lto", tk.BooleanVar(value=False)).get():
-            options.append("--lto")
-        
-        if self.options_vars.get("opt_jobs", tk.BooleanVar(value=False)).get():
-            try:
-                jobs = int(self.jobs_var.get())
-                options.append(f"--jobs={jobs}")
-            except ValueError:
-                pass
-        
-        # GUI options
-        if self.options_vars.get("gui_disable_console", tk.BooleanVar(value=False)).get():
-            options.append("--windows-disable-console")
-        
-        if self.options_vars.get("gui_enable_tk", tk.BooleanVar(value=False)).get():
-            options.append("--enable-plugin=tk-inter")
-        
-        if self.options_vars.get("gui_windows_icon", tk.BooleanVar(value=False)).get() and self.icon_path:
-            options.append(f"--windows-icon={self.icon_path}")
+    def get_compilation_settings(self):
+        """Collect the values of the option tabs into a settings dictionary"""
+        def enabled(name):
+            var = self.options_vars.get(name)
+            return bool(var is not None and var.get())
+        
+        jobs = None
+        if enabled("opt_jobs"):
+            if self.jobs_var.get().strip().lower() == "auto":
+                jobs = "auto"
+            else:
+                try:
+                    jobs = int(self.jobs_var.get())
+                except ValueError:
+                    pass
         
-        # Custom options
+        custom_options = []
         if hasattr(self, 'custom_options'):
-            custom_text = self.custom_options.get(1.0, tk.END).strip()
-            if custom_text:
-                options.extend(custom_text.split())
-        
-        # Always add output directory
-        options.append(f"--output-dir={self.output_dir}")
+            custom_options = self.custom_options.get(1.0, tk.END).strip().split()
+        
+        return {
+            "standalone": enabled("mode_standalone"),
+            "onefile": enabled("mode_onefile"),
+            "onefile_cache": enabled("mode_onefile_cache"),
+            "onefile_no_compression": enabled("mode_onefile_no_compression"),
+            "module": enabled("mode_module"),
+            "follow_imports": enabled("mode_follow_imports"),
+            "no_follow_imports": enabled("mode_no_follow_imports"),
+            "incremental": enabled("mode_incremental"),
+            "lto": enabled("opt_lto"),
+            "jobs": jobs,
+            "compiler_cache": enabled("opt_compiler_cache"),
+            "dependency_cache": enabled("opt_dependency_cache"),
+            "farm_workers": parse_farm_workers(self.farm_workers_var.get()) if enabled("opt_build_farm") else [],
+            "benchmark_runs": BENCHMARK_RUNS if enabled("opt_benchmark") else 0,
+            "pgo_training": (self.pgo_training_var.get().strip() or "{program}") if enabled("opt_pgo") else "",
+            "ccache_dir": self.ccache_dir_var.get().strip(),
+            "ccache_max_size": self.ccache_size_var.get().strip(),
+            "disable_console": enabled("gui_disable_console"),
+            "enable_tk": enabled("gui_enable_tk"),
+            "icon_path": self.icon_path if enabled("gui_windows_icon") else "",
+            "custom_options": custom_options,
+            "output_dir": self.output_dir
+        }
         
-        return options
+    def get_compilation_options(self):
+        """Get selected Nuitka options as command line arguments"""
+        return build_nuitka_options(self.get_compilation_settings())
+
+    def get_compilation_env(self, settings):
+        """Get the environment overrides for Nuitka, such as the compiler cache"""
+        ccache_binary = (self.toolchain.result or {}).get("ccache")
+        if settings.get("compiler_cache") and not ccache_binary:
+            self.append_to_terminal("Compiler cache enabled but ccache was not found, building without it\n")
+        return build_nuitka_env(settings, ccache_binary)
 
     def clear_terminal(self):
         """Clear the terminal output"""
@@ -1329,40 +7089,111 @@ class NuitkaCompilerApp:
 
     def append_to_terminal(self, text):
         """Append text to the terminal"""
-        self.terminal.config(state=tk.NORMAL)
-        
-        # Apply color formatting based on text type
-        if text.startswith("$"):
-            self.terminal.insert(tk.END, text, "command")
-        elif "Error" in text or "ERROR" in text or "error:" in text:
-            self.terminal.insert(tk.END, text, "error")
-        elif "Success" in text or "Completed" in text or "✓" in text:
-            self.terminal.insert(tk.END, text, "success")
+        self.append_lines_to_terminal([text])
+
+    def append_lines_to_terminal(self, lines, tags=None):
+        """Append a batch of output with a single widget insert"""
+        # Everything goes to the logs, only what fits in the widget is rendered
+        self.output_log.extend(lines)
+        if self.full_log:
+            self.full_log.append("".join(lines))
+        
+        # Apply color formatting based on text type, merging runs with the same tag
+        visible = lines[-TERMINAL_MAX_LINES:]
+        if tags is None:
+            tags = [terminal_tag(text) for text in visible]
         else:
-            self.terminal.insert(tk.END, text)
-            
+            tags = tags[-TERMINAL_MAX_LINES:]
+        
+        insert_args = []
+        run, run_tag = [], None
+        for text, tag in zip(visible, tags):
+            if run and tag != run_tag:
+                insert_args.extend(("".join(run), run_tag or ()))
+                run = []
+            run.append(text)
+            run_tag = tag
+        if run:
+            insert_args.extend(("".join(run), run_tag or ()))
+        
+        self.terminal.config(state=tk.NORMAL)
+        self.terminal.insert(tk.END, *insert_args)
+        self.trim_terminal()
         self.terminal.see(tk.END)  # Scroll to the end
         self.terminal.config(state=tk.DISABLED)
+
+    def trim_terminal(self):
+        """Drop the oldest lines once the widget grows past the limit"""
+        line_count = int(self.terminal.index("end-1c").split(".")[0])
+        
+        # Trim in chunks so the delete doesn't run for every line
+        if line_count > TERMINAL_MAX_LINES * 1.1:
+            self.terminal.delete(1.0, f"{line_count - TERMINAL_MAX_LINES + 1}.0")
+
+    def open_log_viewer(self):
+        """Open the full terminal history"""
+        if not self.full_log:
+            self.append_to_terminal("Error: the terminal log file could not be created\n")
+            return
+        
+        if self.log_viewer and self.log_viewer.window.winfo_exists():
+            self.log_viewer.window.lift()
+            self.log_viewer.go_to_end()
+        else:
+            self.log_viewer = LogViewer(self, self.full_log)
+
+    def handle_log_command(self, args):
+        """Search or open the full terminal log"""
+        if not self.full_log:
+            self.append_to_terminal("Error: the terminal log file could not be created\n")
+            return
         
-        # Store output for analysis
-        self.output_log.append(text)
+        if not args:
+            self.open_log_viewer()
+        elif args[0].lower() == "path":
+            self.append_to_terminal(f"Terminal log: {self.full_log.path} ({self.full_log.line_count()} lines)\n")
+        elif args[0].lower() == "search" and len(args) > 1:
+            pattern = " ".join(args[1:])
+            matches = self.full_log.search(pattern, limit=50)
+            lines = [f"{line_no + 1:>8}: {line}" for line_no, line in matches]
+            lines.append(f"{len(matches)} matches for '{pattern}'" + (" (first 50 shown)" if len(matches) == 50 else ""))
+            self.append_to_terminal("\n".join(lines) + "\n")
+        else:
+            self.append_to_terminal("Usage: log [path | search TEXT]\n")
 
     def check_output(self):
-        """Check for output in the queue and update the terminal"""
+        """Drain the output queue into the terminal, one widget update per tick"""
+        backlog = self.output_backlog
         try:
-            while True:
-                line = self.output_queue.get_nowait()
-                self.append_to_terminal(line)
-                
-                # Parse the line for progress information
-                self.parse_progress_info(line)
-                
+            # Take what one tick can render, within the time budget of this tick
+            deadline = time.perf_counter() + OUTPUT_FRAME_BUDGET
+            while len(backlog) < OUTPUT_FRAME_LINES and time.perf_counter() < deadline:
+                # Terminal commands deliver whole batches of lines
+                item = self.output_queue.get_nowait()
+                if isinstance(item, list):
+                    backlog.extend(item)
+                else:
+                    backlog.append(item)
                 self.output_queue.task_done()
         except queue.Empty:
             pass
+        
+        # Classifying and rendering cost more than dequeuing, a burst is spread over several ticks
+        lines = [backlog.popleft() for _ in range(min(len(backlog), OUTPUT_FRAME_LINES))]
+        
+        try:
+            if lines:
+                # Classify every line once, for both coloring and progress
+                classified = [classify_line(line) for line in lines]
+                self.append_lines_to_terminal(lines, [tag for _, _, tag in classified])
+                
+                # Parse the batch for progress information
+                self.parse_progress_batch(lines, classified)
         finally:
-            # Schedule to check again
-            self.root.after(100, self.check_output)
+            # Come back sooner while the queue is still behind
+            behind = backlog or not self.output_queue.empty()
+            delay = OUTPUT_BACKLOG_INTERVAL if behind else OUTPUT_POLL_INTERVAL
+            self.root.after(delay, self.check_output)
 
     def update_progress_periodically(self):
         """Update progress even when no new output is available"""
@@ -1379,36 +7210,28 @@ class NuitkaCompilerApp:
 
     def parse_progress_info(self, line):
         """Parse the output line for progress information"""
-        line = line.strip()
+        self.parse_progress_batch([line])
         
-        # Direct percentage detection
-        for pattern in self.percentage_patterns:
-            match = pattern.search(line)
-            if match:
-                try:
-                    reported_percentage = int(match.group(1))
-                    if 0 <= reported_percentage <= 100:
-                        self.update_progress_display(reported_percentage)
-                        return
-                except (ValueError, IndexError):
-                    pass
+    def parse_progress_batch(self, lines, classified=None):
+        """Parse a batch of output, applying only the latest progress and phase"""
+        latest_percentage = None
+        latest_phase = None
         
-        # Phase detection
-        if "Recursing" in line or "Finding modules" in line:
-            self.current_phase = "dependency_scan"
-            self.stage_label.config(text="Stage: Analyzing Dependencies")
-        elif "Creating module" in line or "Creating code" in line:
-            self.current_phase = "c_generation"
-            self.stage_label.config(text="Stage: Generating C Code")
-        elif "C Compile" in line or "Compiling" in line:
-            self.current_phase = "c_compilation"
-            self.stage_label.config(text="Stage: Compiling C Code")
-        elif "Linking" in line or "Creating executable" in line:
-            self.current_phase = "linking"
-            self.stage_label.config(text="Stage: Linking")
-        elif "Packaging" in line or "copying" in line:
-            self.current_phase = "packaging"
-            self.stage_label.config(text="Stage: Packaging")
+        if classified is None:
+            classified = [classify_line(line) for line in lines]
+        
+        for percentage, phase, _ in classified:
+            if percentage is not None:
+                latest_percentage = percentage
+            elif phase:
+                latest_phase = phase
+        
+        if latest_phase:
+            self.current_phase = latest_phase
+            self.stage_label.config(text=f"Stage: {PHASE_LABELS[latest_phase]}")
+        
+        if latest_percentage is not None:
+            self.update_progress_display(latest_percentage)
 
     def update_progress_display(self, progress_percentage):
         """Update all progress indicators with the current percentage"""
@@ -1428,11 +7251,27 @@ class NuitkaCompilerApp:
             if progress_int > 0 and (progress_int % 5 == 0 or progress_int - old_progress >= 5):
                 elapsed_time = time.time() - self.compilation_start_time
                 
-                if progress_int > 0:
+                predicted = self.history_progress()
+                if predicted:
+                    self.update_eta(predicted[1])
+                elif progress_int > 0:
                     estimated_total_time = elapsed_time * (100 / progress_int)
                     remaining_time = estimated_total_time - elapsed_time
                     self.update_eta(remaining_time)
 
+    def history_progress(self):
+        """Return the (progress, remaining seconds) predicted from build history, None without history"""
+        job = self.current_job
+        if job is None or job.estimate is None or not job.phase_history or job.end_time is not None:
+            return None
+        
+        now = time.time()
+        phase, phase_started = job.phase_history[-1]
+        return (
+            job.estimate.progress(now - job.start_time, phase, now - phase_started, job.phase_lines.get(phase, 0)),
+            job.estimate.remaining(now - job.start_time, phase, now - phase_started, job.phase_lines.get(phase, 0))
+        )
+
     def update_eta(self, remaining_time):
         """Update the ETA display based on remaining time in seconds"""
         if remaining_time < 60:
@@ -1452,6 +7291,14 @@ class NuitkaCompilerApp:
         """Ensure progress advances at least a minimum amount based on time and phase"""
         if self.compilation_start_time is None:
             return
+        
+        # Previous builds of the project tell where this one should be by now
+        predicted = self.history_progress()
+        if predicted:
+            progress, remaining = predicted
+            self.update_target_progress(max(int(progress), PHASE_MIN_PROGRESS.get(self.current_phase, 0)))
+            self.update_eta(remaining)
+            return
             
         elapsed_time = time.time() - self.compilation_start_time
         
@@ -1460,18 +7307,7 @@ class NuitkaCompilerApp:
         min_progress_by_time = min(60, int(time_factor * 60))
         
         # Apply phase-specific minimum progress
-        if self.current_phase == "dependency_scan":
-            phase_min = 5
-        elif self.current_phase == "c_generation":
-            phase_min = 15
-        elif self.current_phase == "c_compilation":
-            phase_min = 30
-        elif self.current_phase == "linking":
-            phase_min = 70
-        elif self.current_phase == "packaging":
-            phase_min = 85
-        else:
-            phase_min = 0
+        phase_min = PHASE_MIN_PROGRESS.get(self.current_phase, 0)
         
         # Use time-based or phase-based minimum, whichever is higher
         self.update_target_progress(max(min_progress_by_time, phase_min))
@@ -1506,8 +7342,8 @@ class NuitkaCompilerApp:
                 self.progress_label.config(text=f"Progress: {progress_int}%")
                 self.progress_bar['value'] = progress_int
                 
-                # Update ETA if progress has changed meaningfully
-                if progress_int > 0 and progress_int % 5 == 0:
+                # Update ETA if progress has changed meaningfully, history based ETAs update on their own
+                if progress_int > 0 and progress_int % 5 == 0 and not self.history_progress():
                     elapsed_time = time.time() - self.compilation_start_time
                     remaining_time = (elapsed_time / self.compilation_progress) * (100 - self.compilation_progress)
                     self.update_eta(remaining_time)
@@ -1535,12 +7371,21 @@ class NuitkaCompilerApp:
             self.command_history.append(command)
             self.history_index = len(self.command_history)
             
-        if self.interactive_mode and self.process and self.process.poll() is None:
+        # Input goes to the running terminal command first, then to Nuitka
+        if self.shell_task and self.shell_task.running:
+            stdin = self.shell_task
+        elif self.process and self.process.poll() is None:
+            stdin = self.process.stdin
+        else:
+            stdin = None
+        
+        if self.interactive_mode and stdin:
             # Interactive mode
             try:
                 self.append_to_terminal(f"> {command}\n")
-                self.process.stdin.write(f"{command}\n")
-                self.process.stdin.flush()
+                stdin.write(f"{command}\n")
+                if stdin is not self.shell_task:
+                    stdin.flush()
             except Exception as e:
                 self.append_to_terminal(f"Error sending command: {str(e)}\n")
                 self.interactive_mode = False
@@ -1557,6 +7402,28 @@ class NuitkaCompilerApp:
                 self.show_status()
             elif command.lower() == "version":
                 self.check_nuitka_version()
+            elif command.lower() == "version refresh":
+                self.check_nuitka_version(refresh=True)
+            elif command.lower().split()[0] == "cache":
+                self.handle_cache_command(command.split()[1:])
+            elif command.lower().split()[0] == "log":
+                self.handle_log_command(command.split()[1:])
+            elif command.lower().split()[0] == "scan":
+                self.handle_scan_command(command.split()[1:])
+            elif command.lower().split()[0] == "deps":
+                self.handle_deps_command(command.split()[1:])
+            elif command.lower().split()[0] == "incremental":
+                self.handle_incremental_command(command.split()[1:])
+            elif command.lower().split()[0] == "onefile-cache":
+                self.handle_onefile_cache_command(command.split()[1:])
+            elif command.lower() == "cancel":
+                self.cancel_compilation()
+            elif command.lower().split()[0] == "watch":
+                self.handle_watch_command(command.split()[1:])
+            elif command.lower().split()[0] == "explore":
+                self.handle_explore_command(command)
+            elif command.lower() == "workers":
+                self.append_to_terminal("\n".join(self.worker_pool.describe()) + "\n")
             else:
                 # Run as a system command
                 self.run_command(command)
@@ -1571,7 +7438,29 @@ class NuitkaCompilerApp:
 - clear           : Clear the terminal
 - help            : Show this help message
 - status          : Show compilation status
-- version         : Check Nuitka version
+- version         : Check Nuitka version and the detected toolchain
+- version refresh : Detect the toolchain again
+- cache [list]    : Show build cache entries
+- cache prune [MB]: Evict least recently used entries down to the limit
+- cache clear     : Remove all build cache entries
+- log             : Browse the full terminal history
+- log search TEXT : Search the full terminal history
+- log path        : Show where the terminal history is stored
+- scan [N]        : Show the import graph of the script with the N heaviest packages
+- deps [list]     : Show the precompiled dependency cache
+- deps verify     : Check cached dependencies for corruption and stale versions
+- deps evict NAME : Remove the cached builds of a package
+- deps clear      : Remove all precompiled dependencies
+- incremental     : List the incremental build directories
+- incremental clear: Remove all incremental build directories
+- onefile-cache   : List the cached onefile extractions
+- onefile-cache clear: Remove all cached onefile extractions
+- workers         : Show the warm shells and Python interpreters
+- cancel          : Cancel the running build
+- watch           : Rebuild the script incrementally whenever its sources change
+- watch stop      : Stop watching the sources
+- explore AXIS... [-- WORKLOAD]: Build every combination of option axes and rank them
+- explore stop    : Stop exploring
 
 Any other command will be executed as a system command.
 Use Up/Down arrow keys to navigate command history.
@@ -1608,55 +7497,126 @@ ETA: {self.eta_text}
             minutes = int((seconds % 3600) // 60)
             return f"{hours}h {minutes}m"
 
-    def check_nuitka_version(self):
+    def check_nuitka_version(self, refresh=False):
         """Check and display Nuitka version"""
-        try:
-            result = subprocess.run(
-                ["python", "-m", "nuitka", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+        if refresh:
+            self.toolchain.refresh()
             
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                self.append_to_terminal(f"Nuitka version: {version}\n")
+        if self.toolchain.result and not refresh:
+            self.show_toolchain(self.toolchain.result)
+            if not self.toolchain.fresh:
+                self.append_to_terminal("(cached result, refreshing in the background)\n")
+        else:
+            self.append_to_terminal("Checking toolchain...\n")
+            self.toolchain.when_ready(lambda result: self.root.after(0, lambda: self.show_toolchain(result)))
+
+    def show_toolchain(self, result):
+        """Display the detected toolchain in the terminal"""
+        if result.get("nuitka_installed"):
+            self.append_to_terminal(f"Nuitka version: {result['nuitka_version']}\n")
+        else:
+            self.append_to_terminal("Failed to get Nuitka version. Install it with 'pip install nuitka'\n")
+        self.append_to_terminal("\n".join(self.toolchain.describe()[1:]) + "\n")
+
+    def toolchain_detected(self, result):
+        """Report the toolchain once the startup probe finishes, called from the probe thread"""
+        summary = ", ".join(self.toolchain.describe())
+        self.output_queue.put(f"Toolchain: {summary}\n")
+
+    def apply_cache_limit(self):
+        """Apply the cache size limit from the optimization tab"""
+        try:
+            limit_mb = int(self.cache_limit_var.get())
+            self.build_cache.max_size = max(0, limit_mb) * 1024 * 1024
+        except (ValueError, AttributeError):
+            pass
+
+    def handle_cache_command(self, args):
+        """Inspect and prune the build cache from the terminal"""
+        self.apply_cache_limit()
+        action = args[0].lower() if args else "list"
+        
+        try:
+            if action in ("list", "ls"):
+                self.append_to_terminal("\n".join(self.build_cache.describe()) + "\n")
+            elif action == "prune":
+                limit = int(args[1]) * 1024 * 1024 if len(args) > 1 else None
+                evicted = self.build_cache.prune(limit)
+                freed = sum(entry.get("size", 0) for entry in evicted)
+                self.append_to_terminal(f"Evicted {len(evicted)} cache entries, freed {format_size(freed)}\n")
+            elif action == "clear":
+                evicted = self.build_cache.clear()
+                self.append_to_terminal(f"Build cache cleared ({len(evicted)} entries removed)\n")
+            else:
+                self.append_to_terminal("Usage: cache [list | prune [MB] | clear]\n")
+        except ValueError:
+            self.append_to_terminal("Usage: cache [list | prune [MB] | clear]\n")
+        except Exception as e:
+            self.append_to_terminal(f"Error accessing build cache: {str(e)}\n")
+
+    def handle_deps_command(self, args):
+        """Inspect and evict precompiled dependencies from the terminal"""
+        action = args[0].lower() if args else "list"
+        
+        try:
+            if action in ("list", "ls"):
+                self.append_to_terminal("\n".join(self.dependency_cache.describe()) + "\n")
+            elif action == "verify":
+                self.append_to_terminal("\n".join(self.dependency_cache.verify()) + "\n")
+            elif action == "evict" and len(args) > 1:
+                evicted = self.dependency_cache.evict(args[1])
+                self.append_to_terminal(f"Evicted {len(evicted)} dependency cache entries\n")
+            elif action == "clear":
+                evicted = self.dependency_cache.clear()
+                self.append_to_terminal(f"Dependency cache cleared ({len(evicted)} entries removed)\n")
+            else:
+                self.append_to_terminal("Usage: deps [list | verify | evict NAME | clear]\n")
+        except Exception as e:
+            self.append_to_terminal(f"Error accessing dependency cache: {str(e)}\n")
+
+    def handle_incremental_command(self, args):
+        """Inspect and remove incremental build directories from the terminal"""
+        action = args[0].lower() if args else "list"
+        
+        try:
+            if action in ("list", "ls"):
+                self.append_to_terminal("\n".join(IncrementalBuild.describe_all()) + "\n")
+            elif action == "clear":
+                removed = IncrementalBuild.clear_all()
+                self.append_to_terminal(f"Removed {removed} incremental build directories\n")
+            else:
+                self.append_to_terminal("Usage: incremental [list | clear]\n")
+        except Exception as e:
+            self.append_to_terminal(f"Error accessing incremental builds: {str(e)}\n")
+
+    def handle_onefile_cache_command(self, args):
+        """Inspect and remove cached onefile extractions from the terminal"""
+        action = args[0].lower() if args else "list"
+        
+        try:
+            if action in ("list", "ls"):
+                self.append_to_terminal("\n".join(OnefileCache.describe_all()) + "\n")
+            elif action == "clear":
+                removed = OnefileCache.clear_all()
+                self.append_to_terminal(f"Removed the cached extractions of {removed} programs\n")
             else:
-                self.append_to_terminal(f"Failed to get Nuitka version. Error: {result.stderr}\n")
+                self.append_to_terminal("Usage: onefile-cache [list | clear]\n")
         except Exception as e:
-            self.append_to_terminal(f"Error checking Nuitka version: {str(e)}\n")
+            self.append_to_terminal(f"Error accessing onefile extractions: {str(e)}\n")
 
     def run_command(self, command):
-        """Run a custom command"""
+        """Run a custom command on a warm shell of the worker pool"""
         try:
             self.interactive_mode = True
             self.terminal_mode_indicator.config(text="[INPUT]", fg=self.theme['input_prompt_color'])
             
-            process = subprocess.Popen(
-                command,
-                shell=True,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            self.process = process
-            
-            # Thread for reading stdout
-            def read_output():
-                for line in process.stdout:
-                    self.output_queue.put(line)
-                
-                # Process ended
+            def on_exit(returncode):
+                # Command ended, called from the worker's reader
                 self.interactive_mode = False
                 self.root.after(0, lambda: self.terminal_mode_indicator.config(
                     text="[CMD]", fg=self.theme['command_color']))
             
-            # Start reading thread
-            threading.Thread(target=read_output, daemon=True).start()
+            self.shell_task = self.worker_pool.run_shell(command, self.output_queue.put, on_exit)
             
         except Exception as e:
             self.append_to_terminal(f"Error executing command: {str(e)}\n")
@@ -1664,19 +7624,147 @@ ETA: {self.eta_text}
             self.terminal_mode_indicator.config(text="[CMD]", fg=self.theme['command_color'])
 
     def check_nuitka_installed(self):
-        """Check if Nuitka is installed"""
+        """Check if Nuitka is installed, None while the first probe is still running"""
+        if self.toolchain.result is None:
+            return None
+        return self.toolchain.result.get("nuitka_installed", False)
+
+    def handle_watch_command(self, args):
+        """Start or stop rebuilding the selected script when its sources change"""
+        action = args[0].lower() if args else "start"
+        if action == "stop":
+            if not self.watcher:
+                self.append_to_terminal("Watch mode is not active\n")
+                return
+            self.stop_watch()
+            self.append_to_terminal("Stopped watching the sources\n")
+        elif action == "start":
+            if not self.file_path:
+                self.append_to_terminal("Select a script first\n")
+                return
+            self.start_watch(self.file_path)
+        else:
+            self.append_to_terminal("Usage: watch [stop]\n")
+
+    def handle_explore_command(self, command):
+        """Build the selected script with every combination of option axes and rank the results"""
         try:
-            result = subprocess.run(
-                ["python", "-m", "nuitka", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except:
-            return False
+            args = shlex.split(command)[1:]
+        except ValueError as e:
+            self.append_to_terminal(f"Error: {str(e)}\n")
+            return
+        
+        if args and args[0].lower() == "stop":
+            if self.explorer:
+                self.explorer.cancel()
+                self.append_to_terminal("Stopping the explore builds...\n")
+            else:
+                self.append_to_terminal("Nothing is being explored\n")
+            return
+        if self.explorer:
+            self.append_to_terminal("Already exploring, 'explore stop' ends it\n")
+            return
+        
+        # The workload follows '--', as it would be typed in a shell
+        workload = ""
+        if "--" in args:
+            index = args.index("--")
+            args, workload = args[:index], " ".join(shlex.quote(arg) for arg in args[index + 1:])
+        if not args:
+            self.append_to_terminal("Usage: explore AXIS [AXIS ...] [-- WORKLOAD], an axis is 'lto', 'mode', 'jobs' "
+                                    "or comma separated alternatives like ',--lto=yes'\n")
+            return
+        if not self.file_path:
+            self.append_to_terminal("Select a script first\n")
+            return
+        
+        settings = self.get_compilation_settings()
+        use_cache = self.options_vars.get("opt_build_cache", tk.BooleanVar(value=False)).get()
+        try:
+            explorer = FlagExplorer(self.file_path, build_nuitka_options(settings),
+                                    [parse_explore_axis(axis) for axis in args], self.get_compilation_env(settings),
+                                    workload, use_cache=use_cache, auto_jobs=settings["jobs"] == "auto",
+                                    use_dependency_cache=settings["dependency_cache"])
+        except ValueError as e:
+            self.append_to_terminal(f"Error: {str(e)}\n")
+            return
+        self.explorer = explorer
+        self.append_to_terminal(f"Exploring {len(explorer.jobs)} combinations of "
+                                f"{os.path.basename(self.file_path)}, {explorer.max_workers} at a time\n")
+        
+        def run():
+            try:
+                results = explorer.run(
+                    self.build_cache, self.build_history, self.dependency_cache,
+                    on_job_done=lambda job: self.output_queue.put(
+                        f"[explore] {explorer.label(job)}: {job.status} in {format_duration(job.elapsed())}\n"))
+                if explorer.cancelled:
+                    self.output_queue.put("Explore stopped\n")
+                else:
+                    self.output_queue.put("\n".join(FlagExplorer.describe(results)) +
+                                          f"\nBuilds are in {explorer.root}\n")
+            except Exception as e:
+                self.output_queue.put(f"Explore failed: {str(e)}\n")
+            finally:
+                self.explorer = None
+        
+        threading.Thread(target=run, daemon=True).start()
+
+    def start_watch(self, file_path):
+        """Watch the directories of a script and its local imports"""
+        self.stop_watch()
+        try:
+            directories = watch_directories(file_path)
+        except Exception as e:
+            self.append_to_terminal(f"Error reading the imports of {file_path}: {str(e)}\n")
+            return
+        self.watcher = SourceWatcher(
+            directories, lambda paths: self.root.after(0, lambda: self._watch_rebuild(paths))).start()
+        self.append_to_terminal(f"Watching {len(self.watcher.directories)} "
+                                f"director{'ies' if len(self.watcher.directories) != 1 else 'y'} for changes to "
+                                f"{os.path.basename(file_path)} ({self.watcher.method}), every save rebuilds "
+                                f"incrementally, 'watch stop' ends it\n")
+
+    def stop_watch(self):
+        if self.watcher:
+            watcher, self.watcher = self.watcher, None
+            watcher.stop()
+        self.watch_pending = False
 
-    def compile_script(self):
+    def _watch_rebuild(self, paths):
+        """Rebuild after a change, stopping a build of the previous sources first"""
+        if not self.watcher or not self.file_path:
+            return
+        names = ", ".join(os.path.basename(path) for path in paths[:5])
+        if len(paths) > 5:
+            names += f" and {len(paths) - 5} more"
+        self.append_to_terminal(f"\nChanged: {names}\n")
+        
+        # New imports bring new directories to watch
+        try:
+            self.watcher.set_directories(watch_directories(self.file_path))
+        except Exception:
+            pass
+        
+        if str(self.compile_btn['state']) == tk.DISABLED:
+            # Rebuilt once the running build is gone
+            self.watch_pending = True
+            if not self.cancel_requested:
+                self.append_to_terminal("Cancelling the build of the previous sources...\n")
+                self.cancel_requested = True
+                self.cancel_btn.config(state=tk.DISABLED)
+                if self.current_job:
+                    self.current_job.cancel()
+        else:
+            self.compile_script(rebuild=True)
+
+    def _continue_watch(self):
+        """Start the rebuild that waited for an obsolete build to stop"""
+        if self.watch_pending and self.watcher:
+            self.watch_pending = False
+            self.compile_script(rebuild=True)
+
+    def compile_script(self, rebuild=False):
         """Compile the selected Python script with Nuitka"""
         # Hide success panel if visible
         self.hide_success_panel()
@@ -1694,18 +7782,32 @@ ETA: {self.eta_text}
             messagebox.showerror("Error", "Selected file is not a Python file")
             return
             
-        # Check Nuitka installation
-        if not self.check_nuitka_installed():
+        # Check Nuitka installation, using the cached toolchain probe
+        installed = self.check_nuitka_installed()
+        if installed is None or (not installed and not self.toolchain.fresh):
+            # Retry once the background probe has an up to date answer
+            if not self.compile_when_ready:
+                self.compile_when_ready = True
+                self.status_label.config(text="Checking Nuitka installation...")
+                self.toolchain.when_ready(lambda result: self.root.after(0, self._compile_after_probe))
+            return
+        
+        if not installed:
             messagebox.showerror("Error", "Nuitka is not installed. Please install it with 'pip install nuitka'")
+            # Look again in the background, it may get installed meanwhile
+            self.toolchain.refresh()
             return
             
         # Disable buttons during compilation
         self.compile_btn.config(state=tk.DISABLED)
         self.browse_btn.config(state=tk.DISABLED)
         self.output_browse_btn.config(state=tk.DISABLED)
+        self.cancel_btn.config(state=tk.NORMAL)
         
         # Reset progress tracking
         self.compilation_start_time = time.time()
+        self.current_job = None
+        self.cancel_requested = False
         self.compilation_progress = 0
         self.target_progress = 0
         self.eta_text = "Calculating..."
@@ -1714,7 +7816,7 @@ ETA: {self.eta_text}
         self.progress_bar['value'] = 0
         
         # Reset output log
-        self.output_log = []
+        self.output_log.clear()
         self.current_phase = "initialize"
         self.stage_label.config(text="Stage: Initialization")
         
@@ -1730,7 +7832,9 @@ ETA: {self.eta_text}
         self.status_label.config(text="Compiling... This may take a while")
         
         # Get compilation options
-        compilation_options = self.get_compilation_options()
+        settings = self.get_compilation_settings()
+        compilation_options = build_nuitka_options(settings)
+        compilation_env = self.get_compilation_env(settings)
         
         # Add to terminal
         self.append_to_terminal("\n=== Starting Compilation ===\n")
@@ -1741,77 +7845,122 @@ ETA: {self.eta_text}
         # Format the command for display
         command_display = f"python -m nuitka {' '.join(compilation_options)} {self.file_path}"
         self.append_to_terminal(f"Command: {command_display}\n")
-        self.append_to_terminal("Compiling... Play Snake while you wait!\n\n")
         
-        # Add the Snake game
-        self.add_snake_game()
+        # Rebuilds of watch mode come too often for a game
+        if not rebuild:
+            self.append_to_terminal("Compiling... Play Snake while you wait!\n\n")
+            self.add_snake_game()
+        
+        # Read the cache settings here, Tk variables aren't thread safe
+        use_cache = self.options_vars.get("opt_build_cache", tk.BooleanVar(value=False)).get()
+        self.apply_cache_limit()
         
         # Run the compilation in a separate thread
         threading.Thread(target=self._run_compilation, 
-                        args=(self.file_path, compilation_options), 
+                        args=(self.file_path, compilation_options, use_cache, compilation_env,
+                              settings["incremental"] or self.watcher is not None, settings["dependency_cache"],
+                              settings["jobs"] == "auto",
+                              settings["farm_workers"], settings["benchmark_runs"], settings["pgo_training"]),
                         daemon=True).start()
 
-    def _run_compilation(self, script_path, compilation_options):
+    def _compile_after_probe(self):
+        """Continue a compile request that was waiting for the toolchain probe"""
+        self.compile_when_ready = False
+        self.compile_script()
+
+    def _run_compilation(self, script_path, compilation_options, use_cache=False, env=None, incremental=False,
+                         use_dependency_cache=False, auto_jobs=False, farm_workers=None, benchmark_runs=0,
+                         pgo_training=""):
         """Execute the Nuitka compilation command"""
         try:
             # Check if file exists
             if not os.path.isfile(script_path):
                 raise FileNotFoundError(f"The file {script_path} does not exist")
                 
-            # Ensure output directory exists
-            os.makedirs(self.output_dir, exist_ok=True)
-            
-            # Prepare the Nuitka command
-            nuitka_cmd = [
-                "python", "-m", "nuitka"
-            ]
-            
-            # Add all compilation options
-            nuitka_cmd.extend(compilation_options)
-            
-            # Add the script path at the end
-            nuitka_cmd.append(script_path)
+            # Take over the build started when the script was selected if its inputs are the same
+            speculative, self.speculative = self.speculative, None
+            if speculative is not None:
+                toolchain_version = self.toolchain.wait(30).get("nuitka_version", "")
+                if not speculative.usable():
+                    self.output_queue.put(speculative.describe() + "\n")
+                    speculative.discard()
+                elif speculative.matches(script_path, compilation_options, toolchain_version):
+                    self.output_queue.put("Using the speculative build started when the script was selected\n")
+                    self.current_job = speculative.job
+                    if self.cancel_requested:
+                        speculative.job.cancel()
+                    returncode = speculative.adopt(
+                        self.output_queue.put, SpeculativeBuild.output_dir_for(script_path, compilation_options))
+                    self.root.after(0, lambda: self._compilation_finished(returncode))
+                    return
+                else:
+                    speculative.discard()
+                    self.output_queue.put("The options changed since the script was selected, "
+                                          "the speculative build was discarded\n")
             
-            self.append_to_terminal(f"Executing: {' '.join(nuitka_cmd)}\n")
-            
-            # Execute the command
-            self.process = subprocess.Popen(
-                nuitka_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                stdin=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            # Enable interactive mode
-            self.interactive_mode = True
-            
-            # Thread for reading stdout
-            def read_output():
-                for line in self.process.stdout:
-                    self.output_queue.put(line)
+            # Profile guided builds run several stages, Cancel stops the current one
+            if pgo_training:
+                build = PgoBuild(script_path, compilation_options, pgo_training, env,
+                                 use_dependency_cache=use_dependency_cache, auto_jobs=auto_jobs)
                 
-                # Process ended
-                self.interactive_mode = False
+                def on_job_start(job):
+                    self.current_job = job
+                    if self.cancel_requested:
+                        job.cancel()
+                
+                returncode = build.run(self.build_cache, self.toolchain.wait(30).get("nuitka_version", ""),
+                                       on_output=lambda job, text: self.output_queue.put(text),
+                                       on_job_start=on_job_start, history=self.build_history,
+                                       dependency_cache=self.dependency_cache)
+                self.root.after(0, lambda: self._compilation_finished(returncode))
+                return
             
-            # Start reading thread
-            output_thread = threading.Thread(target=read_output, daemon=True)
-            output_thread.start()
+            job = CompilationJob(script_path, compilation_options, use_cache, env, incremental,
+                                 use_dependency_cache=use_dependency_cache, auto_jobs=auto_jobs,
+                                 farm_workers=farm_workers, benchmark_runs=benchmark_runs)
+            graph = self.import_graph
+            if graph is not None and graph.script_path == os.path.abspath(script_path):
+                job.module_count = graph.module_count
+            self.current_job = job
+            # Cancel was pressed before the job existed
+            if self.cancel_requested:
+                job.cancel()
             
-            # Wait for process to complete
-            returncode = self.process.wait()
+            def on_start(process):
+                self.process = process
+                # Enable interactive mode
+                self.interactive_mode = True
             
-            # Wait for thread to finish reading
-            output_thread.join()
+            # Wait for a running refresh so stale versions never end up in cache keys
+            toolchain_version = self.toolchain.wait(30).get("nuitka_version", "") if use_cache else ""
+            returncode = job.run(self.build_cache, toolchain_version,
+                                 on_output=self.output_queue.put, on_start=on_start,
+                                 history=self.build_history, dependency_cache=self.dependency_cache)
+            
+            # Process ended
+            self.interactive_mode = False
             
             # Process finished, update UI in main thread
             self.root.after(0, lambda: self._compilation_finished(returncode))
             
         except Exception as e:
-            self.output_queue.put(f"\nERROR: {str(e)}\n")
-            self.root.after(0, lambda: self._compilation_error(str(e)))
+            error_message = str(e)
+            self.interactive_mode = False
+            self.output_queue.put(f"\nERROR: {error_message}\n")
+            self.root.after(0, lambda: self._compilation_error(error_message))
+
+    def cancel_compilation(self):
+        """Stop the running build together with its compiler and linker processes"""
+        # The button is only enabled while a build is running
+        if str(self.cancel_btn['state']) == tk.DISABLED:
+            self.append_to_terminal("No build is running\n")
+            return
+        self.cancel_requested = True
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.status_label.config(text="Cancelling compilation...")
+        self.append_to_terminal("\nCancelling the build...\n")
+        if self.current_job:
+            self.current_job.cancel()
 
     def _compilation_finished(self, returncode):
         """Handle compilation completion"""
@@ -1834,24 +7983,42 @@ ETA: {self.eta_text}
         self.compile_btn.config(state=tk.NORMAL)
         self.browse_btn.config(state=tk.NORMAL)
         self.output_browse_btn.config(state=tk.NORMAL)
+        self.cancel_btn.config(state=tk.DISABLED)
         
         # Add completion message to terminal
-        if returncode == 0:
+        if self.current_job and self.current_job.cancelled:
+            self.append_to_terminal("\n=== Compilation Cancelled ===\n")
+            self.status_label.config(text="Compilation cancelled, compiled objects are kept for the next build.")
+            self.stage_label.config(text="Stage: Cancelled")
+            self.eta_label.config(text="ETA: Cancelled")
+        elif returncode == 0:
             self.append_to_terminal("\n=== Compilation Completed Successfully ===\n")
             self.status_label.config(text="Compilation completed successfully!")
             
-            # Get the output executable name
-            script_name = os.path.basename(self.file_path)
-            executable_name = os.path.splitext(script_name)[0] + ".exe"
+            # Look for what Nuitka produced instead of guessing the name
+            job = self.current_job
+            artifact, _ = find_build_artifact(self.output_dir, self.file_path, job.options if job else [])
+            if artifact:
+                executable_name = os.path.relpath(artifact, self.output_dir)
+            else:
+                stem = os.path.splitext(os.path.basename(self.file_path))[0]
+                executable_name = f"{stem} (not found in the output directory)"
+            
+            benchmark = job.benchmark if job else None
+            if benchmark and benchmark.get("regressions"):
+                self.status_label.config(text="Compilation completed, with a size or startup regression (see terminal)")
             
             # Mostra il pannello di successo invece di una finestra di dialogo
-            self.show_success_panel(executable_name)
+            profile = job.profile if job else None
+            self.show_success_panel(executable_name, profile, benchmark)
         else:
             self.append_to_terminal("\n=== Compilation Failed ===\n")
             self.append_to_terminal(f"Return code: {returncode}\n")
             self.status_label.config(text="Compilation failed. See terminal for details.")
             self.stage_label.config(text="Stage: Failed")
 
+        self._continue_watch()
+
     def _compilation_error(self, error_message):
         """Handle exceptions during compilation"""
         # Cancel the smooth progress timer
@@ -1872,6 +8039,7 @@ ETA: {self.eta_text}
         self.compile_btn.config(state=tk.NORMAL)
         self.browse_btn.config(state=tk.NORMAL)
         self.output_browse_btn.config(state=tk.NORMAL)
+        self.cancel_btn.config(state=tk.DISABLED)
         
         self.status_label.config(text="Error occurred during compilation")
         self.append_to_terminal(f"\n=== ERROR ===\n{error_message}\n")
@@ -1883,6 +8051,15 @@ ETA: {self.eta_text}
         
         # Reset compilation state
         self.compilation_start_time = None
+        self._continue_watch()
+
+    def open_batch_window(self):
+        """Open the batch compilation queue"""
+        if self.batch_window:
+            self.batch_window.window.deiconify()
+            self.batch_window.window.lift()
+        else:
+            self.batch_window = BatchWindow(self)
 
     def open_output_folder(self):
         """Open the output folder in file explorer"""
@@ -1947,6 +8124,14 @@ ETA: {self.eta_text}
         if self.smooth_progress_timer:
             self.root.after_cancel(self.smooth_progress_timer)
         
+        # Stop a running build with all of its compiler processes
+        if self.current_job:
+            self.current_job.cancel()
+        self.discard_speculative_build()
+        self.stop_watch()
+        if self.explorer:
+            self.explorer.cancel()
+        
         # Terminate any running processes
         if hasattr(self, 'process') and self.process:
             try:
@@ -1958,12 +8143,538 @@ ETA: {self.eta_text}
             except:
                 pass
         
+        # Stop the warm shells and interpreters, and whatever they are running
+        self.worker_pool.shutdown()
+        
+        # Close the terminal log
+        if self.full_log:
+            self.full_log.close()
+        
+        # Stop batch builds
+        if self.batch_window and self.batch_window.batch:
+            self.batch_window.batch.cancel()
+        
         # Clean up Snake game
         if hasattr(self, 'snake_game'):
             self.snake_game.destroy()
 
+def parse_jobs(value):
+    """Argument type for --jobs, a positive number or 'auto'"""
+    if value.lower() == "auto":
+        return "auto"
+    try:
+        jobs = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a number or 'auto', got '{value}'")
+    if jobs < 1:
+        raise argparse.ArgumentTypeError("the number of jobs must be at least 1")
+    return jobs
+
+
+def add_build_arguments(parser):
+    """Add the build options shared by the build and watch commands"""
+    parser.add_argument("-o", "--output-dir", default=os.getcwd(), help="Output directory (default: current directory)")
+    parser.add_argument("--no-standalone", dest="standalone", action="store_false", help="Don't build a standalone package")
+    parser.add_argument("--onefile", action="store_true", help="Combine everything into a single executable file")
+    parser.add_argument("--onefile-cache", action="store_true",
+                        help="Unpack a onefile program into the user cache once per build instead of on every launch")
+    parser.add_argument("--onefile-no-compression", action="store_true",
+                        help="Store the onefile payload uncompressed, larger but without decompression at startup")
+    parser.add_argument("--module", action="store_true", help="Compile as Python extension module")
+    parser.add_argument("--no-follow-imports", action="store_true", help="Don't automatically follow imports")
+    parser.add_argument("--lto", action="store_true", help="Enable link-time optimization")
+    parser.add_argument("--jobs", type=parse_jobs, default="auto",
+                        help="Parallel C compile jobs, shared by concurrent builds, or 'auto' to size them "
+                             "to cores and free memory (default: auto)")
+    parser.add_argument("--disable-console", action="store_true", help="Disable the console window (Windows)")
+    parser.add_argument("--no-tk", dest="enable_tk", action="store_false", help="Don't enable the tk-inter plugin")
+    parser.add_argument("--icon", default="", help="Icon file for the executable")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Keep a persistent build directory so only changed modules are compiled again")
+    parser.add_argument("--dependency-cache", action="store_true",
+                        help="Reuse third-party packages precompiled as extension modules, shared by all projects")
+    parser.add_argument("--no-compiler-cache", dest="compiler_cache", action="store_false",
+                        help="Don't use ccache for the C compilation")
+    parser.add_argument("--ccache-dir", default="", help="Directory for the C compiler cache (default: ccache's own)")
+    parser.add_argument("--ccache-size", default=DEFAULT_CCACHE_SIZE, help="C compiler cache size limit, e.g. 5G")
+    parser.add_argument("--farm", metavar="WORKERS", default="",
+                        help="Compile the C files on build farm workers, a comma separated list of 'local[:slots]' "
+                             "and 'host:port' (token from COMPYLER_FARM_TOKEN)")
+    parser.add_argument("--timeout", type=float, metavar="SECONDS", help="Stop a build that runs longer than this")
+    parser.add_argument("--benchmark", type=int, nargs="?", const=BENCHMARK_RUNS, default=0, metavar="RUNS",
+                        help=f"After the build, start the program and the script under CPython RUNS times "
+                             f"(default: {BENCHMARK_RUNS}) and compare their startup")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false", help="Don't use the build cache")
+    parser.add_argument("--cache-limit", type=int, metavar="MB", help="Build cache size limit in MB")
+    parser.add_argument("--format", choices=("text", "json"), default="text",
+                        help="Progress output format, 'json' writes one JSON object per line")
+
+
+def build_settings_from_args(args, extra):
+    """Turn the build options of the command line into a settings dictionary"""
+    return {
+        "standalone": args.standalone,
+        "onefile": args.onefile,
+        "onefile_cache": args.onefile_cache,
+        "onefile_no_compression": args.onefile_no_compression,
+        "module": args.module,
+        "follow_imports": not args.no_follow_imports,
+        "no_follow_imports": args.no_follow_imports,
+        "incremental": args.incremental,
+        "lto": args.lto,
+        "jobs": args.jobs,
+        "compiler_cache": args.compiler_cache,
+        "dependency_cache": args.dependency_cache,
+        "farm_workers": parse_farm_workers(args.farm),
+        "benchmark_runs": args.benchmark,
+        "pgo_training": getattr(args, "pgo", ""),
+        "ccache_dir": args.ccache_dir,
+        "ccache_max_size": args.ccache_size,
+        "disable_console": args.disable_console,
+        "enable_tk": args.enable_tk,
+        "icon_path": args.icon,
+        "custom_options": extra,
+        "output_dir": os.path.abspath(args.output_dir)
+    }
+
+
+def create_cli_parser():
+    """Create the argument parser for the headless command line interface"""
+    parser = argparse.ArgumentParser(
+        prog="compyler",
+        description="Compile Python scripts with Nuitka. Run without arguments to start the GUI."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    subparsers.add_parser("gui", help="Start the graphical interface")
+
+    build = subparsers.add_parser(
+        "build",
+        help="Compile scripts without the GUI",
+        description="Compile scripts without the GUI. Arguments after '--' are passed to Nuitka unchanged."
+    )
+    build.add_argument("scripts", nargs="+", metavar="SCRIPT", help="Python scripts to compile")
+    add_build_arguments(build)
+    build.add_argument("--workers", type=int, default=1, help="Number of scripts compiled at the same time")
+    build.add_argument("--pgo", metavar="TRAINING", default="",
+                       help="Profile guided build: build an instrumented program, run this training command on it "
+                            "('{program}' is the program, otherwise these are its arguments) and build again "
+                            "with the profile (GCC only)")
+
+    watch = subparsers.add_parser(
+        "watch",
+        help="Rebuild a script incrementally whenever its sources change",
+        description="Rebuild a script incrementally whenever it or a local module it imports changes, "
+                    "until interrupted. Arguments after '--' are passed to Nuitka unchanged."
+    )
+    watch.add_argument("script", help="Python script to compile")
+    add_build_arguments(watch)
+    watch.add_argument("--debounce", type=float, default=WATCH_DEBOUNCE, metavar="SECONDS",
+                       help=f"Wait for a burst of saves to settle this long (default: {WATCH_DEBOUNCE:g})")
+
+    explore = subparsers.add_parser(
+        "explore",
+        help="Build and benchmark every combination of option axes",
+        description="Build a script with every combination of the option axes, time a workload on each build "
+                    "and rank them. Arguments after '--' are passed to Nuitka unchanged."
+    )
+    explore.add_argument("script", help="Python script to compile")
+    explore.add_argument("--axis", action="append", required=True, metavar="AXIS",
+                         help="'lto', 'mode' (standalone or onefile), 'jobs', or comma separated alternatives of "
+                              "Nuitka options such as --axis=,--lto=yes or --axis=--jobs=2,--jobs=8")
+    explore.add_argument("--workload", default="",
+                         help="Command timed on each build, '{program}' stands for the built program, otherwise "
+                              "these are arguments for it (default: start the program without arguments)")
+    explore.add_argument("--runs", type=int, default=BENCHMARK_RUNS,
+                         help=f"Workload runs per build, the first one is cold (default: {BENCHMARK_RUNS})")
+    add_build_arguments(explore)
+    explore.add_argument("--workers", type=int, default=2, help="Number of combinations built at the same time")
+
+    cache = subparsers.add_parser("cache", help="Inspect and prune the build cache")
+    cache.add_argument("action", nargs="?", default="list", choices=("list", "prune", "clear"))
+    cache.add_argument("size", nargs="?", type=int, metavar="MB", help="Size limit for 'prune'")
+
+    scan = subparsers.add_parser("scan", help="Report the import graph of a script without compiling it")
+    scan.add_argument("script", help="Python script to scan")
+    scan.add_argument("--top", type=int, default=10, help="Number of heaviest packages to show")
+    scan.add_argument("--format", choices=("text", "json"), default="text", help="Report format")
+
+    deps = subparsers.add_parser("deps", help="Inspect the shared cache of precompiled dependencies")
+    deps.add_argument("action", nargs="?", default="list", choices=("list", "verify", "evict", "clear"))
+    deps.add_argument("package", nargs="?", help="Package name or key prefix for 'evict'")
+
+    incremental = subparsers.add_parser("incremental", help="Inspect and remove incremental build directories")
+    incremental.add_argument("action", nargs="?", default="list", choices=("list", "clear"))
+
+    onefile_cache = subparsers.add_parser("onefile-cache", help="Inspect and remove cached onefile extractions")
+    onefile_cache.add_argument("action", nargs="?", default="list", choices=("list", "clear"))
+
+    worker = subparsers.add_parser("farm-worker", help="Compile C files for build farm coordinators on this machine")
+    worker.add_argument("--bind", default=f"127.0.0.1:{FARM_DEFAULT_PORT}",
+                        help=f"Address to listen on (default: 127.0.0.1:{FARM_DEFAULT_PORT})")
+    worker.add_argument("--slots", type=int, help="Units compiled at the same time (default: CPU count)")
+    worker.add_argument("--compiler", help="C compiler to use (default: $CC or gcc)")
+    worker.add_argument("--token", default=os.environ.get("COMPYLER_FARM_TOKEN", ""),
+                        help="Shared secret coordinators must send (default: $COMPYLER_FARM_TOKEN)")
+
+    return parser
+
+
+def compile_script(script_path, settings=None, use_cache=True, on_output=None, build_cache=None, history=None):
+    """Compile a script without the GUI, returns the finished CompilationJob"""
+    settings = dict(settings or {})
+    settings.setdefault("output_dir", os.path.dirname(os.path.abspath(script_path)))
+    env = build_nuitka_env(settings, find_compiler_cache())
+    job = CompilationJob(script_path, build_nuitka_options(settings), use_cache, env,
+                         settings.get("incremental", False),
+                         use_dependency_cache=settings.get("dependency_cache", False),
+                         auto_jobs=settings.get("jobs") == "auto",
+                         farm_workers=settings.get("farm_workers"),
+                         benchmark_runs=settings.get("benchmark_runs", 0))
+
+    cache = build_cache or BuildCache()
+    job.run(cache, get_nuitka_version() if use_cache else "", on_output=on_output,
+            history=history or BuildHistory(), dependency_cache=DependencyCache())
+    return job
+
+
+def watch_script(script_path, settings, use_cache=True, reporter=None, build_cache=None, timeout=None,
+                 debounce=WATCH_DEBOUNCE):
+    """Build a script, then rebuild it incrementally on every change of its sources until interrupted"""
+    reporter = reporter or CliReporter()
+    build_cache = build_cache or BuildCache()
+    history = BuildHistory()
+    dependency_cache = DependencyCache()
+    options = build_nuitka_options(settings)
+    env = build_nuitka_env(settings, find_compiler_cache())
+    toolchain_version = get_nuitka_version() if use_cache else ""
+
+    def start():
+        job = CompilationJob(script_path, options, use_cache, env, True,
+                             use_dependency_cache=settings.get("dependency_cache", False),
+                             auto_jobs=settings.get("jobs") == "auto",
+                             farm_workers=settings.get("farm_workers"), timeout=timeout,
+                             benchmark_runs=settings.get("benchmark_runs", 0))
+        reporter.started(job)
+        
+        def run():
+            try:
+                job.run(build_cache, toolchain_version, on_output=lambda text: reporter.output(job, text),
+                        history=history, dependency_cache=dependency_cache)
+            except Exception as e:
+                reporter.output(job, f"ERROR: {str(e)}\n")
+            reporter.finished(job)
+        
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return job, thread
+
+    changes = queue.Queue()
+    watcher = SourceWatcher(watch_directories(script_path), changes.put, debounce).start()
+    reporter.watching(script_path, watcher)
+    job, thread = start()
+    try:
+        while True:
+            # Wake up regularly so Ctrl+C is still delivered
+            try:
+                changed = changes.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            reporter.changed(changed)
+            if thread.is_alive():
+                job.cancel()
+                thread.join()
+            try:
+                watcher.set_directories(watch_directories(script_path))
+            except Exception:
+                pass
+            job, thread = start()
+    except KeyboardInterrupt:
+        job.cancel()
+        thread.join()
+        return 0
+    finally:
+        watcher.stop()
+
+
+class CliReporter:
+    """Streams job output and progress to stdout as text or JSON lines"""
+
+    def __init__(self, output_format="text", prefix_names=False, stream=None):
+        self.output_format = output_format
+        self.prefix_names = prefix_names
+        self.stream = stream or sys.stdout
+        self.lock = threading.Lock()
+        self.last_state = {}
+
+    def _write(self, text):
+        with self.lock:
+            self.stream.write(text)
+            self.stream.flush()
+
+    def _event(self, event, job, **fields):
+        record = {"event": event, "job": job.id, "script": job.script_path, "time": round(time.time(), 3)}
+        record.update(fields)
+        self._write(json.dumps(record) + "\n")
+
+    def started(self, job):
+        if self.output_format == "json":
+            self._event("start", job, command=job.command())
+        else:
+            self._write(f"=== Compiling {job.script_path} ===\n")
+
+    def output(self, job, text):
+        """Forward one line of output plus any progress change it caused"""
+        if self.output_format == "json":
+            self._event("output", job, line=text.rstrip("\n"))
+        elif self.prefix_names:
+            self._write(f"[{job.name}] {text}" if text.endswith("\n") else f"[{job.name}] {text}\n")
+        else:
+            self._write(text if text.endswith("\n") else text + "\n")
+        
+        state = (int(job.progress), job.phase)
+        if state != self.last_state.get(job.id):
+            self.last_state[job.id] = state
+            if self.output_format == "json":
+                self._event("progress", job, percentage=state[0], phase=state[1])
+            elif state[1] in PHASE_LABELS:
+                self._write(f"[compyler] {job.name}: {PHASE_LABELS[state[1]]} ({state[0]}%)\n")
+
+    def watching(self, script_path, watcher):
+        directories = sorted(watcher.directories)
+        if self.output_format == "json":
+            self._write(json.dumps({"event": "watch", "script": script_path, "directories": directories,
+                                    "method": watcher.method, "time": round(time.time(), 3)}) + "\n")
+        else:
+            self._write(f"[compyler] Watching {', '.join(directories)} ({watcher.method}), Ctrl+C stops\n")
+
+    def changed(self, paths):
+        if self.output_format == "json":
+            self._write(json.dumps({"event": "change", "paths": paths, "time": round(time.time(), 3)}) + "\n")
+        else:
+            self._write(f"[compyler] Changed: {', '.join(paths)}\n")
+
+    def finished(self, job):
+        if self.output_format == "json":
+            self._event("finished", job, status=job.status, returncode=job.returncode,
+                        elapsed=round(job.elapsed(), 3), error=job.error, profile=job.profile_path,
+                        benchmark=job.benchmark)
+        else:
+            self._write(f"[compyler] {job.name}: {job.status} in {round(job.elapsed(), 1)}s "
+                        f"(return code {job.returncode})\n")
+
+
+def explore_script(args, settings, build_cache):
+    """Run the explore command, returns the process exit code"""
+    if not os.path.isfile(args.script):
+        print(f"Error: the file {args.script} does not exist", file=sys.stderr)
+        return 2
+    try:
+        axes = [parse_explore_axis(axis) for axis in args.axis]
+        explorer = FlagExplorer(args.script, build_nuitka_options(settings), axes,
+                                build_nuitka_env(settings, find_compiler_cache()), args.workload, args.runs,
+                                args.workers, args.use_cache, args.jobs == "auto", args.dependency_cache)
+    except ValueError as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        return 2
+
+    reporter = CliReporter(args.format)
+    if args.format == "json":
+        on_output, on_job_done = reporter.output, reporter.finished
+    else:
+        print(f"[compyler] Exploring {len(explorer.jobs)} combinations, {args.workers} at a time", flush=True)
+        on_output = None
+        on_job_done = lambda job: print(f"[compyler] {explorer.label(job)}: {job.status} in "
+                                        f"{format_duration(job.elapsed())}", flush=True)
+    try:
+        results = explorer.run(build_cache, BuildHistory(), DependencyCache(), on_output, on_job_done)
+    except KeyboardInterrupt:
+        explorer.cancel()
+        explorer.batch.wait()
+        return 130
+
+    if args.format == "json":
+        print(json.dumps({"event": "explore", "root": explorer.root, "results": results}))
+    else:
+        print("\n".join(FlagExplorer.describe(results)))
+        print(f"Builds are in {explorer.root}")
+    return 0 if any(result["runtime"] is not None for result in results) else 1
+
+
+def cli_exit_status(returncode, timed_out=False):
+    """Map a build's return code to an exit status, the way timeout(1) and the shells report stopped commands"""
+    if timed_out:
+        return CLI_EXIT_TIMEOUT
+    if returncode is None or returncode == -1:
+        # -1 is Compyler's own marker for a build that failed or was cancelled before Nuitka returned
+        return 1
+    if returncode < 0:
+        return 128 - returncode
+    return returncode
+
+
+def run_cli(argv):
+    """Run the headless command line interface, returns the process exit code"""
+    # Everything after '--' goes to Nuitka unchanged
+    extra = []
+    if "--" in argv:
+        index = argv.index("--")
+        argv, extra = argv[:index], argv[index + 1:]
+
+    args = create_cli_parser().parse_args(argv)
+    build_cache = BuildCache()
+
+    if args.command == "cache":
+        if args.action == "list":
+            for line in build_cache.describe():
+                print(line)
+        else:
+            limit = args.size * 1024 * 1024 if args.size is not None else None
+            evicted = build_cache.clear() if args.action == "clear" else build_cache.prune(limit)
+            freed = sum(entry.get("size", 0) for entry in evicted)
+            print(f"Evicted {len(evicted)} cache entries, freed {format_size(freed)}")
+        return 0
+
+    if args.command == "scan":
+        if not os.path.isfile(args.script):
+            print(f"Error: the file {args.script} does not exist", file=sys.stderr)
+            return 2
+        graph = ImportGraph(args.script).scan()
+        if args.format == "json":
+            print(json.dumps(graph.to_dict(), indent=2))
+        else:
+            print("\n".join(graph.describe(args.top)))
+        return 0
+
+    if args.command == "deps":
+        dependency_cache = DependencyCache()
+        if args.action == "list":
+            lines = dependency_cache.describe()
+        elif args.action == "verify":
+            lines = dependency_cache.verify()
+        elif args.action == "evict" and not args.package:
+            print("Error: 'deps evict' needs a package name or key prefix", file=sys.stderr)
+            return 2
+        else:
+            evicted = dependency_cache.clear() if args.action == "clear" else dependency_cache.evict(args.package)
+            lines = [f"Evicted {len(evicted)} dependency cache entries"]
+        for line in lines:
+            print(line)
+        return 0
+
+    if args.command == "incremental":
+        if args.action == "list":
+            for line in IncrementalBuild.describe_all():
+                print(line)
+        else:
+            print(f"Removed {IncrementalBuild.clear_all()} incremental build directories")
+        return 0
+
+    if args.command == "onefile-cache":
+        if args.action == "list":
+            for line in OnefileCache.describe_all():
+                print(line)
+        else:
+            print(f"Removed the cached extractions of {OnefileCache.clear_all()} programs")
+        return 0
+
+    if args.command == "farm-worker":
+        host, port = parse_address(args.bind)
+        worker = FarmWorker(host, port, args.slots, args.compiler, args.token)
+        if host not in ("127.0.0.1", "localhost", "::1") and not args.token:
+            print("Warning: listening on the network without a token, anyone can use this worker",
+                  file=sys.stderr)
+        print(f"Build farm worker listening on {worker.address} with {worker.slots} slots ({worker.version})",
+              flush=True)
+        try:
+            worker.serve()
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if args.cache_limit is not None:
+        build_cache.max_size = max(0, args.cache_limit) * 1024 * 1024
+
+    settings = build_settings_from_args(args, extra)
+
+    if args.command == "watch":
+        if not os.path.isfile(args.script):
+            print(f"Error: the file {args.script} does not exist", file=sys.stderr)
+            return 2
+        return watch_script(args.script, settings, args.use_cache, CliReporter(args.format), build_cache,
+                            timeout=args.timeout, debounce=args.debounce)
+
+    if args.command == "explore":
+        return explore_script(args, settings, build_cache)
+
+    options = build_nuitka_options(settings)
+    env = build_nuitka_env(settings, find_compiler_cache())
+
+    for script in args.scripts:
+        if not os.path.isfile(script):
+            print(f"Error: the file {script} does not exist", file=sys.stderr)
+            return 2
+
+    reporter = CliReporter(args.format, prefix_names=len(args.scripts) > 1)
+
+    if settings["pgo_training"]:
+        # Every stage wants the whole machine, and the training runs must not compete either
+        for script in args.scripts:
+            try:
+                build = PgoBuild(script, options, settings["pgo_training"], env,
+                                 use_dependency_cache=args.dependency_cache, auto_jobs=args.jobs == "auto")
+            except ValueError as e:
+                print(f"Error: {str(e)}", file=sys.stderr)
+                return 2
+            try:
+                returncode = build.run(build_cache, get_nuitka_version(), on_output=reporter.output,
+                                       on_job_start=reporter.started, on_job_done=reporter.finished,
+                                       history=BuildHistory(), dependency_cache=DependencyCache())
+            except KeyboardInterrupt:
+                build.cancel()
+                return 130
+            if returncode:
+                return cli_exit_status(returncode, build.job is not None and build.job.timed_out)
+        return 0
+    jobs = [CompilationJob(script, options, args.use_cache, env, args.incremental,
+                           use_dependency_cache=args.dependency_cache, auto_jobs=args.jobs == "auto",
+                           farm_workers=settings["farm_workers"], timeout=args.timeout,
+                           benchmark_runs=settings["benchmark_runs"])
+            for script in args.scripts]
+
+    batch = BatchCompiler(
+        max_workers=args.workers,
+        total_jobs=None if args.jobs == "auto" else args.jobs,
+        build_cache=build_cache,
+        on_output=reporter.output,
+        on_job_done=reporter.finished,
+        history=BuildHistory(),
+        dependency_cache=DependencyCache()
+    )
+    for job in jobs:
+        reporter.started(job)
+        batch.add(job)
+
+    try:
+        batch.start()
+        # Join with a timeout so Ctrl+C is still delivered
+        while batch.is_running():
+            time.sleep(0.2)
+    except KeyboardInterrupt:
+        batch.cancel()
+        batch.wait()
+        return 130
+
+    # Exit with Nuitka's return code, the first failure wins for batches
+    for job in jobs:
+        if job.returncode:
+            return cli_exit_status(job.returncode, job.timed_out)
+    return 0 if all(job.returncode == 0 for job in jobs) else 1
+
+
 # Main function to run the application
-def main():
+def run_gui():
+    load_tkinter()
     try:
         root = tk.Tk()
         app = NuitkaCompilerApp(root)
@@ -1985,5 +8696,17 @@ def main():
     except Exception as e:
         messagebox.showerror("Application Error", f"An unexpected error occurred:\n{str(e)}")
 
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    # Without a command, or with 'gui', start the graphical interface
+    if not argv or argv[0] == "gui":
+        run_gui()
+    elif argv[0] == "farm-cc":
+        # Called by Nuitka in place of the C compiler, the arguments are the compiler's
+        sys.exit(farm_compile(argv[1:]))
+    else:
+        sys.exit(run_cli(argv))
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,81 @@
+import itertools
+
+import pytest
+
+import compyler
+
+KB = 1024
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A clock that moves one second per call, so every store and restore has its own time"""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(compyler.time, "time", lambda: float(next(ticks)))
+
+
+@pytest.fixture
+def project(tmp_path):
+    script = tmp_path / "app.py"
+    script.write_text("print('hello')\n")
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    return script, output_dir
+
+
+def store(cache, project, key, size):
+    script, output_dir = project
+    (output_dir / "app.bin").write_bytes(b"x" * size)
+    return cache.store(key, str(script), str(output_dir), [])
+
+
+def cached_keys(cache):
+    return [entry["key"] for entry in cache.entries()]
+
+
+def test_store_evicts_least_recently_used(tmp_path, project, clock):
+    cache = compyler.BuildCache(str(tmp_path / "cache"), max_size=3 * KB)
+    store(cache, project, "a" * 64, KB)
+    store(cache, project, "b" * 64, KB)
+    store(cache, project, "c" * 64, KB)
+    
+    # Restoring a makes b the least recently used
+    assert cache.restore("a" * 64, str(tmp_path / "restored")) == ["app.bin"]
+    store(cache, project, "d" * 64, KB)
+    
+    assert cached_keys(cache) == ["d" * 64, "a" * 64, "c" * 64]
+
+
+def test_store_keeps_the_entry_just_stored(tmp_path, project, clock):
+    cache = compyler.BuildCache(str(tmp_path / "cache"), max_size=3 * KB)
+    store(cache, project, "a" * 64, KB)
+    
+    # Larger than the whole limit on its own, everything else goes instead
+    entry = store(cache, project, "b" * 64, 4 * KB)
+    assert entry["key"] == "b" * 64
+    assert cached_keys(cache) == ["b" * 64]
+    assert cache.lookup("b" * 64) is not None
+
+
+@pytest.mark.parametrize("first, second", [("a" * 64, "b" * 64), ("b" * 64, "a" * 64)], ids=["a-then-b", "b-then-a"])
+def test_store_keeps_the_entry_just_stored_on_a_tie(tmp_path, project, monkeypatch, first, second):
+    # Entries stored within the same second share their last use time, whatever order the directory lists them in
+    monkeypatch.setattr(compyler.time, "time", lambda: 1000.0)
+    cache = compyler.BuildCache(str(tmp_path / "cache"), max_size=KB)
+    store(cache, project, first, KB)
+    store(cache, project, second, KB)
+    
+    assert cached_keys(cache) == [second]
+
+
+def test_prune_and_clear(tmp_path, project, clock):
+    cache = compyler.BuildCache(str(tmp_path / "cache"), max_size=10 * KB)
+    store(cache, project, "a" * 64, KB)
+    store(cache, project, "b" * 64, KB)
+    
+    evicted = cache.prune(max_size=KB)
+    assert [entry["key"] for entry in evicted] == ["a" * 64]
+    assert cached_keys(cache) == ["b" * 64]
+    
+    cache.clear()
+    assert cached_keys(cache) == []
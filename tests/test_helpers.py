@@ -0,0 +1,97 @@
+import signal
+
+import pytest
+
+import compyler
+
+GB = 1024 ** 3
+MB = 1024 ** 2
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("5G", 5 * GB),
+    ("500M", 500 * MB),
+    ("1.5 GB", int(1.5 * GB)),
+    ("2GiB", 2 * GB),
+    ("64k", 64 * 1024),
+    ("100", 100),
+    (" 3 T ", 3 * 1024 ** 4),
+])
+def test_parse_size(text, expected):
+    assert compyler.parse_size(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "G", "five", "1.2.3G", "5X", "-1G"])
+def test_parse_size_invalid(text):
+    assert compyler.parse_size(text) is None
+
+
+def test_choose_jobs_limited_by_cores():
+    jobs, reason = compyler.choose_jobs(cpus=4, memory=(64 * GB, 32 * GB))
+    assert jobs == 4
+    assert "assumed" in reason
+
+
+def test_choose_jobs_limited_by_memory():
+    # One gigabyte stays reserved, the rest is split by the memory of a job
+    available = compyler.JOBS_MEMORY_RESERVE + 3 * compyler.DEFAULT_JOB_MEMORY
+    jobs, _ = compyler.choose_jobs(cpus=16, memory=(16 * GB, available))
+    assert jobs == 3
+
+
+def test_choose_jobs_lto_and_measured_memory():
+    available = compyler.JOBS_MEMORY_RESERVE + 4 * compyler.LTO_JOB_MEMORY
+    assert compyler.choose_jobs(lto=True, cpus=16, memory=(32 * GB, available))[0] == 4
+    
+    jobs, reason = compyler.choose_jobs(job_memory=2 * GB, cpus=16, memory=(32 * GB, compyler.JOBS_MEMORY_RESERVE + 5 * GB))
+    assert jobs == 2
+    assert "measured" in reason
+
+
+def test_choose_jobs_never_below_one():
+    assert compyler.choose_jobs(cpus=8, memory=(4 * GB, 100 * MB))[0] == 1
+
+
+def test_choose_jobs_memory_unknown():
+    jobs, reason = compyler.choose_jobs(cpus=6, memory=(None, None))
+    assert jobs == 6
+    assert "unknown" in reason
+
+
+def test_split_compile_args():
+    args = ["-c", "-O2", "-Iinclude", "-D", "NDEBUG", "-std=c11", "module.c", "-o", "module.o"]
+    preprocess, remote, source, output, language = compyler.split_compile_args(args)
+    assert preprocess == ["-O2", "-Iinclude", "-D", "NDEBUG", "-std=c11"]
+    assert remote == ["-O2", "-std=c11"]
+    assert (source, output, language) == ("module.c", "module.o", "c")
+
+
+def test_split_compile_args_default_output():
+    result = compyler.split_compile_args(["-c", "src/unit.cpp"])
+    assert result == ([], [], "src/unit.cpp", "unit.o", "c++")
+
+
+@pytest.mark.parametrize("args", [
+    ["module.c", "-o", "module"],  # links, no -c
+    ["-c", "a.c", "b.c"],  # more than one unit
+    ["-c", "module.s"],  # not C or C++
+    ["-c", "module.c", "-o"],  # missing output
+    ["-c", "module.c", "-MD"],  # unknown option
+    ["-c", "-fprofile-generate", "module.c"],  # profiling writes files locally
+])
+def test_split_compile_args_local_only(args):
+    assert compyler.split_compile_args(args) is None
+
+
+@pytest.mark.parametrize("returncode, timed_out, expected", [
+    (0, False, 0),
+    (2, False, 2),
+    (None, False, 1),
+    (-1, False, 1),
+    (-signal.SIGTERM, False, 128 + signal.SIGTERM),
+    (-signal.SIGKILL, False, 128 + signal.SIGKILL),
+    (-signal.SIGKILL, True, compyler.CLI_EXIT_TIMEOUT),
+    (None, True, 124),
+])
+def test_cli_exit_status(returncode, timed_out, expected):
+    assert compyler.cli_exit_status(returncode, timed_out) == expected
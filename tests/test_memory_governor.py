@@ -0,0 +1,104 @@
+import signal
+
+import pytest
+
+import compyler
+
+GB = 1024 ** 3
+MB = 1024 ** 2
+
+
+def cc1(pid, started):
+    return compyler.ProcessInfo(pid, "cc1", 100 * MB, 0.0, started)
+
+
+@pytest.fixture
+def system(monkeypatch):
+    """Fake memory readings, process tree and signals for a governor watching pid 1"""
+    state = {"available": 4 * GB, "processes": [], "signals": []}
+    monkeypatch.setattr(compyler, "get_memory_info", lambda: (8 * GB, state["available"]))
+    monkeypatch.setattr(compyler, "list_process_tree", lambda pid: list(state["processes"]))
+    monkeypatch.setattr(compyler.os, "kill", lambda pid, sig: state["signals"].append((pid, sig)))
+    return state
+
+
+def make_governor():
+    return compyler.MemoryGovernor(1, job_memory=1 * GB)
+
+
+def test_holds_back_new_compiles_but_keeps_one_running(system):
+    governor = make_governor()
+    system["processes"] = [cc1(11, 1.0), cc1(12, 2.0), cc1(13, 3.0)]
+    system["available"] = 300 * MB
+    governor.poll()
+    
+    assert system["signals"] == [(13, signal.SIGSTOP), (12, signal.SIGSTOP)]
+    assert [p.pid for p in governor.held] == [13, 12]
+    assert governor.pauses == 2
+
+
+def test_compiles_already_running_are_not_held(system):
+    governor = make_governor()
+    system["processes"] = [cc1(11, 1.0), cc1(12, 2.0)]
+    governor.poll()
+    system["available"] = 300 * MB
+    governor.poll()
+    
+    assert system["signals"] == []
+
+
+def test_releases_held_compile_when_nothing_else_runs(system):
+    governor = make_governor()
+    system["processes"] = [cc1(11, 1.0), cc1(12, 2.0), cc1(13, 3.0)]
+    system["available"] = 300 * MB
+    governor.poll()
+    system["signals"].clear()
+    
+    # The running compile finished, memory sits between the watermarks
+    system["processes"] = [cc1(12, 2.0), cc1(13, 3.0)]
+    system["available"] = 600 * MB
+    assert governor.low_watermark < system["available"] < governor.high_watermark
+    governor.poll()
+    assert system["signals"] == [(12, signal.SIGCONT)]
+    
+    # The released one is running, the other stays held until it finishes
+    governor.poll()
+    assert system["signals"] == [(12, signal.SIGCONT)]
+    system["processes"] = [cc1(13, 3.0)]
+    governor.poll()
+    assert system["signals"] == [(12, signal.SIGCONT), (13, signal.SIGCONT)]
+    assert governor.held == []
+
+
+def test_releases_oldest_held_compile_once_memory_recovers(system):
+    governor = make_governor()
+    system["processes"] = [cc1(11, 1.0), cc1(12, 2.0), cc1(13, 3.0)]
+    system["available"] = 300 * MB
+    governor.poll()
+    system["signals"].clear()
+    
+    system["available"] = 4 * GB
+    governor.poll()
+    assert system["signals"] == [(12, signal.SIGCONT)]
+
+
+def test_kills_newest_compile_below_critical_watermark(system):
+    governor = make_governor()
+    system["processes"] = [cc1(11, 1.0), cc1(12, 2.0)]
+    governor.poll()
+    system["available"] = 100 * MB
+    governor.poll()
+    
+    assert system["signals"] == [(12, signal.SIGKILL)]
+    assert governor.kills == 1
+
+
+def test_stop_releases_everything_held(system):
+    governor = make_governor()
+    system["processes"] = [cc1(11, 1.0), cc1(12, 2.0), cc1(13, 3.0)]
+    system["available"] = 300 * MB
+    governor.poll()
+    system["signals"].clear()
+    
+    governor.stop()
+    assert sorted(system["signals"]) == [(12, signal.SIGCONT), (13, signal.SIGCONT)]